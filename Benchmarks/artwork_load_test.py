@@ -0,0 +1,147 @@
+# ----------------------------------
+#      File Name: artwork_load_test.py
+#           Date: 10/19/26
+#    Description: Load test of the Epic artwork path against 'mock_giant_bomb.py', one run per fault profile.
+#                 The launcher's own pieces do the work, wired the way 'Main_Window' wires them: 'Tile_Prefetcher'
+#                 schedules the tiles as the Epic row would, 'Art_Resolver' races the art sources within the art
+#                 budget ('Giant_Bomb_Source' and/or 'Http_Source', pointed at the stand-in server), and
+#                 'process_game_photo' plus 'encode_tile' make the tiles.
+#                 The dashboard itself never waits on art (tiles get it when it arrives), so what is reported is:
+#                 1. first screen: time until the tiles in view at start up have their art or show their
+#                    placeholder (the dashboard's time to interactive with art).
+#                 2. all tiles:    time until every tile is resolved while the row is scrolled one screen at a
+#                    time, each time the screen in view is resolved.
+#                 3. how many tiles got art and how many were left with a placeholder once the retries of
+#                    rate limited or failed requests were over, with what the server did.
+#                 Usage (from the project folder):
+#                   python Benchmarks/artwork_load_test.py [--games 500] [--profiles fast,slow,...] [--workers 2]
+#                                                          [--sources giant_bomb|http|both] [--budget-ms 3000]
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import argparse                                                     # For parsing the command line
+import logging                                                      # For keeping the launcher's warnings short
+import os                                                           # For interacting with the current operating sys
+import sys                                                          # For importing the launcher modules
+import threading                                                    # For waiting on the prefetcher
+import time                                                         # For timing the runs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Main_Window.Art_Resolver import Art_Resolver, Giant_Bomb_Source, Http_Source
+from Main_Window.Class_Dependencies import process_game_photo
+from Main_Window.Game_Library import Game_Record
+from Main_Window.Tile_Prefetcher import Tile_Prefetcher
+from Main_Window.Tile_Store import encode_tile
+from mock_giant_bomb import Mock_Giant_Bomb, PROFILES
+
+SCREEN_TILES = 4 # Tiles in view in a 1325 pixel wide window
+SOURCES = ('giant_bomb', 'http', 'both')
+#
+# ------------------------------------------------------------------------------
+# One load test of 'games' Epic titles against a server running 'profile'.
+
+# The art sources of the launcher pointed at 'mock': its search API and/or its image URLs.
+def mock_sources(mock, sources):
+    images = mock.url[:-len('/api')] + '/images/{title}.jpg'
+    return {
+        'giant_bomb': [Giant_Bomb_Source(None, mock.url)],
+        'http': [Http_Source(images)],
+        'both': [Http_Source(images), Giant_Bomb_Source(None, mock.url)]
+    }[sources]
+
+def run_profile(profile, games, workers, screen_timeout, sources='giant_bomb', budget_ms=3000):
+    mock = Mock_Giant_Bomb(profile, seed=1).start()
+    resolver = Art_Resolver(mock_sources(mock, sources), budget_ms=budget_ms)
+    records = {}
+    for number in range(games):
+        record = Game_Record(f"epic:Game{number:04d}", 'Epic Games', {'name': f"Game {number:04d}", 'app_name': f"Game{number:04d}"})
+        records[record.key] = record
+    keys = list(records)
+    prepared = set()
+    condition = threading.Condition()
+
+    def prepare(key): # 'Main_Window.prepare_tile_art'
+        image = resolver.resolve(records[key]) # Raises 'Art_Unavailable' when the prefetcher should try again later
+        if image is None:
+            return None # Placeholder, like the dashboard
+        return encode_tile(process_game_photo(image))
+
+    def on_prepared(key, data, size):
+        with condition:
+            prepared.add(key)
+            condition.notify_all()
+
+    prefetcher = Tile_Prefetcher(prepare, on_prepared, lambda key: key in prepared, workers=workers)
+
+    # A tile is resolved once it has its art or shows its placeholder, for good ('failed') or until a retry.
+    def resolved(screen):
+        with prefetcher.condition:
+            return all(key in prepared or key in prefetcher.failed or key in prefetcher.retrying for key in screen)
+
+    def wait_until(condition_met, timeout):
+        deadline = time.monotonic() + timeout
+        with condition:
+            while not condition_met():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                condition.wait(min(remaining, 0.05)) # Failures and retries don't notify, poll for them
+        return True
+
+    start = time.perf_counter()
+    prefetcher.update_row('epic', keys, 0, SCREEN_TILES)
+    timed_out = not wait_until(lambda: resolved(keys[:SCREEN_TILES]), screen_timeout)
+    first_screen = time.perf_counter() - start
+
+    for first in range(SCREEN_TILES, games, SCREEN_TILES): # Scroll one screen once the current one is resolved
+        last = min(first + SCREEN_TILES, games)
+        prefetcher.update_row('epic', keys, first, last)
+        timed_out = not wait_until(lambda: resolved(keys[first:last]), screen_timeout) or timed_out
+    all_tiles = time.perf_counter() - start
+
+    # Let the retries of the unavailable tiles finish, what is still without art then keeps its placeholder
+    settled = wait_until(lambda: not any(prefetcher.stats()[name] for name in ('retrying', 'pending', 'in_flight')),
+                         screen_timeout)
+    stats = prefetcher.stats()
+    prefetcher.stop()
+    resolver.stop()
+    mock.stop()
+    return {
+        'profile': profile,
+        'first_screen': first_screen,
+        'all_tiles': all_tiles,
+        'art': len(prepared),
+        'placeholder': games - len(prepared),
+        'retried': stats['retried'],
+        'timed_out': timed_out or not settled,
+        'server': mock.stats()
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Artwork load test against the Giant Bomb stand-in")
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--profiles", default=",".join(PROFILES), help="comma separated profiles of 'mock_giant_bomb.py'")
+    parser.add_argument("--workers", type=int, default=2, help="prefetcher workers (the launcher uses 2)")
+    parser.add_argument("--screen-timeout", type=float, default=60, help="seconds to wait for one screen of tiles")
+    parser.add_argument("--sources", choices=SOURCES, default='giant_bomb',
+                        help="art sources pointed at the stand-in: its search API, its image URLs or both")
+    parser.add_argument("--budget-ms", type=int, default=3000, help="art budget per game (the launcher's 'art_budget_ms')")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR) # The launcher logs every failed cover as a warning
+
+    print(f"{args.games} Epic titles, {args.workers} workers, {SCREEN_TILES} tiles per screen, "
+          f"'{args.sources}' sources, {args.budget_ms} ms art budget")
+    print(f"{'profile':<13} | {'first screen s':>14} | {'all tiles s':>11} | {'art':>5} | {'placeholder':>11} | "
+          f"{'retried':>7} | server")
+    print("-" * 120)
+    for profile in args.profiles.split(','):
+        result = run_profile(profile, args.games, args.workers, args.screen_timeout, args.sources, args.budget_ms)
+        server = result['server']
+        print(f"{profile:<13} | {result['first_screen']:>14.2f} | {result['all_tiles']:>11.2f} | {result['art']:>5} | "
+              f"{result['placeholder']:>11} | {result['retried']:>7} | {server['searches']} searches, {server['images']} images, "
+              f"{server['errors']} x 500, {server['rate_limited']} x 429, {server['misses']} misses, "
+              f"{server['truncated']} truncated" + ("  (timed out)" if result['timed_out'] else ""))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# ----------------------------------
+#      File Name: launch_warmup_benchmark.py
+#           Date: 10/19/26
+#    Description: Compares a cold and a warm start of a stand-in game, to see what 'Launch_Warmup' buys.
+#                 The stand-in is a folder with an 'executable' and a few large asset archives; starting it runs a
+#                 child process that reads the executable and then every archive, like a game loading its data.
+#                 1. cold:      the files are dropped from the page cache, then the game is started.
+#                 2. on launch: dropped, then the warm up and the game are started together (clicking Play).
+#                 3. hover:     dropped, warmed, and started 'lead' seconds later (resting on the tile first).
+#                 Dropping files from the cache needs 'posix_fadvise' (Linux). Elsewhere 'cold' is only cold for
+#                 a folder that was not read since the last reboot, point '--folder' at one.
+#                 Usage (from the project folder):
+#                   python Benchmarks/launch_warmup_benchmark.py [--folder PATH] [--size-mb 768] [--runs 5] [--lead 1.5]
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import argparse                                                     # For parsing the command line
+import os                                                           # For interacting with the current operating sys
+import shutil                                                       # For removing the stand-in game
+import statistics                                                   # For the medians
+import subprocess                                                   # For starting the stand-in game
+import sys                                                          # For importing the launcher modules
+import tempfile                                                     # For the stand-in game's folder
+import time                                                         # For timing the starts
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Main_Window.Launch_Warmup import Launch_Warmup, warmup_files
+
+ARCHIVES = 3 # Asset archives besides the executable
+LOAD_SCRIPT = """
+import sys
+for path in sys.argv[1:]:
+    with open(path, 'rb', buffering=0) as file:
+        while file.read(1024 * 1024):
+            pass
+"""
+#
+# ------------------------------------------------------------------------------
+# Write the stand-in game: 'game.exe' (a sixth of the size) and 'data<N>.pak' archives sharing the rest.
+
+def make_game(folder, size_mb):
+    chunk = os.urandom(1024 * 1024)
+    executable = os.path.join(folder, "game.exe")
+    sizes = [size_mb // 6] + [(size_mb - size_mb // 6) // ARCHIVES] * ARCHIVES
+    names = [executable] + [os.path.join(folder, "data", f"data{number}.pak") for number in range(ARCHIVES)]
+    os.makedirs(os.path.join(folder, "data"), exist_ok=True)
+    for name, size in zip(names, sizes):
+        if os.path.isfile(name) and os.path.getsize(name) == size * len(chunk):
+            continue
+        with open(name, 'wb') as file:
+            for _ in range(size):
+                file.write(chunk)
+    return executable
+
+# Drop a game's files from the page cache. Returns False when the platform can't.
+def drop_from_cache(files):
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    for path in files:
+        with open(path, 'rb') as file:
+            os.fsync(file.fileno()) # Dirty pages are not dropped
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return True
+
+def start_game(files):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", LOAD_SCRIPT, *files], check=True)
+    return time.perf_counter() - start
+
+def run(scenario, folder, executable, files, lead):
+    drop_from_cache(files)
+    if scenario == "cold":
+        return start_game(files)
+    warmup = Launch_Warmup(warm_for=0)
+    try:
+        warmup.request(scenario, folder, executable)
+        if scenario == "hover":
+            time.sleep(lead)
+        return start_game(files)
+    finally:
+        warmup.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold vs warm start of a stand-in game")
+    parser.add_argument("--folder", help="game folder to use instead of a generated stand-in")
+    parser.add_argument("--executable", help="executable inside '--folder'")
+    parser.add_argument("--size-mb", type=int, default=768, help="size of the generated stand-in")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--lead", type=float, default=1.5, help="seconds between the hover and the click")
+    args = parser.parse_args()
+
+    scratch = None
+    if args.folder:
+        folder, executable = args.folder, args.executable
+    else:
+        scratch = tempfile.mkdtemp(prefix="warmup_benchmark_", dir=os.path.dirname(os.path.abspath(__file__)))
+        folder = scratch
+        executable = make_game(folder, args.size_mb)
+    try:
+        files = warmup_files(folder, executable)
+        total_mb = sum(os.path.getsize(path) for path in files) / 2**20
+        if not drop_from_cache(files):
+            print("This platform can't drop files from the page cache, 'cold' is only cold after a reboot.")
+        print(f"Stand-in game: {len(files)} files, {total_mb:.0f} MB in '{folder}'")
+        print(f"{'scenario':<10} | {'median s':>8} | {'min s':>6} | {'MB/s':>7}")
+        print("-" * 41)
+        for scenario in ("cold", "on launch", "hover"):
+            timings = [run(scenario, folder, executable, files, args.lead) for _ in range(args.runs)]
+            median = statistics.median(timings)
+            print(f"{scenario:<10} | {median:>8.3f} | {min(timings):>6.3f} | {total_mb / median:>7.0f}")
+    finally:
+        if scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+# ----------------------------------
+#      File Name: mock_giant_bomb.py
+#           Date: 10/19/26
+#    Description: Local stand-in for the two Giant Bomb endpoints the launcher uses, for offline and load tests.
+#                 1. 'GET /api/search?query=<title>' answers with one game result whose 'image.medium_url' points
+#                    back at this server.
+#                 2. 'GET /images/<title>.jpg' answers with a generated JPEG cover (the same one for a title).
+#                 Every answer goes through the active profile: added latency (plus jitter), a share of HTTP 500
+#                 errors, a request rate above which HTTP 429 is returned, a share of searches with no result,
+#                 a share of truncated JPEGs and the cover size (which sets the payload size).
+#                 Usage (from the project folder):
+#                   python Benchmarks/mock_giant_bomb.py [--profile slow] [--port 8765]
+#                   set GIANT_BOMB_URL=http://127.0.0.1:8765/api and start the launcher
+#                 'Benchmarks/artwork_load_test.py' runs the launcher's artwork pipeline against every profile.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import argparse                                                     # For parsing the command line
+import json                                                         # For the search answers
+import random                                                       # For latency jitter and fault injection
+import threading                                                    # For the server thread and the counters
+import time                                                         # For time-related functions
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer # For the HTTP server
+from io import BytesIO                                              # For encoding the covers in memory
+from urllib.parse import urlparse, parse_qs, quote, unquote         # For the request paths
+from PIL import Image, ImageDraw                                    # For the generated covers
+
+# Fault and latency profiles. Every value missing from a profile takes its value from 'fast'.
+PROFILES = {
+    'fast': {'latency_ms': 20, 'jitter_ms': 10, 'error_rate': 0.0, 'rate_limit': 0, 'miss_rate': 0.0,
+             'truncate_rate': 0.0, 'image_size': (600, 900)},
+    'slow': {'latency_ms': 2000, 'jitter_ms': 500},
+    'flaky': {'latency_ms': 80, 'jitter_ms': 60, 'error_rate': 0.15},
+    'rate_limited': {'rate_limit': 10}, # Requests per second, the rest get 429
+    'truncated': {'truncate_rate': 0.2},
+    'sparse': {'miss_rate': 0.4}, # Many titles Giant Bomb doesn't know
+    'large': {'image_size': (2000, 3000)}
+}
+
+def profile_settings(name):
+    settings = dict(PROFILES['fast'])
+    settings.update(PROFILES[name])
+    return settings
+#
+# ------------------------------------------------------------------------------
+# A cover for 'title': a gradient with a few shapes, seeded by the title so it is the same on every request.
+
+def make_cover(title, size):
+    rng = random.Random(title)
+    width, height = size
+    image = Image.linear_gradient('L').resize(size).convert('RGB')
+    image = Image.merge('RGB', [channel.point(lambda value, shift=rng.randint(0, 255): (value + shift) % 256) for channel in image.split()])
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        x, y = rng.randint(0, width), rng.randint(0, height)
+        radius = rng.randint(width // 20, width // 4)
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=tuple(rng.randint(0, 255) for _ in range(3)))
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+#
+# ------------------------------------------------------------------------------
+# Mock Giant Bomb Class. Serves on a background thread, 'url' is the API root to hand to the launcher.
+
+class Mock_Giant_Bomb:
+    def __init__(self, profile='fast', host='127.0.0.1', port=0, seed=None):
+        self.settings = profile_settings(profile)
+        self.profile = profile
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.covers = {} # title -> JPEG bytes
+        self.window_start = time.monotonic() # Start of the current one second rate limit window
+        self.window_requests = 0
+        self.counters = {'searches': 0, 'images': 0, 'errors': 0, 'rate_limited': 0, 'misses': 0, 'truncated': 0}
+        self.server = ThreadingHTTPServer((host, port), self.handler_class())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="Mock_Giant_Bomb", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counters, profile=self.profile)
+
+    def count(self, name):
+        with self.lock:
+            self.counters[name] += 1
+
+    # True when the request is over the profile's requests per second
+    def over_rate_limit(self):
+        limit = self.settings['rate_limit']
+        if not limit:
+            return False
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window_start >= 1:
+                self.window_start = now
+                self.window_requests = 0
+            self.window_requests += 1
+            return self.window_requests > limit
+
+    def chance(self, rate):
+        with self.lock:
+            return rate > 0 and self.random.random() < rate
+
+    def delay(self):
+        with self.lock:
+            jitter = self.random.uniform(-1, 1) * self.settings['jitter_ms']
+        time.sleep(max(self.settings['latency_ms'] + jitter, 0) / 1000)
+
+    def cover(self, title):
+        with self.lock:
+            data = self.covers.get(title)
+        if data is None:
+            data = make_cover(title, tuple(self.settings['image_size']))
+            with self.lock:
+                self.covers[title] = data
+        return data
+
+    def handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                mock.delay()
+                if mock.over_rate_limit():
+                    mock.count('rate_limited')
+                    return self.reply(429, b'{"error": "Rate limit exceeded"}', 'application/json', {'Retry-After': '1'})
+                if mock.chance(mock.settings['error_rate']):
+                    mock.count('errors')
+                    return self.reply(500, b'Internal Server Error', 'text/plain')
+
+                url = urlparse(self.path)
+                if url.path.rstrip('/') == '/api/search':
+                    return self.search(parse_qs(url.query).get('query', [''])[0])
+                if url.path.startswith('/images/') and url.path.endswith('.jpg'):
+                    return self.image(unquote(url.path[len('/images/'):-len('.jpg')]))
+                self.reply(404, b'Not Found', 'text/plain')
+
+            def search(self, title):
+                mock.count('searches')
+                results = []
+                if mock.chance(mock.settings['miss_rate']):
+                    mock.count('misses')
+                else:
+                    host, port = mock.server.server_address[:2]
+                    results.append({'name': title,
+                                    'image': {'medium_url': f"http://{host}:{port}/images/{quote(title)}.jpg"}})
+                body = {'error': 'OK', 'limit': 1, 'number_of_total_results': len(results), 'results': results}
+                self.reply(200, json.dumps(body).encode('utf-8'), 'application/json')
+
+            def image(self, title):
+                mock.count('images')
+                data = mock.cover(title)
+                if mock.chance(mock.settings['truncate_rate']):
+                    mock.count('truncated')
+                    data = data[:len(data) // 2] # Cut off mid scan, like a dropped download
+                self.reply(200, data, 'image/jpeg')
+
+            def reply(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args): # Quiet, a load test makes thousands of requests
+                pass
+
+        return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Giant Bomb stand-in")
+    parser.add_argument("--profile", choices=list(PROFILES), default="fast")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    mock = Mock_Giant_Bomb(args.profile, args.host, args.port).start()
+    print(f"Serving the '{args.profile}' profile at {mock.url} (set GIANT_BOMB_URL to it), Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(5)
+    except KeyboardInterrupt:
+        print(mock.stats())
+        mock.stop()
+
+if __name__ == '__main__':
+    main()
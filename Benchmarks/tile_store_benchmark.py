@@ -0,0 +1,162 @@
+# ----------------------------------
+#      File Name: tile_store_benchmark.py
+#           Date: 10/19/26
+#    Description: Compares holding every game tile as a decoded RGBA bitmap (how the dashboard used to keep them)
+#                 with the encoded 'Tile_Store' arena, for libraries of 100, 1,000 and 5,000 games.
+#                 Reports the resident memory each approach adds and how long it takes to get a tile ready
+#                 to draw (a 'PhotoImage' when a display is available, a decoded RGBA image otherwise).
+#                 Every measurement runs in its own process, so one run's freed memory can't hide the next one's.
+#                 Usage (from the project folder):
+#                   python Benchmarks/tile_store_benchmark.py [--sizes 100,1000,5000] [--format WEBP|PNG]
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import argparse                                                     # For parsing the command line
+import gc                                                           # For freeing one run before measuring the next
+import os                                                           # For interacting with the current operating sys
+import random                                                       # For the synthetic game art
+import statistics                                                   # For the latency percentiles
+import subprocess                                                   # For measuring each run in a fresh process
+import sys                                                          # For importing the launcher modules
+import time                                                         # For timing the decodes
+from io import BytesIO                                              # For decoding tiles in memory
+from PIL import Image, ImageDraw, ImageTk                           # For image processing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Main_Window.Class_Dependencies import add_blur_gradient, add_rounded_corners
+import Main_Window.Tile_Store as Tile_Store_Module
+from Main_Window.Tile_Store import Tile_Store, encode_tile
+
+SAMPLE_TILES = 24 # Distinct pieces of art, repeated to fill the library
+DECODE_SAMPLES = 200 # Tiles decoded per measurement
+#
+# ------------------------------------------------------------------------------
+# Resident set size of this process in bytes.
+
+def resident_bytes():
+    try:
+        import psutil                                               # Optional, works on every platform
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    with open('/proc/self/statm') as statm: # Linux
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+# A 600x900 stand in for a library capsule (gradient, shapes, text sized noise), processed like a real tile.
+def make_tile(seed):
+    rng = random.Random(seed)
+    art = Image.linear_gradient('L').resize((600, 900)).convert('RGB')
+    art = Image.merge('RGB', [channel.point(lambda value, shift=rng.randint(0, 255): (value + shift) % 256) for channel in art.split()])
+    draw = ImageDraw.Draw(art)
+    for _ in range(40):
+        x, y = rng.randint(0, 600), rng.randint(0, 900)
+        size = rng.randint(10, 200)
+        draw.ellipse((x, y, x + size, y + size), fill=tuple(rng.randint(0, 255) for _ in range(3)))
+    noise = Image.effect_noise((600, 120), 60).convert('RGB')
+    art.paste(noise, (0, rng.randint(0, 780)))
+
+    tile = art.resize((300, 450))
+    tile = add_blur_gradient(tile, 10, 0.2)
+    return add_rounded_corners(tile, 10)
+
+def percentile(values, share):
+    values = sorted(values)
+    return values[min(int(len(values) * share), len(values) - 1)]
+#
+# ------------------------------------------------------------------------------
+# One run of each approach for a library of 'count' games.
+
+def run_decoded(samples, count, to_photo):
+    gc.collect()
+    before = resident_bytes()
+    tiles = {}
+    for number in range(count):
+        image = samples[number % len(samples)].copy()
+        image.load()
+        tiles[number] = image
+    memory = resident_bytes() - before
+
+    timings = []
+    for number in range(min(count, DECODE_SAMPLES)):
+        start = time.perf_counter()
+        to_photo(tiles[number]) # Already decoded, only the 'PhotoImage' (if any) is made
+        timings.append(time.perf_counter() - start)
+    del tiles
+    return memory, timings
+
+def run_store(encoded_samples, count, to_photo):
+    gc.collect()
+    before = resident_bytes()
+    store = Tile_Store()
+    for number in range(count):
+        data, size = encoded_samples[number % len(encoded_samples)]
+        store.put(number, data, size)
+    memory = resident_bytes() - before
+
+    timings = []
+    for number in range(min(count, DECODE_SAMPLES)):
+        start = time.perf_counter()
+        image = Image.open(BytesIO(store.get(number)))
+        image.load()
+        to_photo(image)
+        timings.append(time.perf_counter() - start)
+    return memory, timings, len(store.arena)
+
+# Child process: measure one approach for one library size and print the result as one line.
+def measure(approach, count, tile_format):
+    Tile_Store_Module.tile_format = tile_format
+    to_photo, _ = photo_factory()
+    samples = [make_tile(seed) for seed in range(SAMPLE_TILES)]
+    if approach == "decoded":
+        memory, timings = run_decoded(samples, count, to_photo)
+        arena_bytes = 0
+    else:
+        memory, timings, arena_bytes = run_store([encode_tile(sample) for sample in samples], count, to_photo)
+    print(memory, statistics.median(timings), percentile(timings, 0.95), arena_bytes)
+
+# PhotoImages need a Tk root, fall back to timing the decode alone when there is no display.
+def photo_factory():
+    try:
+        import tkinter
+        root = tkinter.Tk()
+        root.withdraw()
+        return ImageTk.PhotoImage, "PhotoImage"
+    except Exception:
+        return (lambda image: image), "decoded RGBA (no display)"
+
+def main():
+    parser = argparse.ArgumentParser(description="Tile memory/decode latency benchmark")
+    parser.add_argument("--sizes", default="100,1000,5000", help="comma separated library sizes")
+    parser.add_argument("--format", choices=("WEBP", "PNG"), help="tile encoding (default: what the launcher uses)")
+    parser.add_argument("--measure", nargs=2, metavar=("APPROACH", "COUNT"), help=argparse.SUPPRESS) # Child process
+    args = parser.parse_args()
+    tile_format = args.format or Tile_Store_Module.get_tile_format()
+    if args.measure:
+        measure(args.measure[0], int(args.measure[1]), tile_format)
+        return
+
+    Tile_Store_Module.tile_format = tile_format
+    samples = [make_tile(seed) for seed in range(SAMPLE_TILES)]
+    start = time.perf_counter()
+    encoded_samples = [encode_tile(sample) for sample in samples]
+    encode_ms = (time.perf_counter() - start) * 1000 / len(samples)
+    average_bytes = sum(len(data) for data, _ in encoded_samples) / len(encoded_samples)
+    print(f"Tile format: {tile_format}, {average_bytes / 1024:.0f} KB per tile "
+          f"(RGBA: {300 * 450 * 4 / 1024:.0f} KB), encode {encode_ms:.1f} ms per tile")
+    print(f"Ready to draw = {photo_factory()[1]}")
+    print()
+    print(f"{'games':>6} | {'approach':<8} | {'resident MB':>11} | {'p50 ms':>7} | {'p95 ms':>7}")
+    print("-" * 52)
+
+    for count in args.sizes.split(','):
+        for approach in ("decoded", "arena"):
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--measure", approach, count, "--format", tile_format],
+                                    capture_output=True, text=True, check=True).stdout
+            memory, median, p95, arena_bytes = (float(value) for value in output.split())
+            line = f"{int(count):>6} | {approach:<8} | {memory / 2**20:>11.1f} | {median * 1000:>7.2f} | {p95 * 1000:>7.2f}"
+            if approach == "arena":
+                line += f"   (arena {arena_bytes / 2**20:.1f} MB)"
+            print(line)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+# ----------------------------------
+#      File Name: Art_Pack.py
+#           Date: 10/19/26
+#    Description: Offline art packs: a folder or '.zip' of covers imported once, in bulk, as ready to draw tiles.
+#                 1. Every image is named after what it is the cover of: a Steam app id ('4000.jpg'), an Epic
+#                    AppName ('Fortnite.png') or a game title ('Garry's Mod.webp', matched like the search box).
+#                 2. The importer processes the images into tiles (resize, blur, rounded corners, encode) on a
+#                    thread pool and writes them one after another into 'Cache/art_pack-<n>.bin', with an index
+#                    'Cache/art_pack.json' of name -> (offset, length, width, height).
+#                 3. The launcher loads the index once and memory maps the tiles. Whether a game has a cover in
+#                    the pack is a dict lookup, and its tile is a slice of the map: no file probing, no network
+#                    and no image processing per game.
+#                 Imported from the settings window or with 'driver.py import-art <folder or zip>'.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import json                                                         # For the pack index
+import logging                                                      # For the module logger
+import mmap                                                         # For mapping the tiles instead of reading them
+import os                                                           # For interacting with the current operating sys
+import threading                                                    # For guarding the map between workers
+import time                                                         # For naming each pack's tile file
+import zipfile                                                      # For importing zipped packs
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait # For processing the images in parallel
+from .Search_Index import normalize_title                           # Same title matching as the search box
+from .Tile_Store import encode_tile                                 # Same encoding as the image cache
+
+log = logging.getLogger(__name__)
+
+INDEX_NAME = 'art_pack.json'
+PACK_VERSION = 1
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.bmp')
+MIN_COVER_SIZE = (100, 150) # Smaller images (icons, logos) are skipped
+TILE_SIZE = (300, 450) # What 'process_game_photo' resizes to
+#
+# ------------------------------------------------------------------------------
+# The names a game's cover may be filed under, most specific first.
+
+def pack_names(record):
+    names = []
+    if record.app_id:
+        names.append(str(record.app_id).lower())
+    if record.app_name:
+        names.append(record.app_name.lower())
+    names.append(normalize_title(record.name))
+    return names
+
+# Index name of an image file ex: 'covers/Garry's Mod.JPG' -> "garrys mod", '4000.jpg' -> "4000".
+def image_name(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return normalize_title(stem) or stem.lower()
+#
+# ------------------------------------------------------------------------------
+# Art Pack Class. The imported tiles, read only. 'get' is safe to call from the prefetcher's workers.
+
+class Art_Pack:
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self.entries = {} # name -> (offset, length, (width, height))
+        self.source = None # Folder or zip the pack was imported from
+        self.file = None
+        self.map = None
+        self.hits = 0
+        self.load()
+
+    def load(self):
+        self.close()
+        index_path = os.path.join(self.cache_dir, INDEX_NAME)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as file:
+                index = json.load(file)
+            if index.get('version') != PACK_VERSION:
+                return
+            tiles_path = os.path.join(self.cache_dir, index['tiles'])
+            tile_file = open(tiles_path, 'rb')
+        except (OSError, ValueError, KeyError) as error:
+            if not isinstance(error, FileNotFoundError):
+                log.warning("Could not load the art pack '%s': %s", index_path, error)
+            return
+        with self.lock:
+            self.file = tile_file
+            self.map = mmap.mmap(tile_file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(tile_file.fileno()).st_size else None
+            self.entries = {name: (offset, length, (width, height)) for name, (offset, length, width, height) in index['entries'].items()}
+            self.source = index.get('source')
+        remove_old_tile_files(self.cache_dir, index['tiles'])
+
+    def close(self):
+        with self.lock:
+            if self.map is not None:
+                self.map.close()
+            if self.file is not None:
+                self.file.close()
+            self.map = None
+            self.file = None
+            self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    # The pack name of a game's cover, or None. Dict lookups only.
+    def lookup(self, record):
+        for name in pack_names(record):
+            if name in self.entries:
+                return name
+        return None
+
+    # The encoded tile filed under 'name' as (bytes, (width, height)), or None.
+    def get(self, name):
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is None or self.map is None:
+                return None
+            offset, length, size = entry
+            self.hits += 1
+            return self.map[offset:offset + length], size
+
+    def stats(self):
+        with self.lock:
+            return {
+                "covers": len(self.entries),
+                "hits": self.hits,
+                "bytes": self.map.size() if self.map is not None else 0,
+                "source": self.source
+            }
+
+# Tile files of earlier imports, removed once nothing maps them (Windows can't remove a mapped file).
+def remove_old_tile_files(cache_dir, current):
+    for filename in os.listdir(cache_dir):
+        if filename.startswith('art_pack-') and filename.endswith('.bin') and filename != current:
+            try:
+                os.remove(os.path.join(cache_dir, filename))
+            except OSError:
+                pass # Still mapped by another launcher, removed next time
+#
+# ------------------------------------------------------------------------------
+# Image files of a folder (searched recursively) or a zip as (name, reader) pairs, 'reader()' returns the bytes.
+
+def pack_images(source):
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and info.filename.lower().endswith(IMAGE_EXTENSIONS):
+                    yield image_name(info.filename), lambda info=info: archive.read(info)
+        return
+    for folder, _, filenames in os.walk(source):
+        for filename in filenames:
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                path = os.path.join(folder, filename)
+                yield image_name(filename), lambda path=path: read_file(path)
+
+def read_file(path):
+    with open(path, 'rb') as file:
+        return file.read()
+
+# Worker: one image file into an encoded tile. Returns (bytes, (width, height)) or None for a broken/too small image.
+def make_pack_tile(data):
+    from io import BytesIO                                          # For opening the image in memory
+    from PIL import Image                                           # For opening the image
+    from .Class_Dependencies import process_game_photo              # Same processing as the dashboard's tiles
+    try:
+        image = Image.open(BytesIO(data))
+        image.draft('RGB', TILE_SIZE) # JPEGs are decoded at the smallest scale still at least tile sized
+        image.load()
+    except OSError:
+        return None
+    if image.width < MIN_COVER_SIZE[0] or image.height < MIN_COVER_SIZE[1]:
+        return None
+    return encode_tile(process_game_photo(image.convert('RGB')))
+#
+# ------------------------------------------------------------------------------
+# Import a folder or zip of covers into 'cache_dir', replacing the current pack.
+# Returns {'imported', 'skipped', 'duplicates', 'seconds'}. Raises OSError when 'source' can't be read.
+
+def import_art_pack(source, cache_dir, workers=None, on_progress=None):
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"'{source}' does not exist")
+    workers = workers or min(os.cpu_count() or 4, 8)
+    os.makedirs(cache_dir, exist_ok=True)
+    start = time.perf_counter()
+    tiles_name = f"art_pack-{time.time_ns()}.bin"
+    entries = {}
+    skipped = 0
+    duplicates = 0
+
+    with open(os.path.join(cache_dir, tiles_name), 'wb') as tiles, \
+         ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Art_Pack") as pool:
+        pending = {}
+        offset = 0
+
+        def collect(done):
+            nonlocal offset, skipped
+            for future in done:
+                name = pending.pop(future)
+                result = future.result()
+                if result is None:
+                    skipped += 1
+                    continue
+                data, (width, height) = result
+                tiles.write(data)
+                entries[name] = [offset, len(data), width, height]
+                offset += len(data)
+                if on_progress:
+                    on_progress(len(entries))
+
+        for name, read in pack_images(source):
+            if name in entries or name in pending.values():
+                duplicates += 1 # Same game twice ('4000.jpg' and '4000.png'), the first one is kept
+                continue
+            pending[pool.submit(make_pack_tile, read())] = name # Read here, zip members are read one at a time
+            if len(pending) >= workers * 4: # Bounded, a pack can be bigger than memory
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        collect(list(pending))
+
+    index = {'version': PACK_VERSION, 'source': os.path.abspath(source), 'tiles': tiles_name, 'entries': entries}
+    index_path = os.path.join(cache_dir, INDEX_NAME)
+    temp_path = index_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(index, file)
+    os.replace(temp_path, index_path) # The old index stays valid until this point
+    return {'imported': len(entries), 'skipped': skipped, 'duplicates': duplicates,
+            'seconds': time.perf_counter() - start}
@@ -0,0 +1,352 @@
+# ----------------------------------
+#      File Name: Art_Resolver.py
+#           Date: 10/19/26
+#    Description: Finds the cover art of a game by asking several sources, instead of exactly one per launcher.
+#                 1. Sources: Steam's own 'librarycache', a folder of the user's own art, Giant Bomb and any
+#                    HTTP provider given as a URL template (ex: the images of 'Benchmarks/mock_giant_bomb.py').
+#                 2. Hedged requests: the best ranked source is asked first. When it hasn't answered within the
+#                    time it usually takes (or answers with nothing) the next one is asked too, and so on. The first
+#                    acceptable image wins, sources not started yet are cancelled and late answers are dropped.
+#                 3. Every answer updates the source's latency (moving average) and hit rate. Sources are ranked
+#                    by expected time to an image (latency / hit rate), so the order adapts over time.
+#                 4. Nothing found within the latency budget gives None, the tile keeps its placeholder. When a
+#                    source could not answer (rate limited, server error, timeout) 'Art_Unavailable' is raised
+#                    instead, so the caller tries again later. A source that sent 'Retry-After' is left alone
+#                    until then.
+#                 Local sources (file reads) are asked first, inline, so they never queue behind a slow download.
+#                 The remote ones share a pool and their requests time out with the budget left, so a hung server
+#                 holds a worker no longer than one budget.
+#                 Called from the tile prefetcher's workers, never from the Tk thread.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import threading                                                    # For guarding the source statistics
+import time                                                         # For the latency budget
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED # For asking the sources in parallel
+from io import BytesIO                                              # For decoding downloaded images
+from urllib.parse import quote                                      # For the URL templates
+from .Class_Dependencies import (grab_epic_game_photo, get_http_session, request_timeout, check_transient,
+                                 Art_Unavailable, GIANT_BOMB_URL)
+from .Search_Index import normalize_title                           # Same title matching as the search box
+from .Steam_App_Info import steam_art_path                          # Steam's cached library capsule
+from .Tracing import span                                           # Timeline spans, no-ops unless tracing is on
+
+log = logging.getLogger(__name__)
+
+ART_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+MIN_ART_SIZE = (100, 150) # Smaller images (icons, logos) are not accepted as a cover
+LATENCY_SMOOTHING = 0.2 # Weight of the newest answer in the latency moving average
+MIN_HEDGE_MS = 20 # Never wait less than this before asking the next source
+#
+# ------------------------------------------------------------------------------
+# Art Source Class. Base of every source: 'supports' says whether it can know a game, 'fetch' returns a PIL image
+# or None, giving up at 'deadline' (a 'time.monotonic()' time) when it waits on the network. 'expected_ms' is the latency assumed
+# before the source has answered anything, 'local' sources only read files.
+
+class Art_Source:
+    name = "source"
+    expected_ms = 500
+    local = False
+
+    def supports(self, record):
+        return True
+
+    def fetch(self, record, deadline=None):
+        return None
+
+def open_image(path_or_bytes):
+    from PIL import Image                                           # For opening the art
+    image = Image.open(BytesIO(path_or_bytes) if isinstance(path_or_bytes, bytes) else path_or_bytes)
+    image.load() # Fail here on a truncated file, not in the tile pipeline
+    return image
+
+# Steam's 'appcache/librarycache' capsule, found by the scan ('Game_Record.art_path') or by its well known names.
+class Steam_Cache_Source(Art_Source):
+    name = "steam_cache"
+    expected_ms = 5
+    local = True
+
+    def __init__(self, steam_executable):
+        self.steam_executable = steam_executable
+
+    def supports(self, record):
+        return record.launcher == 'Steam'
+
+    def fetch(self, record, deadline=None):
+        path = record.art_path
+        if not path or not os.path.isfile(path): # Not found by the scan, or removed since
+            path = steam_art_path(self.steam_executable, record.app_id)
+        return open_image(path) if path else None
+
+# A folder of the user's own covers, named after the Steam app id, the Epic AppName or the game's title
+# ex: 'Art/4000.jpg', 'Art/Fortnite.png', 'Art/garrys mod.webp'. The listing is re-read when the folder changes.
+class Art_Folder_Source(Art_Source):
+    name = "art_folder"
+    expected_ms = 5
+    local = True
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.lock = threading.Lock()
+        self.listing_mtime = None
+        self.listing = {} # lower cased file name without extension -> path
+
+    def names(self, record):
+        return [name for name in (record.app_id, record.app_name, record.name, normalize_title(record.name)) if name]
+
+    def files(self):
+        try:
+            mtime = os.stat(self.folder).st_mtime_ns
+        except OSError:
+            return {}
+        with self.lock:
+            if mtime != self.listing_mtime:
+                listing = {}
+                for filename in os.listdir(self.folder):
+                    stem, extension = os.path.splitext(filename)
+                    if extension.lower() in ART_EXTENSIONS:
+                        listing.setdefault(stem.lower(), os.path.join(self.folder, filename))
+                self.listing, self.listing_mtime = listing, mtime
+            return self.listing
+
+    def supports(self, record):
+        return os.path.isdir(self.folder)
+
+    def fetch(self, record, deadline=None):
+        files = self.files()
+        for name in self.names(record):
+            path = files.get(str(name).lower())
+            if path is not None:
+                return open_image(path)
+        return None
+
+# The Giant Bomb search the Epic row has always used. Needs an API key unless pointed at a stand-in server.
+class Giant_Bomb_Source(Art_Source):
+    name = "giant_bomb"
+    expected_ms = 800
+
+    def __init__(self, api_key, base_url=GIANT_BOMB_URL):
+        self.api_key = api_key
+        self.base_url = base_url
+
+    def supports(self, record):
+        return bool(self.api_key) or self.base_url != GIANT_BOMB_URL
+
+    def fetch(self, record, deadline=None):
+        return grab_epic_game_photo(self.api_key, record.name, self.base_url, deadline)
+
+# Any HTTP provider serving an image per game. 'template' holds '{title}', '{app_id}' or '{app_name}'
+# ex: 'http://127.0.0.1:8765/images/{title}.jpg'. Games missing a field the template uses are skipped.
+class Http_Source(Art_Source):
+    expected_ms = 400
+    fields = ('title', 'app_id', 'app_name')
+
+    # Whether 'template' only uses the fields above, a typo would make every 'url' call raise.
+    @classmethod
+    def valid_template(cls, template):
+        try:
+            template.format(**{field: '' for field in cls.fields})
+        except (KeyError, IndexError, ValueError):
+            return False
+        return True
+
+    def __init__(self, template, name=None):
+        self.template = template
+        self.name = name or "http:" + (template.split('/')[2] if '://' in template else template)
+
+    def url(self, record):
+        fields = {'title': record.name, 'app_id': record.app_id, 'app_name': record.app_name}
+        for field, value in fields.items():
+            if '{' + field + '}' in self.template and not value:
+                return None
+        return self.template.format(**{field: quote(str(value or '')) for field, value in fields.items()})
+
+    def supports(self, record):
+        return self.url(record) is not None
+
+    def fetch(self, record, deadline=None):
+        import requests                                             # For the request exceptions
+        try:
+            response = get_http_session().get(self.url(record), timeout=request_timeout(deadline))
+        except requests.RequestException as request_error:
+            raise Art_Unavailable(f"'{self.name}' failed: {request_error}") from request_error
+        check_transient(response, f"'{self.name}'")
+        if response.status_code != 200:
+            return None
+        return open_image(response.content)
+#
+# ------------------------------------------------------------------------------
+# The launcher's sources from its settings. 'http_templates' is a comma separated list of URL templates.
+
+def default_art_sources(steam_executable, art_folder, api_key, giant_bomb_url, http_templates=""):
+    sources = [Steam_Cache_Source(steam_executable), Art_Folder_Source(art_folder)]
+    for template in (template.strip() for template in http_templates.split(',')):
+        if not template:
+            continue
+        if not Http_Source.valid_template(template):
+            log.warning("Ignoring the art URL template '%s': it may only use %s", template,
+                        ", ".join('{' + field + '}' for field in Http_Source.fields))
+            continue
+        sources.append(Http_Source(template))
+    sources.append(Giant_Bomb_Source(api_key, giant_bomb_url))
+    return sources
+#
+# ------------------------------------------------------------------------------
+# Art Resolver Class
+
+class Art_Resolver:
+    def __init__(self, sources, budget_ms=3000, workers=6):
+        self.sources = sources
+        names = set()
+        for number, source in enumerate(sources): # Statistics are kept by name, two providers on one host need two
+            if source.name in names:
+                source.name = f"{source.name}#{number}"
+            names.add(source.name)
+        self.budget_ms = budget_ms
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Art_Source")
+        self.lock = threading.Lock()
+        self.source_stats = {source.name: {'attempts': 0, 'hits': 0, 'misses': 0, 'errors': 0, 'unavailable': 0,
+                                           'wins': 0, 'cancelled': 0, 'latency_ms': float(source.expected_ms)}
+                             for source in sources}
+        self.backoff = {} # source name -> 'time.monotonic()' before which it is not asked (its 'Retry-After')
+        self.resolved = 0
+        self.unresolved = 0
+        self.unavailable = 0
+
+    # Expected time to an image: latency divided by the (smoothed) hit rate. Lower is asked first.
+    def expected_cost(self, source):
+        stats = self.source_stats[source.name]
+        hit_rate = (stats['hits'] + 1) / (stats['attempts'] + 2)
+        return stats['latency_ms'] / hit_rate
+
+    def ranked(self, record):
+        sources = [source for source in self.sources if source.supports(record)] # May touch the disk, not under the lock
+        with self.lock:
+            return sorted(sources, key=self.expected_cost)
+
+    # One source's answer for one game, with its statistics recorded: (image or None, 'Art_Unavailable' or None).
+    # Never raises.
+    def attempt(self, source, record, deadline):
+        start = time.perf_counter()
+        image = None
+        outcome = 'misses'
+        unavailable = None
+        try:
+            with span(f"art:{source.name}", "art", game=record.name):
+                image = source.fetch(record, deadline)
+        except Art_Unavailable as error: # Rate limited, server error, timeout: ask again later
+            log.debug("Art source '%s' unavailable for '%s': %s", source.name, record.name, error)
+            outcome, unavailable = 'unavailable', error
+        except Exception as fetch_error: # Missing file, broken image
+            log.debug("Art source '%s' failed for '%s': %s", source.name, record.name, fetch_error)
+            outcome = 'errors'
+        if image is not None and (image.width < MIN_ART_SIZE[0] or image.height < MIN_ART_SIZE[1]):
+            image = None # Too small to be a cover
+        elif image is not None:
+            outcome = 'hits'
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        with self.lock:
+            stats = self.source_stats[source.name]
+            stats['attempts'] += 1
+            stats[outcome] += 1
+            stats['latency_ms'] += (latency_ms - stats['latency_ms']) * LATENCY_SMOOTHING
+            if unavailable is not None and unavailable.retry_after:
+                self.backoff[source.name] = time.monotonic() + unavailable.retry_after
+        return image, unavailable
+
+    # How long to wait on a source before hedging with the next one.
+    def hedge_delay(self, source):
+        with self.lock:
+            return max(self.source_stats[source.name]['latency_ms'], MIN_HEDGE_MS) / 1000
+
+    # The first acceptable image of any source within the budget, or None when every source said it has none.
+    # Raises 'Art_Unavailable' when there is none yet but a source couldn't answer (try again after 'retry_after').
+    def resolve(self, record):
+        deadline = time.monotonic() + self.budget_ms / 1000
+        pending = {} # future -> source
+        next_source = 0
+        next_start = 0 # Time the next source is asked even if the ones asked so far are still busy
+        winner = None
+        retry_after = [] # Seconds until a source that couldn't answer may be asked again, None when it didn't say
+
+        with span("resolve_art", "art", game=record.name) as resolve_span:
+            ranked = self.ranked(record)
+            now = time.monotonic()
+            with self.lock:
+                resting = {source.name: self.backoff[source.name] - now for source in ranked
+                           if self.backoff.get(source.name, 0) > now}
+            retry_after += resting.values()
+            ranked = [source for source in ranked if source.name not in resting]
+
+            for source in (source for source in ranked if source.local): # Inline, a file read needs no hedging
+                if time.monotonic() >= deadline:
+                    break
+                image, unavailable = self.attempt(source, record, deadline)
+                if unavailable is not None:
+                    retry_after.append(unavailable.retry_after)
+                if image is not None:
+                    winner = (source, image)
+                    break
+            sources = [source for source in ranked if not source.local]
+
+            while winner is None:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                if next_source < len(sources) and (not pending or now >= next_start):
+                    source = sources[next_source]
+                    next_source += 1
+                    pending[self.pool.submit(self.attempt, source, record, deadline)] = source
+                    next_start = now + self.hedge_delay(source)
+                    continue
+                if not pending:
+                    break # Every source answered without an image
+
+                wake = deadline if next_source >= len(sources) else min(deadline, next_start)
+                done, _ = wait(pending, timeout=max(wake - now, 0), return_when=FIRST_COMPLETED)
+                for future in done:
+                    source = pending.pop(future)
+                    image, unavailable = future.result()
+                    if unavailable is not None:
+                        retry_after.append(unavailable.retry_after)
+                    if image is not None and winner is None:
+                        winner = (source, image)
+
+            for future, source in pending.items(): # Not needed any more: cancelled, or left to time out unseen
+                future.cancel()
+                with self.lock:
+                    self.source_stats[source.name]['cancelled'] += 1
+            if winner is None and pending:
+                retry_after.append(None) # Out of time before every source answered
+
+            if winner is None:
+                with self.lock:
+                    if not retry_after: # Every source said it has no cover
+                        self.unresolved += 1
+                        return None
+                    self.unavailable += 1
+                known = [seconds for seconds in retry_after if seconds is not None]
+                raise Art_Unavailable(f"No cover of '{record.name}' yet", min(known) if known else None,
+                                      resting=not ranked)
+            with self.lock:
+                self.resolved += 1
+                self.source_stats[winner[0].name]['wins'] += 1
+            resolve_span.set(source=winner[0].name)
+            return winner[1]
+
+    def stop(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "resolved": self.resolved,
+                "unresolved": self.unresolved,
+                "unavailable": self.unavailable,
+                "order": [source.name for source in sorted(self.sources, key=self.expected_cost)],
+                "sources": {name: dict(stats, latency_ms=round(stats['latency_ms'], 1))
+                            for name, stats in self.source_stats.items()}
+            }
@@ -3,153 +3,127 @@
 #           Date: 8/28/24
 #    Description: This is the dependencies of the class 'Main_Window'. Originally in 'driver.py'.
 #                 These functions include (in this order of this file):
-#                 1. reading the config file
-#                 2. updating the config file
-#                 3. creating a array dictionary from the config file
-#                 4. storing that dictionary
-#                 5. Grabbing all steam games installed
-#                 6. Launching selected steam game
-#                 7. Grabbing all epic games installed
-#                 8. Launching selected epic game
+#                 1. Grabbing all steam games installed
+#                 2. Launching selected steam game
+#                 3. Grabbing all epic games installed
+#                 4. Launching selected epic game
+#                 Reading/updating the config file lives in 'Config_Service.py'.
 #                 
 #           Note: Currently as of v2.0 only Steam is supported at the moment.
 #                 Epic Games, Battle.NET, and possibly Xbox will be next.
 # -----------------------------------------------------------------------
 # Import Statement(s)
 # -------------------
-# Tkinter Import Statement(s)
-from tkinter import messagebox                                      # For displaying message boxes and handling string vars in Tkinter
+# Tkinter, PIL and requests are imported inside the functions that use them, so the headless
+# command line ('driver.py list/launch') can use the scanners and launchers without loading them.
 # -----------------
 # Misc Statement(s)
-import configparser                                                 # For handling .ini config files
+import logging                                                      # For the module logger
 import subprocess                                                   # For executing sys commands and processes
 import os                                                           # For interacting with the current operating sys
 import re                                                           # For working with regex
-import json                                                         # For parsing and handling JSON files
-import time                                                         # For time-related functions and delays
-from dotenv import load_dotenv                                      # For loading the .env file for API access
-import requests                                                     # For requesting the API
+import time                                                         # For timing the library scans
+from email.utils import parsedate_to_datetime                       # For 'Retry-After' given as a date
 from io import BytesIO
-from PIL import Image, ImageFilter, ImageDraw, ImageOps
-#
-# ------------------------------------------------------------------
-# Reads in the config file provided in the parameter and returns it.
-
-def read_config_file(file_path):
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"The configuration file {file_path} does not exist.")
-    
-    config = configparser.ConfigParser()
-    config.read(file_path)
-
-    paths = {}
-    for section in config.sections():
-        path1 = config.get(section, 'path1', fallback=None)
-        path2 = config.get(section, 'path2', fallback=None)
-        executable = config.get(section, 'executable', fallback=None)
-        paths[section] = {'path1': path1, 'path2': path2, 'executable': executable}
-    
-    return paths
+from concurrent.futures import ThreadPoolExecutor                   # For scanning the library folders in parallel
+from .Game_Library import Game_Record                               # Record type of the scanned library
+from .Steam_Libraries import steam_library_paths                    # Steam libraries listed in 'libraryfolders.vdf'
+from .Steam_App_Info import load_steam_app_info, steam_art_path, GAME_TYPES # Names/types/art from 'appinfo.vdf'
+from .Epic_Installs import epic_install_records, epic_manifest_paths # Epic installs from 'LauncherInstalled.dat'
+from .Tracing import span, traced                                   # Timeline spans, no-ops unless tracing is on
+from .Metrics import set_gauge, observe                             # Scan durations for the diagnostics panel
+
+log = logging.getLogger(__name__)
 #
-# ------------------------------------------------------------
-# Updates the config file when a new path is selected via GUI.
-
-def update_config(file_path, new_path, id):
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"The configuration file {file_path} does not exist.")
-    
-    config = configparser.ConfigParser()
-    config.read(file_path)
-
-    # Counters for path1 and path2 occurrences
-    path1_count = 0
-    path2_count = 0
-    updated = False
-
-    for section in config.sections():
-        path1 = config.get(section, 'path1', fallback=None)
-        path2 = config.get(section, 'path2', fallback=None)
-
-        # Increment counts based on existing paths
-        if path1 is not None:
-            path1_count += 1
-        if path2 is not None:
-            path2_count += 1
-        
-        # Determine which path to update based on id
-        if id == 1 and path1_count == 1:  # Update first path1
-            config.set(section, 'path1', new_path)
-            updated = True
-        elif id == 2 and path2_count == 1:  # Update first path2
-            config.set(section, 'path2', new_path)
-            updated = True
-        elif id == 3 and path1_count == 2:  # Update second path1
-            config.set(section, 'path1', new_path)
-            updated = True
-
-    # Write the changes back to the file if any updates were made
-    if updated:
-        with open(file_path, 'w') as configfile:
-            config.write(configfile)
-    else:
-        raise ValueError(f"No matching path found for id {id}.")
+# ---------------------------------------------------------------------------------
+# Default error handler of the launch functions, shows a message box in the GUI.
+
+def show_launch_error(message):
+    from tkinter import messagebox                                  # For displaying message boxes
+    messagebox.showerror("Launcher", message)
 #
-# --------------------------------------------------------------------
-# Function to return an array dictionary from the read in config file.
-
-def create_section_vars(paths_data):
-    section_vars = {}
-    for section, paths in paths_data.items():
-        section_vars[section] = (paths['path1'], paths['path2'], paths['executable'])
-    return section_vars
+# ---------------------------------------------------------------------------------------------------------------
+# Function to scan every library path in the config (plus the Steam libraries Steam knows about), returns a list of
+# 'Game_Record's per launcher section. The folders are on different drives more often than not, so they are scanned in parallel.
+
+@traced(category="scan")
+def scan_library_records(config, on_error=log.warning):
+    library_records = {'Steam': [], 'Epic Games': []}
+
+    steam_config = config.launcher('Steam')
+    epic_config = config.launcher('Epic Games')
+    steam_paths = steam_library_paths(steam_config.paths, steam_config.executable, config.settings['steam_discovery'])
+    epic_paths = epic_manifest_paths(epic_config.paths, config.settings['epic_discovery'])
+
+    def scan(launcher, path):
+        start = time.perf_counter()
+        with span("scan_folder", "scan", launcher=launcher, path=path) as folder_span:
+            if launcher == 'Steam':
+                records = [Game_Record(f"steam:{record['app_id']}", 'Steam', record)
+                           for record in get_steam_game_records(path, app_info, steam_config.executable)]
+            else:
+                records = [Game_Record(f"epic:{record['name']}", 'Epic Games', record)
+                           for record in get_epic_game_records(path, epic_config.executable)]
+            folder_span.set(games=len(records))
+        set_gauge(f"scan_ms {path}", (time.perf_counter() - start) * 1000) # Last scan of each library root
+        return records
+
+    # Names, types and art of every installed app in one pass over 'appinfo.vdf'
+    app_ids = set()
+    for path in steam_paths:
+        try:
+            app_ids.update(steam_manifest_app_ids(path))
+        except FileNotFoundError:
+            pass # Reported by the scan below
+    with span("load_steam_app_info", "scan", apps=len(app_ids)):
+        app_info = load_steam_app_info(steam_config.executable, app_ids)
+
+    scan_start = time.perf_counter()
+    folders = [('Steam', path) for path in steam_paths] + [('Epic Games', path) for path in epic_paths]
+    with ThreadPoolExecutor(max_workers=max(len(folders), 1), thread_name_prefix="Library_Scan") as pool:
+        futures = [(launcher, path, pool.submit(scan, launcher, path)) for launcher, path in folders]
+        for launcher, path, future in futures: # Collected in folder order, errors reported as before
+            try:
+                library_records[launcher].extend(future.result())
+            except FileNotFoundError:
+                on_error(f"No Games Found in '{path}'")
+
+    observe('library_scan_ms', (time.perf_counter() - scan_start) * 1000)
+    return library_records
 #
-# ---------------------------------------------------------------------------
-# Store each of the launcher's path and executable in an array and return it.
-
-def store_path_vars(sections):
-    paths_dict = {}
-    
-    steam_paths = sections.get('Steam')
-    if steam_paths:
-        steam_path1, steam_path2, executable = steam_paths
-        paths_dict['Steam'] = {'path1': steam_path1, 'path2': steam_path2, 'executable': executable}
-
-    epic_games_paths = sections.get('Epic Games')
-    if epic_games_paths:
-        epic_games_path1, epic_games_path2, executable = epic_games_paths
-        paths_dict['Epic Games'] = {'path1': epic_games_path1, 'path2': epic_games_path2, 'executable': executable}
-
-    # FOR FUTURE IMPLEMENTATION of Battle.NET
-    # ----------------------------------------------------
-    # battle_net_paths = sections.get('Battle.NET')
-    # if battle_net_paths:
-    #     battle_net_path1, battle_net_path2, executable = battle_net_paths
-    #     paths_dict['Battle.NET'] = {'path1': battle_net_path1, 'path2': battle_net_path2, 'executable': executable}
-    # ----------------------------------------------------
-
-    return paths_dict
+# ---------------------------------------------------------------------------------------------------------------
+# Function to check a candidate library path before it is saved, returns (number of games found, message for the settings window).
+# Runs on a background thread, folders that turn out to belong to the other launcher are called out.
+
+def preview_library_path(config, section, path):
+    try:
+        if section == 'Steam':
+            executable = config.launcher('Steam').executable
+            app_info = load_steam_app_info(executable, steam_manifest_app_ids(path))
+            count = len(get_steam_game_records(path, app_info, executable))
+        else:
+            count = len(get_epic_game_records(path, config.launcher('Epic Games').executable))
+    except OSError: # Missing folder, not a folder, no access
+        return 0, "Folder not found"
+    if count:
+        return count, f"{count} game{'s' if count != 1 else ''} found"
+
+    filenames = os.listdir(path)
+    if section == 'Steam' and any(filename.endswith('.item') for filename in filenames):
+        return 0, "No Steam games, this looks like an Epic Games manifests folder"
+    if section != 'Steam' and any(filename.startswith('appmanifest_') for filename in filenames):
+        return 0, "No Epic games, this looks like a Steam library"
+    return 0, "No games found"
 #
 # ------------------------------------------------------------------------------------------------------------------------------------------------
 # Function(s) to get and launch Steam games
 # Function to get all appmanifest files from the provided path, parse 'name' and 'appid', store in array, return it, and Error handle when needed.
 
 def get_steam_games(manifests_folder):
-    Steam_Games = {}
-
     try:
-        for filename in os.listdir(manifests_folder):
-            if filename.startswith("appmanifest") and filename.endswith(".acf"):
-                app_id = filename.split('_')[1].split('.')[0]
-                with open(os.path.join(manifests_folder, filename), 'r', encoding='utf-8') as r:
-                    for line in r:
-                        if "name" in line:
-                            game_name = line.split('"')[3]
-                            game_name = re.sub(r'[^\w\s:]', '', game_name)
-                            if game_name == "Steamworks Common Redistributables":
-                                break
-                            else:
-                                Steam_Games[game_name] = app_id
-                                break
+        Steam_Games = {}
+        for record in get_steam_game_records(manifests_folder):
+            Steam_Games[record['name']] = record['app_id']
         return Steam_Games        
                     
     except FileNotFoundError as fnf_error:
@@ -158,20 +132,76 @@ def get_steam_games(manifests_folder):
         no_games_found_text = f"No Games Found in '{manifests_folder}'"
         return no_games_found_text
 #
+# ------------------------------------------------------------------------------------------------------------------------
+# Function to read every top level '"key" "value"' pair of an appmanifest file (keys are lower cased, first one wins).
+
+ACF_FIELD = re.compile(r'^\s*"([^"]+)"\s+"([^"]*)"')
+
+@traced(category="scan")
+def read_steam_manifest(manifest_path):
+    fields = {}
+    with open(manifest_path, 'r', encoding='utf-8') as r:
+        for line in r:
+            match = ACF_FIELD.match(line)
+            if match:
+                fields.setdefault(match.group(1).lower(), match.group(2))
+    return fields
+#
+# ------------------------------------------------------------------------------------------------------------------------
+# Function to get a record for each installed steam game with the fields the dashboard sorts by. Raises FileNotFoundError.
+# 'app_info' (from 'load_steam_app_info') supplies the name, type and art, the manifest the per install fields.
+# Apps missing from it (appinfo not readable, or not refreshed yet) fall back to the manifest alone.
+
+def get_steam_game_records(manifests_folder, app_info=None, steam_executable=None):
+    records = []
+    for app_id in steam_manifest_app_ids(manifests_folder):
+        fields = read_steam_manifest(os.path.join(manifests_folder, f"appmanifest_{app_id}.acf"))
+        info = (app_info or {}).get(app_id)
+        app_type = info['type'] if info is not None and isinstance(info['type'], str) else None # Not a string in a damaged file
+        if app_type and app_type.lower() not in GAME_TYPES:
+            continue # Tools, redistributables, DLC, ...
+        name = info['name'] if info is not None and isinstance(info['name'], str) and info['name'] else fields.get('name', '')
+        game_name = re.sub(r'[^\w\s:]', '', name)
+        if not game_name or game_name == "Steamworks Common Redistributables":
+            continue
+        records.append({
+            'name': game_name,
+            'app_id': app_id,
+            'install_dir': os.path.join(manifests_folder, 'common', fields.get('installdir', '')),
+            'art_path': steam_art_path(steam_executable, app_id, info),
+            'size_on_disk': manifest_int(fields.get('sizeondisk')),
+            'last_updated': manifest_int(fields.get('lastupdated')),
+            'last_played': manifest_int(fields.get('lastplayed'))
+        })
+    return records
+
+# App ids of the appmanifests in a 'steamapps' folder, from the file names alone. Raises FileNotFoundError.
+def steam_manifest_app_ids(manifests_folder):
+    with span("os.listdir", "scan", path=manifests_folder):
+        return [filename[len("appmanifest_"):-len(".acf")] for filename in os.listdir(manifests_folder)
+                if filename.startswith("appmanifest_") and filename.endswith(".acf")]
+
+def manifest_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+#
 # -------------------------------------------------------------------------------------------------------------------------
 # Function to launch the provided steam game given the parameters (the game's appid, steam's exe path, and the game's name)
 
-def launch_steam_game(app_id, steam_path, name):
+@traced(category="launch")
+def launch_steam_game(app_id, steam_path, name, on_error=show_launch_error):
     command = [steam_path, "-applaunch", str(app_id)]
-    print(f"Launching Game \"{name}\"...")
-    time.sleep(2) # Pauses for 2 seconds
-    print(f"Successfully Launched \"{name}\"")
+    log.info("Launching game '%s'", name)
     try:
-        subprocess.run(command)
-    except subprocess.CalledProcessError as e:
-        messagebox.showerror("Launcher", f"Failed to launch game: {e}")
+        subprocess.Popen(command) # Don't wait on it, 'steam.exe' keeps running when Steam wasn't open yet
+        return True
     except FileNotFoundError as fnf_error:
-        messagebox.showerror("Launcher", f"Executable not found: {fnf_error}")
+        on_error(f"Executable not found: {fnf_error}")
+    except OSError as e:
+        on_error(f"Failed to launch game: {e}")
+    return False
 #
 # -----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 # Function(s) to get and launch Epic games
@@ -179,47 +209,104 @@ def launch_steam_game(app_id, steam_path, name):
 
 def get_epic_games(game_folder, launcher_executable):
     Epic_Games = {}
-    for filename in os.listdir(game_folder):
-        if filename.endswith(".item"):
-            with open(os.path.join(game_folder, filename), 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                display_name = data.get("DisplayName", "")
-                install_location = data.get("InstallLocation", "")
-                launch_executable = data.get("LaunchExecutable", "")
-                if launch_executable == "FortniteGame/Binaries/Win64/FortniteLauncher.exe": # Change the fortnite executable because the one in the binary file requires you to launch through epic games launcher.
-                    launch_executable = "FortniteGame/Binaries/Win64/FortniteClient-Win64-Shipping_EAC_EOS.exe" # Change to the one that lets you do it without launching it via the epic games launcher.
-                executable_location = os.path.normpath(os.path.join(install_location, launch_executable))
-                # print(display_name, executable_location)
-                Epic_Games[display_name] = {
-                    "Executable": executable_location,
-                    "Launcher Executable": launcher_executable
-                }
+    for record in get_epic_game_records(game_folder, launcher_executable):
+        Epic_Games[record['name']] = {
+            "Executable": record['executable'],
+            "Launcher Executable": record['launcher_executable']
+        }
     return Epic_Games
 #
+# ------------------------------------------------------------------------------------------------------------------------
+# Function to get a record for each installed epic game with the fields the dashboard sorts by. Raises FileNotFoundError.
+# 'LauncherInstalled.dat' lists what is installed, the '.item' manifests are only parsed again when they change.
+
+def get_epic_game_records(game_folder, launcher_executable):
+    return epic_install_records(game_folder, launcher_executable)
+#
 # ---------------------------------------------------------------------------------------------------------------------------------------
 # Function to launch the provided epic game given the parameters (the game's executable path, the game's name, and epic game's exe path).
+@traced(category="launch")
 def launch_epic_game(executable_path, name, epic_games_launcher_executable):
     try:
-        subprocess.call(executable_path)
-        print(f"Launching Game \"{name}\"...")
-        time.sleep(2) # Pauses for 2 seconds
-        print(f"Successfully Launched \"{name}\"") # Print that is successfully launched.
+        log.info("Launching game '%s'", name)
+        subprocess.Popen(executable_path) # Don't wait for the game to exit
+        return True
         #self.Exit()
-    except subprocess.CalledProcessError as e:
-        print (f"Failed to Launch Game, Launching Epic Games Store by default: \"{name}\"... Error: {e}") # Print the error statement in detail.
-        subprocess.call(epic_games_launcher_executable)
-    except FileNotFoundError as fnf:
-        print (f"Failed to Find Game, Make sure the game is installed. Opening Epic Games Store...")
-        subprocess.call(epic_games_launcher_executable)
+    except FileNotFoundError:
+        log.warning("Failed to find '%s', make sure the game is installed. Opening the Epic Games Launcher...", name)
+    except OSError as e:
+        log.warning("Failed to launch '%s', opening the Epic Games Launcher instead: %s", name, e)
+    try:
+        subprocess.Popen(epic_games_launcher_executable)
+    except OSError as launcher_error: # Moved, uninstalled or not set in 'config.ini'
+        log.error("Failed to open the Epic Games Launcher '%s': %s", epic_games_launcher_executable, launcher_error)
+    return False
 
 # ---------------------------------------------------------------------------------------------------------------------------------------
-# 
-def grab_epic_game_photo(api_key, game_title):
-    # Base URL for Giant Bomb API
-    base_url = 'https://www.giantbomb.com/api'
+# One pooled HTTP session for the life of the launcher, keeps the connections to the API alive between games.
+
+http_session = None
+
+def get_http_session():
+    global http_session
+    if http_session is None:
+        import requests                                             # For requesting the API
+        http_session = requests.Session()
+    return http_session
+
+# ---------------------------------------------------------------------------------------------------------------------------------------
+# Giant Bomb search for a game's cover. Returns a loaded PIL image, or None when there is no usable one.
+# 'base_url' is the API root, pointed at 'Benchmarks/mock_giant_bomb.py' for offline and load tests.
+# A game without a cover, a refused request (4xx) or a truncated image give None. Rate limiting (429), server errors
+# (5xx), timeouts and dropped connections raise 'Art_Unavailable': the cover may well exist, ask again later.
+
+GIANT_BOMB_URL = 'https://www.giantbomb.com/api'
+REQUEST_TIMEOUT = (5, 15) # Seconds to connect, seconds between bytes of the answer
+
+def giant_bomb_url(configured=None):
+    return os.getenv('GIANT_BOMB_URL') or configured or GIANT_BOMB_URL
+
+# A cover that can't be had right now. 'retry_after' is the wait in seconds the server asked for, or None.
+class Art_Unavailable(Exception):
+    def __init__(self, message, retry_after=None, resting=False):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.resting = resting # Nothing was asked, every source waits out an earlier 'Retry-After'
+
+# Raise 'Art_Unavailable' for an answer that says 'not now' (429 or 5xx) rather than 'no'.
+def check_transient(response, what):
+    if response.status_code == 429 or response.status_code >= 500:
+        raise Art_Unavailable(f"{what}: HTTP status code {response.status_code}", retry_after(response))
+
+# The 'Retry-After' header in seconds (given as seconds or as an HTTP date), None when missing or malformed.
+def retry_after(response):
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+# The usual request timeouts, cut to what is left until 'deadline' (a 'time.monotonic()' time, None for no limit).
+# Computed right before each request, so requests made one after the other share the time left.
+def request_timeout(deadline=None):
+    if deadline is None:
+        return REQUEST_TIMEOUT
+    seconds = max(deadline - time.monotonic(), 0.001)
+    return tuple(min(limit, seconds) for limit in REQUEST_TIMEOUT)
+
+def grab_epic_game_photo(api_key, game_title, base_url=GIANT_BOMB_URL, deadline=None):
+    from PIL import Image                                           # For opening the downloaded image
+    import requests                                                 # For the request exceptions
+    session = get_http_session()
 
     # Search endpoint URL
-    search_url = f'{base_url}/search'
+    search_url = f'{base_url.rstrip("/")}/search'
 
     # Query parameters for the search
     params = {
@@ -235,53 +322,65 @@ def grab_epic_game_photo(api_key, game_title):
         'User-Agent': 'Rocket_Game_Launcher/1.0 -- Testing Channel'
     }
 
-    # Perform the search request
-    print()
-    print(f"Attempting to get Image from {base_url}...")
-    response = requests.get(search_url, params=params, headers=headers)
-    
-    # Check the response
-    print(f"Status Code: {response.status_code}")
-    # print(f"Response Content: {response.text}")
-
-    
-    if response.status_code == 200:
+    try:
+        # Perform the search request
+        log.debug("Searching %s for '%s'", base_url, game_title)
+        with span("giant_bomb_search", "art", game=game_title):
+            response = session.get(search_url, params=params, headers=headers, timeout=request_timeout(deadline))
+
+        # Check the response
+        log.debug("Status code %s for '%s'", response.status_code, game_title)
+        check_transient(response, f"Searching for '{game_title}'")
+        if response.status_code != 200:
+            log.warning("Searching for '%s' failed with HTTP status code %s", game_title, response.status_code)
+            log.debug("Response content: %s", response.text)
+            return None
+
         try:
             data = response.json()  # Decode JSON response
-            results = data.get('results', [])
-            
-            if results:
-                # Fetch the first result's details
-                game = results[0]
-                title = game.get('name', 'Unknown')
-                cover_image_url = game.get('image', {}).get('medium_url', 'No image available')
-                
-                print(f"Searching Game Title: {title}")
-                print(f"Using Cover Image URL: {cover_image_url}")
-                
-                if cover_image_url != 'No image available':
-                    # Fetch the image from the URL
-                    image_response = requests.get(cover_image_url)
-                    if image_response.status_code == 200:
-                        image_data = BytesIO(image_response.content)
-                        image = Image.open(image_data)
-                        return image
-                    else:
-                        print(f"Failed to fetch image, status code: {image_response.status_code}")
-                else:
-                    print("No image URL available")
-            else:
-                print("No results found")
-
         except ValueError as e:
-            print(f"Error decoding JSON: {e}")
-            print("Response content:", response.text)
-    else:
-        print(f"Error: HTTP Status Code {response.status_code}")
-        print("Response content:", response.text)
-    
-    return None
+            log.warning("Error decoding the search results of '%s': %s", game_title, e)
+            log.debug("Response content: %s", response.text)
+            return None
+        results = data.get('results', [])
+        if not results:
+            log.debug("No search results for '%s'", game_title)
+            return None
+
+        # Fetch the first result's details
+        game = results[0]
+        title = game.get('name', 'Unknown')
+        cover_image_url = (game.get('image') or {}).get('medium_url')
+        if not cover_image_url:
+            log.debug("No cover image for '%s'", game_title)
+            return None
+        log.debug("Using cover image %s of '%s'", cover_image_url, title)
+
+        # Fetch the image from the URL
+        with span("giant_bomb_image", "art", game=game_title):
+            image_response = session.get(cover_image_url, headers=headers, timeout=request_timeout(deadline))
+        check_transient(image_response, f"The cover of '{game_title}'")
+        if image_response.status_code != 200:
+            log.warning("Failed to fetch the cover of '%s', status code %s", game_title, image_response.status_code)
+            return None
+    except requests.RequestException as request_error: # Connection refused, timeout, dropped connection
+        raise Art_Unavailable(f"Request for the cover of '{game_title}' failed: {request_error}") from request_error
+
+    try:
+        image = Image.open(BytesIO(image_response.content))
+        image.load() # Decode now, a truncated download fails here instead of in the tile pipeline
+    except OSError as os_error:
+        log.warning("Broken cover image for '%s': %s", game_title, os_error)
+        return None
+    return image
+
+# Turn a cover into a dashboard tile: resized, blurred towards the bottom and with rounded corners.
+def process_game_photo(image):
+    game_image_resize = image.resize((300, 450))
+    blurred_game_photo = add_blur_gradient(game_image_resize, 10, 0.2)  # Adjust blur effect and height ratio
+    return add_rounded_corners(blurred_game_photo, 10) # Adjust radius of photo here
 
+@traced("gaussian_blur", category="art")
 def add_blur_gradient(image, blur_radius, blur_height_ratio):
         """
         Apply a blur gradient effect that starts at the bottom and transitions upwards.
@@ -294,6 +393,7 @@ def add_blur_gradient(image, blur_radius, blur_height_ratio):
         Returns:
         - The image with the blur gradient applied.
         """
+        from PIL import Image, ImageFilter, ImageDraw
         # Create a blurred version of the image
         blurred_image = image.filter(ImageFilter.GaussianBlur(blur_radius))
         
@@ -320,7 +420,9 @@ def add_blur_gradient(image, blur_radius, blur_height_ratio):
         return blended_image
 
 # Add rounded corners
+@traced(category="art")
 def add_rounded_corners(image, radius):
+    from PIL import Image, ImageDraw, ImageOps
     # Create a mask for rounded corners
     mask = Image.new("L", image.size, 0)
     draw = ImageDraw.Draw(mask)
@@ -0,0 +1,182 @@
+# ----------------------------------
+#      File Name: Command_Line.py
+#           Date: 10/19/26
+#    Description: Headless command line for scripts and hotkey tools. Lists and launches games without
+#                 creating the GUI, so Tkinter and PIL are never imported.
+#                 Usage:
+#                   driver.py list [--json] [--sort name|size|last_updated|last_played|launcher] [--rescan]
+#                   driver.py launch <name|appid> [--rescan]
+#                   driver.py rescan
+#                   driver.py disk-usage [--json] [--walk] [--refresh]
+#                   driver.py import-art <folder or zip> [--workers 8]
+#                 '--trace' before the command records a Chrome trace to 'Logs/trace.json' (or set 'ROCKET_TRACE').
+#                 The library is served from the memory mapped 'Cache/library_index.bin' (written by every scan)
+#                 and is only rescanned when 'config.ini' changed since then, or with '--rescan'. The index's stored
+#                 sort orders are used as they are, only games launched since it was written ('play_history.json')
+#                 are re-sorted.
+#                 'launch' and 'rescan' are forwarded to the running launcher window when there is one, 'import-art'
+#                 tells it to reload the pack.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import argparse                                                     # For parsing the command line
+import json                                                         # For the '--json' output
+import os                                                           # For interacting with the current operating sys
+import sys                                                          # For writing errors to stderr
+from .Class_Dependencies import scan_library_records, launch_steam_game, launch_epic_game
+from .Config_Service import Config_Service                          # Cached, atomic access to 'config.ini'
+from .Game_Library import Game_Library, SORT_ORDERS                 # Scanned games and their sorted views
+from .Library_Index import load_library_index, save_library_index, index_records, RECORD_FIELDS
+from .Instance_Server import send_to_running_instance               # Forwards commands to the running launcher
+from .Disk_Usage import Disk_Usage_Analyzer, format_size            # Per game/library size report
+from .Tracing import start_tracing, start_tracing_from_environment  # Chrome trace of the command
+from .Art_Pack import import_art_pack                               # Bulk import of offline covers
+from .Epic_Installs import use_manifest_cache                       # Parsed Epic manifests kept across runs
+#
+# ------------------------------------------------------------------------------
+# Entry point, returns the process exit code.
+
+def run_cli(argv, current_dir):
+    parser = argparse.ArgumentParser(prog="driver.py", description="Rocket Game Launcher (run without arguments for the GUI)")
+    parser.add_argument("--trace", action="store_true", help="write a Chrome trace of the command to 'Logs/trace.json'")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="list the installed games")
+    list_parser.add_argument("--json", action="store_true", help="print the games as JSON")
+    list_parser.add_argument("--sort", choices=list(SORT_ORDERS), default="name", help="order of the games")
+    list_parser.add_argument("--rescan", action="store_true", help="scan the library paths instead of using the cached index")
+
+    launch_parser = commands.add_parser("launch", help="launch a game by name or app id")
+    launch_parser.add_argument("game", nargs="+", help="game name (or part of it), Steam app id or Epic app name")
+    launch_parser.add_argument("--rescan", action="store_true", help="scan the library paths instead of using the cached index")
+
+    commands.add_parser("rescan", help="rescan every library path")
+
+    usage_parser = commands.add_parser("disk-usage", help="report the disk space used by each game and library")
+    usage_parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    usage_parser.add_argument("--walk", action="store_true", help="measure every install directory instead of trusting the manifests")
+    usage_parser.add_argument("--refresh", action="store_true", help="ignore the cached directory sizes")
+
+    art_parser = commands.add_parser("import-art", help="import a folder or zip of covers as the art pack")
+    art_parser.add_argument("source", help="folder or zip of images named after the Steam app id, Epic AppName or title")
+    art_parser.add_argument("--workers", type=int, default=None, help="images processed in parallel")
+
+    args = parser.parse_args(argv)
+    if args.trace:
+        start_tracing(os.path.join(current_dir, 'Logs', 'trace.json'))
+    else:
+        start_tracing_from_environment(os.path.join(current_dir, 'Logs'))
+
+    # The running launcher already has the library in memory, let it do the work
+    if args.command == "launch" and not args.rescan:
+        if forward_command(current_dir, {'command': 'launch', 'game': " ".join(args.game)}):
+            return 0
+    elif args.command == "rescan":
+        if forward_command(current_dir, {'command': 'rescan'}):
+            return 0
+
+    if args.command == "import-art":
+        return import_art(current_dir, args.source, args.workers)
+
+    library, launchers = load_library(current_dir, args.command == "rescan" or getattr(args, "rescan", False))
+
+    if args.command == "list":
+        records = [library.get(key) for key in library.ordered(args.sort)]
+        return list_games([{field: getattr(record, field) for field in RECORD_FIELDS} for record in records], args.json)
+    if args.command == "rescan":
+        print(f"Found {len(library.records)} games")
+        return 0
+    if args.command == "disk-usage":
+        analyzer = Disk_Usage_Analyzer(os.path.join(current_dir, 'Cache', 'disk_usage.json'))
+        return print_disk_usage(analyzer.report(list(library.records.values()), args.walk, args.refresh), args.json)
+    return launch_game(library, launchers, " ".join(args.game))
+
+def forward_command(current_dir, message):
+    reply = send_to_running_instance(current_dir, message)
+    if reply is None:
+        return False # No launcher running, handle it here
+    if not reply.get('ok'):
+        print_error(reply.get('error', "The running launcher rejected the command"))
+    return True
+#
+# ------------------------------------------------------------------------------
+# Returns the library and each launcher's executable, from the cached index when it is still current.
+
+def load_library(current_dir, rescan=False):
+    config_path = os.path.join(current_dir, 'Config', 'config.ini')
+    index_path = os.path.join(current_dir, 'Cache', 'library_index.bin')
+    library = Game_Library(os.path.join(current_dir, 'Config', 'play_history.json'))
+
+    index = None if rescan else open_current_index(current_dir)
+    if index is not None:
+        with index: # Stored orderings, re-sorting only the games played since the index was written
+            library.load_presorted(index_records(index), {order: index.ordered(order) for order in SORT_ORDERS})
+            return library, index.launchers()
+
+    config = Config_Service(config_path).get()
+    use_manifest_cache(os.path.join(current_dir, 'Cache', 'epic_manifests.json'))
+    for launcher, records in scan_library_records(config, on_error=print_error).items():
+        library.sync(launcher, records)
+    save_library_index(index_path, library, config)
+    return library, {name: launcher.executable for name, launcher in config.launchers.items()}
+
+# Opens the library index, unless it is missing or older than the config it was scanned from.
+def open_current_index(current_dir):
+    index = load_library_index(os.path.join(current_dir, 'Cache', 'library_index.bin'))
+    if index is not None and index.config_mtime != os.stat(os.path.join(current_dir, 'Config', 'config.ini')).st_mtime_ns:
+        index.close()
+        return None
+    return index
+
+# Prints the games (dicts of 'RECORD_FIELDS') in the order given.
+def list_games(records, as_json):
+    if as_json:
+        print(json.dumps(records, indent=2))
+    else:
+        for record in records:
+            print(f"{record['name']}\t{record['launcher']}\t{record['app_id'] or record['app_name'] or ''}")
+    return 0
+
+def print_disk_usage(report, as_json):
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return 0
+    for library in report['libraries']:
+        print(f"{format_size(library['size'])}\t{library['launcher']}\t{library['path']}")
+    print()
+    for game in report['games']:
+        print(f"{format_size(game['size'])}\t{game['name']}\t{game['launcher']}")
+    print(f"\nTotal: {format_size(report['total'])}")
+    return 0
+
+def launch_game(library, launchers, query):
+    matches = library.find(query)
+    if not matches:
+        print_error(f"No game matches '{query}'")
+        return 1
+    if len(matches) > 1:
+        print_error(f"'{query}' matches more than one game: " + ", ".join(record.name for record in matches))
+        return 1
+
+    record = matches[0]
+    if record.launcher == 'Steam':
+        launched = launch_steam_game(record.app_id, launchers.get('Steam'), record.name, on_error=print_error)
+    else:
+        launched = launch_epic_game(record.executable, record.name, record.launcher_executable)
+    if launched:
+        library.mark_played(record.key)
+    return 0 if launched else 1
+
+def import_art(current_dir, source, workers):
+    try:
+        result = import_art_pack(source, os.path.join(current_dir, 'Cache'), workers)
+    except OSError as os_error:
+        print_error(f"Could not import '{source}': {os_error}")
+        return 1
+    print(f"Imported {result['imported']} covers in {result['seconds']:.1f}s "
+          f"({result['skipped']} skipped, {result['duplicates']} duplicates)")
+    send_to_running_instance(current_dir, {'command': 'reload_art_pack'}) # Nothing happens when no launcher runs
+    return 0
+
+def print_error(message):
+    print(message, file=sys.stderr)
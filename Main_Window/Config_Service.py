@@ -0,0 +1,192 @@
+# ----------------------------------
+#      File Name: Config_Service.py
+#           Date: 10/19/26
+#    Description: Cached access to 'config.ini'. Replaces re-parsing the file every time the dashboard is built.
+#                 1. The file is parsed once into a typed model ('Launcher_Config' per launcher section
+#                    plus the '[Launcher]' settings) and only re-parsed when its mtime changes on disk.
+#                 2. Each launcher holds any number of library paths ('path1', 'path2', ... 'pathN').
+#                 3. Changes are staged in memory and written in one batch by 'flush', atomically
+#                    (written to a temp file next to the config, then renamed over it).
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import configparser                                                 # For handling .ini config files
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import re                                                           # For working with regex
+import shutil                                                       # For keeping the config's permissions
+import tempfile                                                     # For writing the new config next to the old one
+import threading                                                    # For guarding the cached model between threads
+
+log = logging.getLogger(__name__)
+
+LAUNCHER_SECTIONS = ('Steam', 'Epic Games') # Sections that describe a game launcher
+PATH_KEY = re.compile(r'^path(\d+)$') # 'path1', 'path2', ... in any number
+DEFAULT_SETTINGS = {
+    'image_cache_mb': 64, # Byte budget for decoded tile images
+    'watchdog': False, # Log main loop stalls with the main thread's stack
+    'watchdog_threshold_ms': 500, # Stall length that gets logged
+    'steam_discovery': True, # Also scan the Steam libraries listed in Steam's 'libraryfolders.vdf'
+    'epic_discovery': True, # Also scan Epic's own manifests folder when 'LauncherInstalled.dat' lists installs
+    'log_level': "INFO", # DEBUG, INFO, WARNING or ERROR, the 'ROCKET_LOG_LEVEL' environment variable overrides it
+    'launch_warmup': False, # Read a game's executable and largest files into the OS cache when its tile is hovered
+    'giant_bomb_url': "https://www.giantbomb.com/api", # Artwork API root, the 'GIANT_BOMB_URL' environment variable overrides it
+    'art_folder': "", # Folder of the user's own covers, 'Art' next to 'driver.py' when empty
+    'art_http_sources': "", # Comma separated image URL templates ex: 'https://host/covers/{app_id}.jpg'
+    'art_budget_ms': 3000, # Time the art sources get per game before the tile keeps its placeholder
+    'broken_games': "mark" # Games whose install folder or executable is gone: 'mark', 'hide' or 'show'
+}
+#
+# ------------------------------------------------------------------------------
+# Typed model of one launcher section
+
+class Launcher_Config:
+    def __init__(self, name, paths, executable):
+        self.name = name # Section name ex: 'Steam'
+        self.paths = paths # List of library paths in the order of their 'pathN' keys
+        self.executable = executable # The launcher's executable
+
+    def __repr__(self):
+        return f"Launcher_Config({self.name!r}, paths={self.paths!r}, executable={self.executable!r})"
+#
+# ------------------------------------------------------------------------------
+# Typed model of the whole config file
+
+class Config_Model:
+    def __init__(self, launchers, settings, mtime):
+        self.launchers = launchers # section name -> Launcher_Config
+        self.settings = settings # '[Launcher]' section values, already converted to their types
+        self.mtime = mtime # mtime of the file this model was parsed from
+
+    def launcher(self, name):
+        return self.launchers.get(name) or Launcher_Config(name, [], None)
+#
+# ------------------------------------------------------------------------------
+# Config Service Class
+
+class Config_Service:
+    def __init__(self, file_path):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The configuration file {file_path} does not exist.")
+
+        self.file_path = file_path
+        self.lock = threading.RLock()
+        self.parser = None # Parser of the last read, kept so unknown keys/sections survive a write
+        self.model = None
+        self.pending = {} # section name -> staged list of paths, written by flush()
+
+    # Return the cached model, re-parsing only when the file changed on disk since the last read.
+    def get(self):
+        with self.lock:
+            mtime = os.stat(self.file_path).st_mtime_ns
+            if self.model is None or mtime != self.model.mtime:
+                self.model = self.parse(mtime)
+            return self.model
+
+    def parse(self, mtime):
+        parser = configparser.ConfigParser()
+        parser.read(self.file_path)
+        self.parser = parser
+
+        launchers = {}
+        for section in parser.sections():
+            if section not in LAUNCHER_SECTIONS:
+                continue
+            paths = self.read_paths(parser[section])
+            executable = parser.get(section, 'executable', fallback=None)
+            launchers[section] = Launcher_Config(section, paths, executable)
+
+        # Staged but unwritten paths win over what is on disk
+        for section, paths in self.pending.items():
+            launchers.setdefault(section, Launcher_Config(section, [], None)).paths = list(paths)
+
+        settings = dict(DEFAULT_SETTINGS)
+        if parser.has_section('Launcher'):
+            for key, default in DEFAULT_SETTINGS.items():
+                try:
+                    if isinstance(default, bool):
+                        settings[key] = parser.getboolean('Launcher', key, fallback=default)
+                    else:
+                        settings[key] = type(default)(parser.get('Launcher', key, fallback=default))
+                except ValueError:
+                    log.warning("Invalid value for '%s' in '%s', using %s", key, self.file_path, default)
+
+        return Config_Model(launchers, settings, mtime)
+
+    def read_paths(self, section):
+        numbered = []
+        for key, value in section.items():
+            match = PATH_KEY.match(key)
+            if match and value.strip(): # Blank paths are treated as not set
+                numbered.append((int(match.group(1)), value.strip()))
+        return [value for _, value in sorted(numbered)]
+
+    # -----------------------------------------------------------------------------------------
+    # Staged changes. Nothing touches the disk until flush().
+    def set_paths(self, section, paths):
+        with self.lock:
+            paths = [path.strip() for path in paths if path and path.strip()]
+            self.pending[section] = paths
+            model = self.get() # Also applies the staged paths when the file has to be re-parsed
+            model.launchers.setdefault(section, Launcher_Config(section, [], None)).paths = list(paths)
+
+    def set_path(self, section, index, path):
+        paths = list(self.get().launcher(section).paths)
+        if index < len(paths):
+            paths[index] = path
+        else:
+            paths.append(path)
+        self.set_paths(section, paths)
+
+    def remove_path(self, section, index):
+        paths = list(self.get().launcher(section).paths)
+        if index < len(paths):
+            del paths[index]
+            self.set_paths(section, paths)
+
+    def has_pending(self):
+        return bool(self.pending)
+
+    # Write every staged change in one atomic batch.
+    def flush(self):
+        with self.lock:
+            if not self.pending:
+                return False
+            self.get() # Pick up external edits so they are not overwritten
+
+            for section, paths in self.pending.items():
+                if not self.parser.has_section(section):
+                    self.parser.add_section(section)
+                for key in list(self.parser[section]):
+                    if PATH_KEY.match(key):
+                        self.parser.remove_option(section, key)
+                for number, path in enumerate(paths or [''], start=1): # Keep an empty 'path1' so the file stays self documenting
+                    self.parser.set(section, f'path{number}', path)
+
+            directory = os.path.dirname(os.path.abspath(self.file_path))
+            file_descriptor, temp_path = tempfile.mkstemp(prefix='.config-', suffix='.ini', dir=directory)
+            try:
+                with os.fdopen(file_descriptor, 'w') as configfile:
+                    self.parser.write(configfile)
+                    configfile.flush()
+                    os.fsync(configfile.fileno())
+                copy_file_mode(self.file_path, temp_path) # 'mkstemp' creates it readable by its owner only
+                os.replace(temp_path, self.file_path) # Atomic on the same volume
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+            self.pending.clear()
+            self.model = None # Re-read on next get() so the cached mtime matches the new file
+            return True
+#
+# ------------------------------------------------------------------------------
+# Give 'target' the permissions of 'source', or the ones a newly created file gets when there is no 'source' yet.
+
+def copy_file_mode(source, target):
+    try:
+        shutil.copymode(source, target)
+    except FileNotFoundError:
+        umask = os.umask(0) # Only readable by setting it, put back right away
+        os.umask(umask)
+        os.chmod(target, 0o666 & ~umask)
@@ -0,0 +1,158 @@
+# ----------------------------------
+#      File Name: Disk_Usage.py
+#           Date: 10/19/26
+#    Description: Per game and per library disk usage report.
+#                 1. The size recorded by the launcher is used when there is one ('SizeOnDisk' in Steam's
+#                    appmanifests, 'InstallSize' in Epic's manifests).
+#                 2. Otherwise the install directory is walked with 'os.scandir', its sub directories spread
+#                    over a thread pool (the walk is bound by file system calls, which release the GIL).
+#                 3. Each directory's file total is cached in 'Cache/disk_usage.json' by the directory's mtime,
+#                    so a re-run only lists the directories that gained or lost entries.
+#                    Files that grew in place don't change their directory's mtime, a full re-walk needs
+#                    'refresh=True'.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import json                                                         # For the directory cache file
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import threading                                                    # For guarding the directory cache
+from concurrent.futures import ThreadPoolExecutor                   # For walking directories in parallel
+
+log = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 8
+#
+# ------------------------------------------------------------------------------
+# Human readable size ex: '12.4 GB'.
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} TB"
+#
+# ------------------------------------------------------------------------------
+# Disk Usage Analyzer Class
+
+class Disk_Usage_Analyzer:
+    def __init__(self, cache_path=None, workers=DEFAULT_WORKERS):
+        self.cache_path = cache_path
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.directories = self.load_cache() # path -> [mtime_ns, bytes of the files directly inside, [sub directories]]
+        self.walked = 0 # Directories listed (not served from the cache) by the last report
+
+    # Size of every game plus the total of each library. Games whose launcher didn't record a size are walked.
+    # 'walk=True' walks every install directory, 'refresh=True' ignores the directory cache.
+    def report(self, records, walk=False, refresh=False):
+        self.walked = 0
+        if refresh:
+            with self.lock:
+                self.directories.clear()
+
+        pending = {} # key -> (bytes of the top level files, futures of the top level sub directories)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for record in records:
+                if walk or not record.size_on_disk:
+                    pending[record.key] = self.queue_walk(record.install_dir, pool)
+            walked_sizes = {key: files_size + sum(future.result() for future in futures)
+                            for key, (files_size, futures) in pending.items()}
+
+        games = []
+        libraries = {} # (launcher, library folder) -> total
+        for record in records:
+            if record.key in walked_sizes:
+                size, source = walked_sizes[record.key], "walked"
+            else:
+                size, source = record.size_on_disk, "manifest"
+            games.append({'key': record.key, 'name': record.name, 'launcher': record.launcher,
+                          'install_dir': record.install_dir, 'size': size, 'source': source})
+            library = (record.launcher, self.library_folder(record))
+            libraries[library] = libraries.get(library, 0) + size
+
+        games.sort(key=lambda game: -game['size'])
+        self.save_cache()
+        return {
+            'games': games,
+            'libraries': [{'launcher': launcher, 'path': path, 'size': size}
+                          for (launcher, path), size in sorted(libraries.items(), key=lambda item: -item[1])],
+            'total': sum(game['size'] for game in games),
+            'walked_directories': self.walked
+        }
+
+    # Steam installs into '<library>/common/<installdir>', Epic into '<library>/<game>'.
+    def library_folder(self, record):
+        if not record.install_dir:
+            return None
+        folder = os.path.dirname(os.path.normpath(record.install_dir))
+        if record.launcher == 'Steam' and os.path.basename(folder) == 'common':
+            folder = os.path.dirname(folder)
+        return folder
+
+    # -----------------------------------------------------------------------------------------
+    # List the top level of an install directory and queue its sub directories on the pool, so every game's
+    # walk is queued before any is awaited. Deeper levels run on the worker that picked the sub directory up.
+    def queue_walk(self, path, pool):
+        try:
+            files_size, subdirectories = self.list_directory(path) if path else (0, [])
+        except OSError:
+            return 0, [] # Not installed any more, or not readable
+        return files_size, [pool.submit(self.directory_size, subdirectory) for subdirectory in subdirectories]
+
+    # Total bytes under 'path'.
+    def directory_size(self, path):
+        try:
+            files_size, subdirectories = self.list_directory(path)
+        except OSError:
+            return 0
+        return files_size + sum(self.directory_size(subdirectory) for subdirectory in subdirectories)
+
+    # Bytes of the files directly in 'path' and its sub directories, from the cache while the mtime is unchanged.
+    def list_directory(self, path):
+        mtime = os.stat(path).st_mtime_ns
+        with self.lock:
+            cached = self.directories.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        files_size = 0
+        subdirectories = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files_size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue # Removed while walking
+        with self.lock:
+            self.directories[path] = [mtime, files_size, subdirectories]
+            self.walked += 1
+        return files_size, subdirectories
+
+    # -----------------------------------------------------------------------------------------
+    def load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError) as error:
+            log.warning("Could not read disk usage cache '%s': %s", self.cache_path, error)
+            return {}
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = self.cache_path + '.tmp'
+            with self.lock:
+                with open(temp_path, 'w', encoding='utf-8') as file:
+                    json.dump(self.directories, file)
+            os.replace(temp_path, self.cache_path)
+        except OSError as os_error: # The report is still shown, only the next one is slower
+            log.warning("Could not save the disk usage cache '%s': %s", self.cache_path, os_error)
@@ -0,0 +1,219 @@
+# ----------------------------------
+#      File Name: Epic_Installs.py
+#           Date: 10/19/26
+#    Description: Finds installed Epic games without the user locating the hidden 'Manifests' folder.
+#                 1. 'LauncherInstalled.dat' (a single JSON file Epic rewrites on every install, update and
+#                    uninstall) lists each installation's AppName and install location.
+#                 2. The '.item' manifests are only joined in for what the list lacks: the display name, launch
+#                    executable and install size.
+#                 3. Both are cached by mtime. While neither 'LauncherInstalled.dat' nor the manifests folder
+#                    changed, a rescan costs two 'stat' calls whatever the size of the library; otherwise only
+#                    the '.item' files whose own mtime changed are parsed again.
+#                 4. Once 'use_manifest_cache' named a file for it (the launcher uses 'Cache/epic_manifests.json'),
+#                    the parsed manifests are also kept on disk, so the first scan after a start up parses nothing
+#                    that didn't change either.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import json                                                         # For parsing and handling JSON files
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import threading                                                    # For guarding the caches between scanner threads
+from .Tracing import span, traced                                   # Timeline spans, no-ops unless tracing is on
+
+log = logging.getLogger(__name__)
+
+# Launching Fortnite's listed executable requires going through the Epic Games Launcher, this one doesn't
+FORTNITE_LAUNCHER = "FortniteGame/Binaries/Win64/FortniteLauncher.exe"
+FORTNITE_CLIENT = "FortniteGame/Binaries/Win64/FortniteClient-Win64-Shipping_EAC_EOS.exe"
+
+installed_cache = {} # dat path -> (mtime_ns, {app name: install location})
+manifest_cache = {} # manifests folder -> (folder mtime_ns, dat mtime_ns, {file name: (mtime_ns, fields)})
+manifest_cache_path = None # File 'manifest_cache' is saved to, not saved when None
+cache_lock = threading.Lock()
+save_lock = threading.Lock() # One writer of the cache file at a time
+#
+# ------------------------------------------------------------------------------
+# Default locations of Epic's files ('C:\ProgramData\...').
+
+def program_data():
+    return os.environ.get('PROGRAMDATA', r'C:\ProgramData')
+
+def launcher_installed_path():
+    return os.path.join(program_data(), 'Epic', 'UnrealEngineLauncher', 'LauncherInstalled.dat')
+
+def default_manifests_folder():
+    return os.path.join(program_data(), 'Epic', 'EpicGamesLauncher', 'Data', 'Manifests')
+#
+# ------------------------------------------------------------------------------
+# The installations listed in 'LauncherInstalled.dat' as (file mtime, {AppName: install location}),
+# (None, None) when there is no such file.
+
+def read_launcher_installed(dat_path=None):
+    dat_path = dat_path or launcher_installed_path()
+    try:
+        mtime = os.stat(dat_path).st_mtime_ns
+    except OSError:
+        return None, None
+
+    with cache_lock:
+        cached = installed_cache.get(dat_path)
+        if cached is not None and cached[0] == mtime:
+            return cached
+    try:
+        with open(dat_path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError) as error:
+        log.warning("Could not read '%s': %s", dat_path, error)
+        return None, None
+    installations = data.get("InstallationList") if isinstance(data, dict) else None
+    if not isinstance(installations, list):
+        log.warning("Could not read '%s': no installation list", dat_path)
+        return None, None
+
+    installed = {}
+    for installation in installations:
+        if isinstance(installation, dict) and installation.get("AppName"):
+            installed[installation["AppName"]] = installation.get("InstallLocation", "")
+    with cache_lock:
+        installed_cache[dat_path] = (mtime, installed)
+    return mtime, installed
+#
+# ------------------------------------------------------------------------------
+# The '.item' manifests of a folder as {file name: (mtime_ns, fields)}. Raises FileNotFoundError.
+# 'dat_mtime' is part of the cache key, an install or update rewrites 'LauncherInstalled.dat' even when it
+# rewrites an '.item' in place (which leaves the folder's mtime alone).
+
+@traced(category="scan")
+def read_item_manifests(game_folder, dat_mtime=None):
+    folder_mtime = os.stat(game_folder).st_mtime_ns
+    with cache_lock:
+        cached = manifest_cache.get(game_folder)
+    if cached is not None and cached[0] == folder_mtime and dat_mtime is not None and cached[1] == dat_mtime:
+        return cached[2] # Nothing was installed, updated or removed since the last scan
+
+    previous = cached[2] if cached is not None else {}
+    items = {}
+    for filename in os.listdir(game_folder):
+        if not filename.endswith(".item"):
+            continue
+        item_path = os.path.join(game_folder, filename)
+        try:
+            mtime = os.stat(item_path).st_mtime_ns
+            if filename in previous and previous[filename][0] == mtime:
+                items[filename] = previous[filename]
+                continue
+            with open(item_path, 'r', encoding='utf-8') as file, span("json.load", "scan", path=item_path):
+                data = json.load(file)
+        except (OSError, ValueError) as error:
+            log.warning("Could not read '%s': %s", item_path, error)
+            continue
+        if not isinstance(data, dict):
+            log.warning("Could not read '%s': not a manifest", item_path)
+            continue
+        items[filename] = (mtime, item_fields(data))
+
+    with cache_lock:
+        manifest_cache[game_folder] = (folder_mtime, dat_mtime, items)
+    save_manifest_cache()
+    return items
+
+# The fields the launcher uses out of one '.item' manifest.
+def item_fields(data):
+    launch_executable = data.get("LaunchExecutable", "")
+    if launch_executable == FORTNITE_LAUNCHER:
+        launch_executable = FORTNITE_CLIENT
+    return {
+        'name': data.get("DisplayName", ""),
+        'app_name': data.get("AppName", ""),
+        'install_dir': data.get("InstallLocation", ""),
+        'launch_executable': launch_executable,
+        'size_on_disk': data.get("InstallSize") or 0
+    }
+#
+# ------------------------------------------------------------------------------
+# Keep the parsed manifests in 'cache_path' (a JSON file), loading what an earlier run saved there.
+
+def use_manifest_cache(cache_path):
+    global manifest_cache_path
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            saved = json.load(file)
+        loaded = {folder: (folder_mtime, dat_mtime, {filename: (mtime, fields) for filename, (mtime, fields) in items.items()})
+                  for folder, (folder_mtime, dat_mtime, items) in saved.items()}
+    except (OSError, ValueError, TypeError, AttributeError) as error: # Missing on the first run, or not what we wrote
+        if not isinstance(error, FileNotFoundError):
+            log.warning("Ignoring the Epic manifest cache '%s': %s", cache_path, error)
+        loaded = {}
+    with cache_lock:
+        manifest_cache_path = cache_path
+        for folder, cached in loaded.items():
+            manifest_cache.setdefault(folder, cached) # What this run already parsed is newer
+    return len(loaded)
+
+def save_manifest_cache():
+    with cache_lock:
+        cache_path = manifest_cache_path
+        saved = {folder: [folder_mtime, dat_mtime, {filename: [mtime, fields] for filename, (mtime, fields) in items.items()}]
+                 for folder, (folder_mtime, dat_mtime, items) in manifest_cache.items()}
+    if not cache_path:
+        return
+    with save_lock:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = cache_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(saved, file)
+            os.replace(temp_path, cache_path)
+        except OSError as os_error:
+            log.warning("Could not save the Epic manifest cache '%s': %s", cache_path, os_error)
+#
+# ------------------------------------------------------------------------------
+# A record for each installed Epic game of a manifests folder. When 'LauncherInstalled.dat' exists it decides what
+# is installed (and where), '.item' files left behind by an uninstall are ignored. Raises FileNotFoundError.
+# Installations listed only in 'LauncherInstalled.dat' are left out on purpose: it has no display name or launch
+# executable, it also lists engine versions and plugins, and their '.item' may be in another scanned folder.
+
+def epic_install_records(game_folder, launcher_executable, dat_path=None):
+    dat_mtime, installed = read_launcher_installed(dat_path)
+
+    records = []
+    for mtime, fields in read_item_manifests(game_folder, dat_mtime).values():
+        install_location = fields['install_dir']
+        if installed is not None:
+            if fields['app_name'] not in installed:
+                continue
+            install_location = installed[fields['app_name']] or install_location
+        try:
+            size_on_disk = int(fields['size_on_disk'])
+        except (TypeError, ValueError):
+            size_on_disk = 0
+        records.append({
+            'name': fields['name'],
+            'app_name': fields['app_name'],
+            'install_dir': install_location,
+            'executable': os.path.normpath(os.path.join(install_location, fields['launch_executable'])),
+            'launcher_executable': launcher_executable,
+            'size_on_disk': size_on_disk,
+            'last_updated': mtime // 1_000_000_000, # The manifest is rewritten on every install/update
+            'last_played': 0 # Epic does not store this in the manifest, see 'Game_Library.load_play_history'
+        })
+    return records
+#
+# ------------------------------------------------------------------------------
+# The manifests folders to scan: the configured paths, plus Epic's default one when 'LauncherInstalled.dat' exists.
+
+def epic_manifest_paths(configured_paths, discover=True):
+    paths = []
+    seen = set()
+    for path in configured_paths:
+        normalized = os.path.normcase(os.path.normpath(path))
+        if normalized not in seen:
+            seen.add(normalized)
+            paths.append(path)
+
+    if discover and os.path.isfile(launcher_installed_path()):
+        folder = default_manifests_folder()
+        if os.path.isdir(folder) and os.path.normcase(os.path.normpath(folder)) not in seen:
+            paths.append(folder)
+    return paths
@@ -0,0 +1,191 @@
+# ----------------------------------
+#      File Name: Game_Library.py
+#           Date: 10/19/26
+#    Description: The scanned game library and its sorted views.
+#                 1. Every game is a 'Game_Record' whose sort keys are computed once, when it is scanned.
+#                 2. Each ordering (name, size on disk, last updated, last played, launcher) is kept as its own
+#                    sorted list and updated with bisect as games are added or removed, so switching the
+#                    ordering never re-sorts the library.
+#                 3. The time a game was last played through this launcher is kept in 'play_history.json',
+#                    since Epic's manifests do not record it.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import bisect                                                       # For keeping the sorted views sorted
+import json                                                         # For parsing and handling JSON files
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import time                                                         # For time-related functions
+from .Search_Index import normalize_title                           # Same title matching as the search box
+
+log = logging.getLogger(__name__)
+
+# Orderings shown in the dashboard: ordering id -> label
+SORT_ORDERS = {
+    'name': "Name",
+    'size': "Size on Disk",
+    'last_updated': "Last Updated",
+    'last_played': "Last Played",
+    'launcher': "Launcher"
+}
+#
+# ------------------------------------------------------------------------------
+# Game Record Class
+
+class Game_Record:
+    __slots__ = ('key', 'launcher', 'name', 'app_id', 'app_name', 'install_dir', 'executable',
+                 'launcher_executable', 'art_path', 'size_on_disk', 'last_updated', 'last_played', 'sort_keys')
+
+    def __init__(self, key, launcher, fields):
+        self.key = key # Tile key ex: 'steam:4000'
+        self.launcher = launcher # 'Steam' or 'Epic Games'
+        self.name = fields['name']
+        self.app_id = fields.get('app_id')
+        self.app_name = fields.get('app_name')
+        self.install_dir = fields.get('install_dir')
+        self.executable = fields.get('executable')
+        self.launcher_executable = fields.get('launcher_executable')
+        self.art_path = fields.get('art_path') # Steam's cached library capsule, None when not downloaded
+        self.size_on_disk = fields.get('size_on_disk', 0)
+        self.last_updated = fields.get('last_updated', 0)
+        self.last_played = fields.get('last_played', 0)
+        self.sort_keys = self.compute_sort_keys()
+
+    # Computed once per record. Name breaks ties so every ordering is stable.
+    def compute_sort_keys(self):
+        name = self.name.casefold()
+        return {
+            'name': (name,),
+            'size': (-self.size_on_disk, name), # Biggest first
+            'last_updated': (-self.last_updated, name), # Newest first
+            'last_played': (-self.last_played, name), # Most recent first
+            'launcher': (self.launcher, name)
+        }
+
+    def __repr__(self):
+        return f"Game_Record({self.key!r}, {self.name!r})"
+#
+# ------------------------------------------------------------------------------
+# Game Library Class
+
+class Game_Library:
+    def __init__(self, play_history_path=None):
+        self.records = {} # key -> Game_Record
+        self.views = {order: [] for order in SORT_ORDERS} # ordering -> sorted list of (sort key, key)
+        self.play_history_path = play_history_path
+        self.play_history = self.load_play_history() # key -> unix time last launched from here
+
+    def add(self, record):
+        if record.key in self.records:
+            self.remove(record.key)
+        last_played = self.play_history.get(record.key, 0)
+        if last_played > record.last_played: # Launched from here more recently than the manifest says
+            record.last_played = last_played
+            record.sort_keys = record.compute_sort_keys()
+        self.records[record.key] = record
+        for order, view in self.views.items():
+            bisect.insort(view, (record.sort_keys[order], record.key))
+
+    def remove(self, key):
+        record = self.records.pop(key, None)
+        if record is None:
+            return
+        for order, view in self.views.items():
+            entry = (record.sort_keys[order], key)
+            index = bisect.bisect_left(view, entry)
+            if index < len(view) and view[index] == entry:
+                del view[index]
+
+    # Fill an empty library from records whose orderings are already known (the library index), no sorting needed.
+    # 'orders' maps each ordering to the positions of the records in that order.
+    def load_presorted(self, records, orders):
+        for record in records:
+            self.records[record.key] = record
+        for order, positions in orders.items():
+            self.views[order] = [(records[position].sort_keys[order], records[position].key) for position in positions]
+        for record in records: # Played from the command line since the index was written
+            if self.play_history.get(record.key, 0) > record.last_played:
+                self.add(record)
+
+    # Replace the records of one launcher with a fresh scan, only touching the ones that changed.
+    # Returns True when any game was added, removed or changed.
+    def sync(self, launcher, records):
+        scanned = {record.key: record for record in records}
+        removed = [key for key, record in self.records.items() if record.launcher == launcher and key not in scanned]
+        for key in removed:
+            self.remove(key)
+        changed = bool(removed)
+        for key, record in scanned.items():
+            current = self.records.get(key)
+            if current is None or self.record_changed(current, record):
+                self.add(record)
+                changed = True
+            else:
+                self.records[key] = record # Same sort keys, just refresh the fields
+                record.last_played = current.last_played
+                record.sort_keys = current.sort_keys
+        return changed
+
+    def record_changed(self, current, record):
+        return (current.name != record.name or current.size_on_disk != record.size_on_disk
+                or current.last_updated != record.last_updated or record.last_played > current.last_played
+                or current.art_path != record.art_path) # New art needs the tile rebuilt
+
+    # Keys of the library (optionally of one launcher) in the given ordering.
+    def ordered(self, order='name', launcher=None):
+        if launcher is None:
+            return [key for _, key in self.views[order]]
+        records = self.records
+        return [key for _, key in self.views[order] if records[key].launcher == launcher]
+
+    def get(self, key):
+        return self.records.get(key)
+
+    # Find games by app id / app name, exact title, then titles containing the query (in that order).
+    def find(self, query):
+        records = list(self.records.values())
+        exact_id = [record for record in records if query in (record.app_id, record.app_name)]
+        if exact_id:
+            return exact_id
+
+        title = normalize_title(query)
+        exact_title = [record for record in records if normalize_title(record.name) == title]
+        if exact_title:
+            return exact_title
+        return [record for record in records if title and title in normalize_title(record.name)]
+
+    # -----------------------------------------------------------------------------------------
+    # Play history
+    def mark_played(self, key, when=None):
+        record = self.records.get(key)
+        if record is None:
+            return
+        when = int(when or time.time())
+        self.play_history[key] = when
+        self.remove(key)
+        record.last_played = when
+        record.sort_keys = record.compute_sort_keys()
+        self.add(record)
+        self.save_play_history()
+
+    def load_play_history(self):
+        if not self.play_history_path or not os.path.exists(self.play_history_path):
+            return {}
+        try:
+            with open(self.play_history_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError) as error:
+            log.warning("Could not read play history '%s': %s", self.play_history_path, error)
+            return {}
+
+    # Called right before a launch: a full disk or read only folder is logged, it must not stop the game.
+    def save_play_history(self):
+        if not self.play_history_path:
+            return
+        temp_path = self.play_history_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(self.play_history, file)
+            os.replace(temp_path, self.play_history_path)
+        except OSError as error:
+            log.warning("Could not save play history '%s': %s", self.play_history_path, error)
@@ -0,0 +1,117 @@
+# ----------------------------------
+#      File Name: Image_Cache.py
+#           Date: 10/19/26
+#    Description: Memory budgeted cache for the game tile images shown on the dashboard.
+#                 Tiles are kept in two tiers:
+#                 1. Compressed tier: the processed tile (resized, blurred, rounded) encoded as lossless WebP/PNG
+#                    bytes in the contiguous arena of a 'Tile_Store'. This is cheap to hold for every game.
+#                 2. Decoded tier: the 'PhotoImage' Tkinter needs to draw the tile. These are large
+#                    (width * height * 4 bytes each), so only recently visible tiles keep one and the
+#                    least recently used ones are evicted once the byte budget is reached.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+from collections import OrderedDict                                 # For keeping the decoded tier in LRU order
+from io import BytesIO                                              # For encoding/decoding tiles in memory
+from PIL import Image, ImageTk                                      # For image processing, manipulation, and rendering in Tkinter
+from .Tile_Store import Tile_Store, encode_tile                     # Encoded tiles in one contiguous arena
+from .Tracing import span                                           # Timeline spans, no-ops unless tracing is on
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024 # Default decoded budget (64 MB, roughly 120 visible 300x450 tiles)
+#
+# ------------------------------------------------------------------------------
+# Image Cache Class
+
+class Image_Cache:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES, on_evict=None):
+        self.budget_bytes = budget_bytes # Max bytes of decoded 'PhotoImage's kept alive
+        self.on_evict = on_evict # Called with the key of a tile whose 'PhotoImage' was dropped
+
+        self.compressed = Tile_Store() # key -> encoded tile
+        self.decoded = OrderedDict() # key -> PhotoImage, oldest first
+        self.decoded_bytes = 0
+
+        # Counters reported by stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0 # 'PhotoImage's dropped to stay in the budget (not replaced or discarded tiles)
+
+    # Store a processed PIL image in the compressed tier (replaces any older version of the tile).
+    def put(self, key, image):
+        self.put_bytes(key, *encode_tile(image))
+
+    # Store already encoded tile bytes in the compressed tier.
+    def put_bytes(self, key, data, size):
+        self.discard(key)
+        self.compressed.put(key, data, size)
+
+    def has(self, key):
+        return key in self.compressed
+
+    # Return the 'PhotoImage' for the tile, decoding it from the compressed tier if it was evicted.
+    def get_photo(self, key):
+        photo = self.decoded.get(key)
+        if photo is not None:
+            self.decoded.move_to_end(key) # Mark as most recently used
+            self.hits += 1
+            return photo
+
+        data = self.compressed.get(key)
+        if data is None:
+            return None
+
+        self.misses += 1
+        with span("decode_tile", "render", key=key):
+            photo = ImageTk.PhotoImage(Image.open(BytesIO(data)))
+        self.decoded[key] = photo
+        self.decoded_bytes += self.decoded_size(self.compressed.size(key))
+        self.evict_to_budget(keep=key)
+        return photo
+
+    # Drop the decoded 'PhotoImage' of a tile but keep its compressed bytes.
+    def release(self, key):
+        photo = self.decoded.pop(key, None)
+        if photo is not None:
+            self.decoded_bytes -= self.decoded_size(self.compressed.size(key))
+            if self.on_evict:
+                self.on_evict(key)
+
+    # Remove a tile from both tiers.
+    def discard(self, key):
+        if key in self.decoded:
+            self.release(key)
+        self.compressed.discard(key)
+
+    def clear(self):
+        for key in list(self.decoded):
+            self.release(key)
+        self.compressed.clear()
+
+    # Evict least recently used 'PhotoImage's until the decoded tier fits in the budget.
+    def evict_to_budget(self, keep=None):
+        for key in list(self.decoded):
+            if self.decoded_bytes <= self.budget_bytes:
+                break
+            if key != keep: # Never evict the tile that was just requested
+                self.release(key)
+                self.evictions += 1
+
+    def decoded_size(self, size):
+        width, height = size
+        return width * height * 4 # RGBA
+
+    # Report the cache size, hit rate and eviction counts.
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "compressed_entries": len(self.compressed),
+            "compressed_bytes": self.compressed.live_bytes,
+            "arena_bytes": len(self.compressed.arena),
+            "decoded_entries": len(self.decoded),
+            "decoded_bytes": self.decoded_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,130 @@
+# ----------------------------------
+#      File Name: Instance_Server.py
+#           Date: 10/19/26
+#    Description: Keeps the launcher single instance.
+#                 1. The first GUI instance listens on a local socket ('Cache/launcher.sock' Unix domain socket,
+#                    or a per-user named pipe on Windows) with a random key stored in 'Cache/instance.key'.
+#                 2. Later invocations of 'driver.py' send their command ('show', 'launch', 'rescan') to it
+#                    and exit at once, so the running launcher's library, art caches and HTTP session are reused.
+#                 3. Received commands are handed to 'on_message' from the server thread, the caller is
+#                    responsible for passing them on to the Tk thread. Unknown commands are answered with an error,
+#                    a client that connects but sends nothing is dropped after 'IDLE_TIMEOUT'.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import getpass                                                      # For the per-user pipe name on Windows
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import sys                                                          # For checking the platform
+import threading                                                    # For the server thread
+from multiprocessing.connection import Listener, Client, AuthenticationError # Local socket/named pipe connections
+
+log = logging.getLogger(__name__)
+
+REPLY_TIMEOUT = 2 # Seconds a client waits for the running instance to answer
+IDLE_TIMEOUT = 2 # Seconds the server waits for a connected client's command
+COMMANDS = ('ping', 'show', 'launch', 'rescan', 'reload_art_pack') # What the running launcher handles
+#
+# ------------------------------------------------------------------------------
+# Address of the running instance and the path of its key file.
+
+def instance_address(current_dir):
+    if sys.platform == 'win32':
+        return r'\\.\pipe\RocketGameLauncher-' + getpass.getuser(), 'AF_PIPE'
+    return os.path.join(current_dir, 'Cache', 'launcher.sock'), 'AF_UNIX'
+
+def instance_key_path(current_dir):
+    return os.path.join(current_dir, 'Cache', 'instance.key')
+#
+# ------------------------------------------------------------------------------
+# Send a command to the running instance. Returns its reply, or None when no instance is running.
+
+def send_to_running_instance(current_dir, message):
+    address, family = instance_address(current_dir)
+    try:
+        with open(instance_key_path(current_dir), 'rb') as key_file:
+            authkey = key_file.read()
+    except OSError:
+        return None # Never started, or started before this feature existed
+
+    try:
+        with Client(address, family=family, authkey=authkey) as connection:
+            connection.send(message)
+            if connection.poll(REPLY_TIMEOUT):
+                return connection.recv()
+            return {'ok': True}
+    except (OSError, EOFError, AuthenticationError):
+        return None # Stale socket/key of an instance that is no longer running
+#
+# ------------------------------------------------------------------------------
+# Instance Server Class
+
+class Instance_Server:
+    def __init__(self, current_dir, on_message):
+        self.current_dir = current_dir
+        self.on_message = on_message # Called on the server thread with each received command (a dict)
+        self.address, self.family = instance_address(current_dir)
+        self.authkey = os.urandom(32)
+        self.listener = None
+        self.thread = None
+        self.stopped = False
+
+    # Start listening. Returns False when another instance already owns the address.
+    def start(self):
+        os.makedirs(os.path.join(self.current_dir, 'Cache'), exist_ok=True)
+        if self.family == 'AF_UNIX' and os.path.exists(self.address):
+            if send_to_running_instance(self.current_dir, {'command': 'ping'}) is not None:
+                return False
+            os.remove(self.address) # Left behind by an instance that crashed
+
+        try:
+            self.listener = Listener(self.address, family=self.family, authkey=self.authkey)
+        except OSError as os_error:
+            log.warning("Single instance server not started: %s", os_error)
+            return False
+
+        # Only publish the key once the address is ours, so a losing instance can't overwrite it
+        key_path = instance_key_path(self.current_dir)
+        file_descriptor = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(file_descriptor, 'wb') as key_file:
+            key_file.write(self.authkey)
+
+        self.thread = threading.Thread(target=self.run, name="Instance_Server", daemon=True)
+        self.thread.start()
+        return True
+
+    def run(self):
+        while not self.stopped:
+            try:
+                connection = self.listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                if self.stopped:
+                    break
+                continue # A client that failed the handshake, keep serving
+            try:
+                if not connection.poll(IDLE_TIMEOUT):
+                    log.debug("Closed a connection that sent no command")
+                    continue
+                message = connection.recv()
+                command = message.get('command') if isinstance(message, dict) else None
+                if command not in COMMANDS:
+                    connection.send({'ok': False, 'error': f"Unknown command {command!r}"})
+                    continue
+                if not self.stopped and command != 'ping':
+                    self.on_message(message)
+                connection.send({'ok': True})
+            except (OSError, EOFError):
+                pass
+            finally:
+                connection.close()
+
+    def stop(self):
+        if self.listener is None or self.stopped:
+            return
+        self.stopped = True
+        send_to_running_instance(self.current_dir, {'command': 'ping'}) # Wake the blocked accept()
+        self.listener.close()
+        try:
+            os.remove(instance_key_path(self.current_dir))
+        except OSError:
+            pass
@@ -0,0 +1,141 @@
+# ----------------------------------
+#      File Name: Launch_Warmup.py
+#           Date: 10/19/26
+#    Description: Opt-in warm up of a game's files before it starts, for installs on hard drives where the first
+#                 seconds of a launch are spent on cold reads of the executable and its asset archives.
+#                 1. When a tile is hovered (or played) its install folder is queued. A background thread picks the
+#                    executable and the largest files in the folder, up to a byte budget.
+#                 2. On Linux the kernel is asked to read them ahead ('posix_fadvise(WILLNEED)', in 8 MB ranges),
+#                    which returns at once. Elsewhere (Windows) the files are read sequentially, which leaves them
+#                    in the OS cache.
+#                 3. A game warmed recently is not warmed again, and only one game is warmed at a time.
+#                 Turned on with '[Launcher] launch_warmup = true' or the 'ROCKET_WARMUP=1' environment variable.
+#                 'Benchmarks/launch_warmup_benchmark.py' compares a cold and a warm start of a stand-in game.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import threading                                                    # For the warm up thread
+import time                                                         # For time-related functions
+
+log = logging.getLogger(__name__)
+
+READ_CHUNK = 4 * 1024 * 1024 # Bytes per read when the files have to be read through
+ADVISE_RANGE = 8 * 1024 * 1024 # Bytes per read ahead request on Linux
+MAX_FILES = 8 # Largest files warmed besides the executable
+MAX_BYTES = 2 * 1024 * 1024 * 1024 # Byte budget per game, a page cache can't hold a whole modern install
+WARM_FOR = 10 * 60 # Seconds a warmed game is not warmed again
+#
+# ------------------------------------------------------------------------------
+# Returns True when the warm up was turned on by the environment variable or the launcher settings.
+
+def warmup_enabled(settings):
+    return os.getenv('ROCKET_WARMUP', '') == '1' or settings.get('launch_warmup', False)
+
+# The files to warm for a game: its executable, then the largest files under 'install_dir' until the budget is used.
+def warmup_files(install_dir, executable=None, max_files=MAX_FILES, max_bytes=MAX_BYTES):
+    files = []
+    if executable and os.path.isfile(executable):
+        files.append((os.path.getsize(executable), executable))
+
+    largest = [] # (size, path) of every file, biggest first once sorted
+    pending = [install_dir] if install_dir and os.path.isdir(install_dir) else []
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        largest.append((entry.stat().st_size, entry.path))
+        except OSError:
+            continue # Unreadable folder, skip it
+    largest.sort(reverse=True)
+
+    chosen = [path for _, path in files]
+    total = sum(size for size, _ in files)
+    for size, path in largest:
+        if len(chosen) - len(files) >= max_files:
+            break
+        if total + size > max_bytes or path in chosen: # Too big for what is left, or the executable itself
+            continue
+        chosen.append(path)
+        total += size
+    return chosen
+
+# Bring one file into the OS page cache. Returns the bytes read (0 when the kernel was only advised).
+def warm_file(path):
+    with open(path, 'rb', buffering=0) as file:
+        if hasattr(os, 'posix_fadvise'):
+            # Advised in ranges: one call for the whole file only reads ahead a small part of it on Linux
+            size = os.fstat(file.fileno()).st_size
+            for offset in range(0, size, ADVISE_RANGE):
+                os.posix_fadvise(file.fileno(), offset, ADVISE_RANGE, os.POSIX_FADV_WILLNEED) # Queued, returns at once
+            return 0
+        buffer = bytearray(READ_CHUNK)
+        total = 0
+        while True:
+            read = file.readinto(buffer)
+            if not read:
+                return total
+            total += read
+#
+# ------------------------------------------------------------------------------
+# Launch Warmup Class
+
+class Launch_Warmup:
+    def __init__(self, warm_for=WARM_FOR):
+        self.warm_for = warm_for
+        self.condition = threading.Condition()
+        self.pending = None # (key, install dir, executable) of the game to warm next, a newer request replaces it
+        self.warmed = {} # key -> time it was warmed
+        self.running = True
+        self.warmups = 0
+        self.files_warmed = 0
+        self.bytes_read = 0
+        self.thread = threading.Thread(target=self.run, name="Launch_Warmup", daemon=True)
+        self.thread.start()
+
+    # Queue a game. Cheap enough to call on every hover.
+    def request(self, key, install_dir, executable=None):
+        with self.condition:
+            warmed_at = self.warmed.get(key)
+            if warmed_at is not None and time.monotonic() - warmed_at < self.warm_for:
+                return
+            self.pending = (key, install_dir, executable)
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.running and self.pending is None:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                key, install_dir, executable = self.pending
+                self.pending = None
+                self.warmed[key] = time.monotonic() # Set now, so hovering again while it runs doesn't queue it twice
+
+            start = time.perf_counter()
+            files = warmup_files(install_dir, executable)
+            for path in files:
+                try:
+                    self.bytes_read += warm_file(path)
+                    self.files_warmed += 1
+                except OSError as os_error:
+                    log.debug("Could not warm '%s': %s", path, os_error)
+            self.warmups += 1
+            log.debug("Warmed %d files of '%s' in %.0f ms", len(files), key, (time.perf_counter() - start) * 1000)
+
+    def stats(self):
+        return {
+            "warmups": self.warmups,
+            "files_warmed": self.files_warmed,
+            "bytes_read": self.bytes_read
+        }
@@ -0,0 +1,135 @@
+# ----------------------------------
+#      File Name: Library_Health.py
+#           Date: 10/19/26
+#    Description: Finds the games whose files are gone before the dashboard spends a tile and an art lookup on them.
+#                 1. A Steam game needs its install directory ('steamapps/common/<installdir>') and it must not be
+#                    empty (Steam leaves the folder behind on some uninstalls). An Epic game also needs its
+#                    'LaunchExecutable'.
+#                 2. Every game is checked in one batch on a thread pool (the checks are file system calls, which
+#                    release the GIL, and are slow on network and sleeping drives).
+#                 3. Results are cached in 'Cache/library_health.json' by the install directory's mtime, so a warm
+#                    check is one 'os.stat' per game. An executable removed from a sub directory of an unchanged
+#                    install directory is only noticed with 'refresh=True'.
+#                 4. 'known' answers from the cache alone, without touching the disk, so the dashboard can be built
+#                    on the Tk thread right away while 'check' runs in the background.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import json                                                         # For the result cache file
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import threading                                                    # For guarding the result cache
+import time                                                         # For timing the checks
+from concurrent.futures import ThreadPoolExecutor                   # For checking the games in parallel
+from .Tracing import span                                           # Timeline spans, no-ops unless tracing is on
+
+log = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 16
+
+# Steam records point at 'steamapps/common' when the manifest has no 'installdir'.
+def has_install_dir(record):
+    install_dir = record.install_dir
+    return bool(install_dir) and not (record.launcher == 'Steam' and os.path.basename(os.path.normpath(install_dir)) == 'common')
+#
+# ------------------------------------------------------------------------------
+# Library Health Class
+
+class Library_Health:
+    def __init__(self, cache_path=None, workers=DEFAULT_WORKERS):
+        self.cache_path = cache_path
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.results = self.load_cache() # install directory -> [mtime_ns, executable, problem or None]
+        self.last_check = {'games': 0, 'broken': 0, 'cached': 0, 'seconds': 0.0}
+
+    # What is wrong with each broken game: key -> problem ex: 'Install folder missing'. Healthy games are left out.
+    def check(self, records, refresh=False):
+        start = time.perf_counter()
+        records = list(records)
+        with span("library_health", "scan", games=len(records)) as health_span:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="Library_Health") as pool:
+                problems = list(pool.map(lambda record: self.check_record(record, refresh), records))
+            broken = {record.key: problem for record, (problem, _) in zip(records, problems) if problem}
+            cached = sum(1 for _, from_cache in problems if from_cache)
+            health_span.set(broken=len(broken), cached=cached)
+
+        self.last_check = {'games': len(records), 'broken': len(broken), 'cached': cached,
+                           'seconds': time.perf_counter() - start}
+        if cached < len(records):
+            self.save_cache()
+        for key, problem in broken.items():
+            log.debug("'%s' looks uninstalled: %s", key, problem)
+        log.info("Checked %d games in %.0fms, %d look uninstalled", len(records), self.last_check['seconds'] * 1000, len(broken))
+        return broken
+
+    # The problems of the last check of each game, from memory: key -> problem. Games never checked are left out.
+    def known(self, records):
+        broken = {}
+        with self.lock:
+            for record in records:
+                if not has_install_dir(record):
+                    broken[record.key] = "No install folder in the manifest"
+                    continue
+                cached = self.results.get(record.install_dir)
+                if cached is not None and cached[1] == record.executable and cached[2]:
+                    broken[record.key] = cached[2]
+        return broken
+
+    # Worker: returns (problem or None, whether the cached result was used).
+    def check_record(self, record, refresh=False):
+        install_dir = record.install_dir
+        if not has_install_dir(record):
+            return "No install folder in the manifest", False
+        try:
+            mtime = os.stat(install_dir).st_mtime_ns
+        except OSError:
+            with self.lock:
+                self.results[install_dir] = [None, record.executable, "Install folder missing"] # For 'known'
+            return "Install folder missing", False
+
+        with self.lock:
+            cached = self.results.get(install_dir)
+        if not refresh and cached is not None and cached[0] == mtime and cached[1] == record.executable:
+            return cached[2], True
+
+        problem = None
+        try:
+            with os.scandir(install_dir) as entries:
+                if next(entries, None) is None:
+                    problem = "Install folder is empty"
+        except OSError:
+            problem = "Install folder not readable"
+        if problem is None and record.executable and not os.path.isfile(record.executable):
+            problem = "Executable missing"
+        with self.lock:
+            self.results[install_dir] = [mtime, record.executable, problem]
+        return problem, False
+
+    def stats(self):
+        with self.lock:
+            return dict(self.last_check, cached_folders=len(self.results))
+
+    # -----------------------------------------------------------------------------------------
+    def load_cache(self):
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        with self.lock:
+            results = dict(self.results)
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = self.cache_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(results, file)
+            os.replace(temp_path, self.cache_path)
+        except OSError as os_error:
+            log.warning("Could not save the library health cache '%s': %s", self.cache_path, os_error)
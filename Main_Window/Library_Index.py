@@ -0,0 +1,205 @@
+# ----------------------------------
+#      File Name: Library_Index.py
+#           Date: 10/19/26
+#    Description: On-disk cache of the scanned game library ('Cache/library_index.bin').
+#                 Written after every scan, opened with mmap at start up so the dashboard and the command line
+#                 can list and sort the library without opening a single manifest.
+#                 File layout (little endian):
+#                 1. Header: magic 'RGLI', version, launcher count, record count, string table offset, config mtime.
+#                 2. Launcher table: (name, executable) string references, one per launcher section.
+#                 3. Records: fixed width, string fields are (offset, length) references into the string table.
+#                 4. Sort tables: one array of record numbers per ordering in 'SORT_ORDERS', already sorted.
+#                 5. String table: UTF-8 strings, each distinct string stored once.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import logging                                                      # For the module logger
+import mmap                                                         # For mapping the index instead of reading it
+import os                                                           # For interacting with the current operating sys
+import struct                                                       # For the fixed width binary layout
+from .Game_Library import Game_Record, SORT_ORDERS                  # Record type of the scanned library
+
+log = logging.getLogger(__name__)
+
+INDEX_MAGIC = b'RGLI'
+INDEX_VERSION = 3 # Bump when the layout changes, older indexes are then ignored and the library rescanned
+LAUNCHERS = ('Steam', 'Epic Games') # Stored as one byte per record
+STRING_FIELDS = ('key', 'name', 'app_id', 'app_name', 'install_dir', 'executable', 'launcher_executable', 'art_path')
+NUMBER_FIELDS = ('size_on_disk', 'last_updated', 'last_played')
+RECORD_FIELDS = ('key', 'launcher', 'name', 'app_id', 'app_name', 'install_dir', 'executable',
+                 'launcher_executable', 'art_path', 'size_on_disk', 'last_updated', 'last_played')
+NO_STRING = 0xFFFFFFFF # Length of a string reference that is None
+
+HEADER = struct.Struct('<4sHHIIq') # magic, version, launcher count, record count, string table offset, config mtime
+LAUNCHER_ENTRY = struct.Struct('<' + 'II' * 2) # name, executable as (offset into the string table, length) pairs
+RECORD = struct.Struct('<B3x' + 'II' * len(STRING_FIELDS) + 'Qqq') # launcher, string fields, number fields
+SORT_ENTRY = struct.Struct('<I') # record number
+#
+# ------------------------------------------------------------------------------
+# Writes every record of the library plus each launcher's executable to the index (atomically).
+
+def save_library_index(index_path, library, config):
+    strings = bytearray()
+    string_refs = {} # string -> (offset, length), so repeated strings (launcher exes) are stored once
+
+    def string_ref(value):
+        if value is None:
+            return (0, NO_STRING)
+        if value not in string_refs:
+            data = value.encode('utf-8')
+            string_refs[value] = (len(strings), len(data))
+            strings.extend(data)
+        return string_refs[value]
+
+    launchers = list(config.launchers.items())
+    keys = list(library.records)
+    record_numbers = {key: number for number, key in enumerate(keys)}
+
+    body = bytearray()
+    for name, launcher in launchers:
+        body += LAUNCHER_ENTRY.pack(*string_ref(name), *string_ref(launcher.executable))
+    for key in keys:
+        record = library.records[key]
+        refs = []
+        for field in STRING_FIELDS:
+            refs.extend(string_ref(getattr(record, field)))
+        numbers = [getattr(record, field) or 0 for field in NUMBER_FIELDS]
+        body += RECORD.pack(LAUNCHERS.index(record.launcher), *refs, *numbers)
+    for order in SORT_ORDERS: # The library's views are already sorted, just store their record numbers
+        for sort_key in library.ordered(order):
+            body += SORT_ENTRY.pack(record_numbers[sort_key])
+
+    strings_offset = HEADER.size + len(body)
+    header = HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(launchers), len(keys), strings_offset, config.mtime)
+
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    temp_path = index_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(header)
+            file.write(body)
+            file.write(strings)
+        os.replace(temp_path, index_path)
+    except OSError as os_error: # On Windows the index can't be replaced while another process has it mapped
+        log.warning("Could not write library index '%s': %s", index_path, os_error)
+#
+# ------------------------------------------------------------------------------
+# Opens the index. Returns a 'Library_Index_View', or None when it is missing, damaged or from another version.
+
+def load_library_index(index_path):
+    try:
+        with open(index_path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError): # ValueError: empty file
+        return None
+    view = Library_Index_View(buffer)
+    if not view.valid():
+        view.close()
+        return None
+    return view
+
+# Every record of the index as a 'Game_Record', in stored order.
+def index_records(view):
+    records = []
+    for number in range(view.record_count):
+        fields = view.record(number)
+        records.append(Game_Record(fields['key'], fields['launcher'], fields))
+    return records
+#
+# ------------------------------------------------------------------------------
+# Library Index View Class. 'valid()' checks the whole file once when it is opened (every reference, and one decode of
+# the string table), after that fields are read out of the mapped buffer when they are asked for. The launcher and
+# the command line both build every record with 'index_records' and then close the map, the index saves the
+# manifest parsing and sorting, not the record reads.
+
+class Library_Index_View:
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.record_count = 0
+        self.launcher_count = 0
+        self.config_mtime = None
+
+    def valid(self):
+        if len(self.buffer) < HEADER.size:
+            return False
+        magic, version, self.launcher_count, self.record_count, self.strings_offset, self.config_mtime = HEADER.unpack_from(self.buffer, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            return False
+        self.records_offset = HEADER.size + self.launcher_count * LAUNCHER_ENTRY.size
+        self.sort_offset = self.records_offset + self.record_count * RECORD.size
+        if not self.sort_offset + len(SORT_ORDERS) * self.record_count * SORT_ENTRY.size == self.strings_offset <= len(self.buffer):
+            return False
+        return self.valid_references()
+
+    # Every string reference inside the string table and on character boundaries, every launcher and record number
+    # in range. One pass at load time, so a damaged index is rejected instead of raising while it is read.
+    def valid_references(self):
+        strings = self.buffer[self.strings_offset:]
+        try:
+            strings.decode('utf-8')
+        except UnicodeDecodeError:
+            return False
+        size = len(strings)
+
+        def valid_string(offset, length):
+            if length == NO_STRING:
+                return True
+            end = offset + length
+            return end <= size and all(at == size or strings[at] & 0xC0 != 0x80 for at in (offset, end)) # Not mid character
+
+        for values in LAUNCHER_ENTRY.iter_unpack(self.buffer[HEADER.size:self.records_offset]):
+            if not (valid_string(*values[0:2]) and valid_string(*values[2:4])):
+                return False
+        for values in RECORD.iter_unpack(self.buffer[self.records_offset:self.sort_offset]):
+            if values[0] >= len(LAUNCHERS):
+                return False
+            if not all(valid_string(values[i], values[i + 1]) for i in range(1, 1 + len(STRING_FIELDS) * 2, 2)):
+                return False
+        sort_tables = self.buffer[self.sort_offset:self.strings_offset]
+        return all(number < self.record_count for (number,) in SORT_ENTRY.iter_unpack(sort_tables))
+
+    def close(self):
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def string(self, ref):
+        offset, length = ref
+        if length == NO_STRING:
+            return None
+        start = self.strings_offset + offset
+        return self.buffer[start:start + length].decode('utf-8')
+
+    def launchers(self):
+        launchers = {}
+        for number in range(self.launcher_count):
+            values = LAUNCHER_ENTRY.unpack_from(self.buffer, HEADER.size + number * LAUNCHER_ENTRY.size)
+            launchers[self.string(values[0:2])] = self.string(values[2:4])
+        return launchers
+
+    def launcher(self, number):
+        return LAUNCHERS[self.buffer[self.records_offset + number * RECORD.size]]
+
+    def name(self, number):
+        values = RECORD.unpack_from(self.buffer, self.records_offset + number * RECORD.size)
+        name_field = 1 + STRING_FIELDS.index('name') * 2
+        return self.string(values[name_field:name_field + 2])
+
+    # All fields of one record as a dict.
+    def record(self, number):
+        values = RECORD.unpack_from(self.buffer, self.records_offset + number * RECORD.size)
+        fields = {'launcher': LAUNCHERS[values[0]]}
+        for i, field in enumerate(STRING_FIELDS):
+            fields[field] = self.string(values[1 + i * 2:3 + i * 2])
+        for i, field in enumerate(NUMBER_FIELDS):
+            fields[field] = values[1 + len(STRING_FIELDS) * 2 + i]
+        return fields
+
+    # Record numbers in a stored ordering, read as one slice of the mapped buffer.
+    def ordered(self, order='name'):
+        start = self.sort_offset + list(SORT_ORDERS).index(order) * self.record_count * SORT_ENTRY.size
+        return struct.unpack_from(f'<{self.record_count}I', self.buffer, start)
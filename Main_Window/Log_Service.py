@@ -0,0 +1,102 @@
+# ----------------------------------
+#      File Name: Log_Service.py
+#           Date: 10/19/26
+#    Description: Logging for the launcher. Every module logs through its own 'logging.getLogger(__name__)'.
+#                 1. Records are put on a queue by a 'QueueHandler' and written to the console and
+#                    'Logs/launcher.log' by a 'QueueListener' thread, so the Tk thread never waits on console
+#                    or disk I/O.
+#                 2. The most recent records are also kept in a bounded in-memory ring buffer ('recent_events'),
+#                    formatted only when they are read.
+#                 3. The level comes from '[Launcher] log_level' in 'config.ini' (or the 'ROCKET_LOG_LEVEL'
+#                    environment variable). Per game and per rebuild detail is logged at DEBUG, so at the default
+#                    INFO level those calls return before formatting anything.
+#                 Without 'setup_logging' (the headless command line) only warnings and errors reach stderr.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import logging                                                      # For the loggers, handlers and records
+import logging.handlers                                             # For the queue and rotating file handlers
+import os                                                           # For interacting with the current operating sys
+import queue                                                        # For handing records to the writer thread
+from collections import deque                                       # For the ring buffer of recent records
+
+LOGGER_NAME = 'Main_Window' # Parent of every module logger ('Main_Window.Class_Dependencies', ...)
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+RING_SIZE = 500 # Recent records kept in memory
+LOG_FILE_BYTES = 1024 * 1024 # 'launcher.log' is rotated at this size
+LOG_FILE_BACKUPS = 3
+
+listener = None
+ring_handler = None
+#
+# ------------------------------------------------------------------------------
+# Ring Buffer Handler Class. Keeps the last 'capacity' records, appending is all 'emit' does.
+
+class Ring_Buffer_Handler(logging.Handler):
+    def __init__(self, capacity=RING_SIZE):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def emit(self, record):
+        self.records.append(record)
+
+    # The buffered records, oldest first, formatted now.
+    def lines(self, level=logging.NOTSET):
+        return [self.format(record) for record in list(self.records) if record.levelno >= level]
+#
+# ------------------------------------------------------------------------------
+# Configure the launcher's loggers once. 'level' is a name ('DEBUG', 'info', ...) or a number.
+# Returns the ring buffer handler.
+
+def setup_logging(log_dir=None, level="INFO", console=True):
+    global listener, ring_handler
+    if listener is not None:
+        return ring_handler
+
+    level = os.environ.get('ROCKET_LOG_LEVEL', level)
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int): # Unknown level name
+            level = logging.INFO
+
+    sinks = []
+    formatter = logging.Formatter(LOG_FORMAT)
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        sinks.append(console_handler)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(os.path.join(log_dir, 'launcher.log'),
+                                                            maxBytes=LOG_FILE_BYTES,
+                                                            backupCount=LOG_FILE_BACKUPS,
+                                                            encoding='utf-8'
+                                                            )
+        file_handler.setFormatter(formatter)
+        sinks.append(file_handler)
+
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, *sinks, respect_handler_level=True)
+    listener.start()
+
+    ring_handler = Ring_Buffer_Handler()
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.addHandler(ring_handler)
+    logger.propagate = False
+    return ring_handler
+
+# Write out every queued record and stop the writer thread (on exit).
+def shutdown_logging():
+    global listener
+    if listener is not None:
+        listener.stop()
+        listener = None
+
+# The most recent records as formatted lines, oldest first.
+def recent_events(level=logging.NOTSET):
+    if ring_handler is None:
+        return []
+    return ring_handler.lines(level)
@@ -21,12 +21,35 @@ from PIL import Image, ImageTk                                      # For image
 # Misc Statement(s)
 import os                                                           # For interacting with the current operating sys
 import sys                                                          # For accessing system-specific functions
+import logging                                                      # For the module logger
 import winreg                                                       # For accessing and modifying Windows registry
-from collections import OrderedDict                                 # For sorting dictionary
+import threading                                                    # For revalidating the library in the background
+from dotenv import load_dotenv                                      # For loading the .env file for API access
 from ctypes import windll, byref, sizeof, c_int                     # To change the title bar color
 
 # Import Steam_Launcher functions
 from .Class_Dependencies import *                                   # Import all functions/methods from the 'Class_Dependencies.py' file
+from .Image_Cache import Image_Cache                                # Memory budgeted cache for the game tile images
+from .Tile_Store import encode_tile                                 # Encodes processed tiles for the image cache
+from .Tile_Prefetcher import Tile_Prefetcher                        # Prepares tile art ahead of the scroll position
+from .Config_Service import Config_Service                          # Cached, atomic access to 'config.ini'
+from .Search_Index import Search_Index                              # Trigram index for searching the game library
+from .Game_Library import Game_Library, SORT_ORDERS                 # Scanned games and their sorted views
+from .Stall_Watchdog import Stall_Watchdog, watchdog_enabled        # Opt-in main loop stall detection
+from .Library_Index import save_library_index, load_library_index, index_records # Memory mapped library index
+from .Instance_Server import Instance_Server                        # Receives commands from later invocations
+from .Disk_Usage import Disk_Usage_Analyzer, format_size            # Per game/library size report
+from .Launch_Warmup import Launch_Warmup, warmup_enabled            # Opt-in page cache warm up before a launch
+from .Art_Resolver import Art_Resolver, default_art_sources         # Hedged cover art lookup across several sources
+from .Art_Pack import Art_Pack, import_art_pack                     # Offline covers imported in bulk as ready tiles
+from .Library_Health import Library_Health                          # Batched check for uninstalled games
+from .Epic_Installs import use_manifest_cache                       # Parsed Epic manifests kept across runs
+from .UI_Dispatcher import UI_Dispatcher                            # Hands background results to the Tk thread per frame
+from .Metrics import metrics, increment, process_rss                # Live counters for the diagnostics panel
+from .Tracing import traced, instant, start_tracing_from_environment, stop_tracing # Chrome trace of start up/refresh
+from .Log_Service import setup_logging, shutdown_logging, recent_events # Queued, leveled logging to the console and 'Logs/'
+
+log = logging.getLogger(__name__)
 
 
 # Main Window Class
@@ -66,108 +89,292 @@ class Main_Window:
         
         # read config and set vars
         self.config_path = os.path.join(self.current_dir, 'Config', 'config.ini')
-        path = read_config_file(self.config_path)
+        self.config_service = Config_Service(self.config_path) # Parsed once, re-read only when the file changes
+        self.config_flush_job = None
+        config = self.config_service.get()
+        setup_logging(os.path.join(self.current_dir, 'Logs'), config.settings['log_level']) # 'Logs/launcher.log'
+        start_tracing_from_environment(os.path.join(self.current_dir, 'Logs')) # 'ROCKET_TRACE=1' writes 'Logs/trace.json'
+
+        # Opt-in main loop watchdog, started before the first dashboard build so that stall is logged too
+        self.watchdog = None
+        if watchdog_enabled(config.settings):
+            self.watchdog = Stall_Watchdog(self.root,
+                                           os.path.join(self.current_dir, 'Logs', 'stalls.log'),
+                                           threshold_ms=config.settings['watchdog_threshold_ms']
+                                           )
+            self.watchdog.start()
+
+        # Opt-in warm up of a game's files when its tile is hovered or played
+        self.warmup = Launch_Warmup() if warmup_enabled(config.settings) else None
+        self.warmup_job = None # Pending hover warm up, cancelled when the pointer leaves the tile first
         
         # Retrieve the API key from the environment variable
         load_dotenv()
         self.api_key = os.getenv('GIANT_BOMB_API_KEY') # Set the API key to a global variable
+        self.giant_bomb_url = giant_bomb_url(config.settings['giant_bomb_url']) # 'GIANT_BOMB_URL' points it at a stand-in server
 
-        # Set global launcher paths and executables to the value in the config file
-        self.steam_path1_current = path["Steam"]["path1"]
-        self.steam_path2_current = path["Steam"]["path2"]
-        self.steam_executable_current = path["Steam"]["executable"]
+        # Set global launcher executables to the value in the config file
+        self.steam_executable_current = config.launcher("Steam").executable
+        self.epic_executable_current = config.launcher("Epic Games").executable
 
-        self.epic_path1_current = path["Epic Games"]["path1"]
-        self.epic_executable_current = path["Epic Games"]["executable"]
-
-        # This is for future implementation of Epic Games, Battle.NET, and Xbox
-        #battle_path1_current = path["Battle.NET"]["path1"]
-        #battle_path2_current = path["Battle.NET"]["path2"]
-        #self.battle_executable_path = path["Battle.NET"]["executable"]
-        #xbox_path1_current = path["Xbox"]["path1"]
-        #xbox_path2_current = path["Xbox"]["path2"]
-        #self.xbox_executable_path = path["Xbox"]["executable"]
+        # This is for future implementation of Battle.NET, and Xbox
+        #self.battle_executable_path = config.launcher("Battle.NET").executable
+        #self.xbox_executable_path = config.launcher("Xbox").executable
 
         # Create stringvar for UI
-        self.steam_path1 = StringVar()
-        self.steam_path2 = StringVar()
         self.steam_exe = StringVar()
-
-        self.epic_path1 = StringVar()
         self.epic_exe = StringVar()
         
-        # This is for future implementation of Epic Games, Battle.NET, and Xbox
-        #self.battle_path1 = StringVar()
-        #self.battle_path2 = StringVar()
+        # This is for future implementation of Battle.NET, and Xbox
         #self.battle_exe = StringVar()
-        #self.xbox_path1 = StringVar()
-        #self.xbox_path2 = StringVar()
         #self.xbox_exe = StringVar()
 
         # set stringvar equal to read in vars
-        self.steam_path1.set(self.steam_path1_current)
-        self.steam_path2.set(self.steam_path2_current)
         self.steam_exe.set(self.steam_executable_current)
-
-        # This is for future implementation of Epic Games, Battle.NET, and Xbox
-        self.epic_path1.set(self.epic_path1_current)
         self.epic_exe.set(self.epic_executable_current)
-        
-        #self.battle_path1.set(battle_path1_current)
-        #self.battle_path2.set(battle_path2_current)
-        
-        #self.xbox_path1.set(xbox_path1_current)
-        #self.xbox_path2.set(xbox_path2_current)
+
+        # One stringvar per library path of each launcher, any number of paths is supported
+        self.path_vars = {}
+        for section in ("Steam", "Epic Games"):
+            self.path_vars[section] = [StringVar(value=path) for path in config.launcher(section).paths]
         
         # Create arrays to store games in
         self.paths_dict = None
         self.steam_games = {}
         self.epic_games = {}
 
+        # Every scanned game with its sort keys, kept across rescans so only changed games are re-sorted
+        self.library = Game_Library(os.path.join(self.current_dir, 'Config', 'play_history.json'))
+        self.library_index_path = os.path.join(self.current_dir, 'Cache', 'library_index.bin')
+        self.rescan_on_build = True # False when the dashboard is built from the library index or a background scan
+        self.library_health = Library_Health(os.path.join(self.current_dir, 'Cache', 'library_health.json'))
+        use_manifest_cache(os.path.join(self.current_dir, 'Cache', 'epic_manifests.json'))
+        self.broken_games = {} # tile key -> why the game looks uninstalled, last known when the tiles are built
+        self.checked_broken_games = None # Results of a background check the dashboard is being rebuilt for
+        self.sort_order = 'name'
+        self.sort_var = StringVar(value=SORT_ORDERS[self.sort_order])
+
         self.Update_Steam = False
         self.Update_Epic = False
 
-        self.create_dashboard()
+        # Tile images are only decoded for recently visible tiles, the rest are kept compressed
+        self.image_cache = Image_Cache(config.settings['image_cache_mb'] * 1024 * 1024, on_evict=self.clear_tile_image)
+        self.tiles = {} # tile key -> {'canvas', 'image_item', 'shown', 'row', 'column'}
+        self.row_tiles = {'steam': [], 'epic': []} # tile keys of each row in display order
+        self.row_visible = {'steam': [], 'epic': []} # tile keys of each row that pass the search filter
+        self.row_windows = {'steam': (0, 0), 'epic': (0, 0)} # (first, last) index of the tiles in view of each row
+        self.decode_ahead_pending = set() # rows with a 'decode_ahead' waiting for idle time
+        self.play_photo = None # Play button icon shared by every tile
+        self.icons = {} # icon name -> CTkImage holding its light and dark variant
+        self.theme_job = None # Pending 'restyle_tiles' batch of a mode switch
+
+        # Search box text, kept across dashboard rebuilds
+        self.search_index = Search_Index()
+        self.search_var = StringVar()
+        self.search_var.trace_add("write", lambda *args: self.apply_search_filter())
+
+        # Results of background threads reach the Tk thread through the dispatcher, one pump per frame
+        self.dispatcher = UI_Dispatcher(self.root)
+        self.register_ui_handlers()
+
+        # Later 'driver.py' invocations forward their command here instead of starting a second launcher
+        self.instance_server = Instance_Server(self.current_dir, lambda message: self.dispatcher.post('instance_message', message))
+        self.instance_server.start()
+
+        # Tile art is found by racing the art sources, then processed on background workers in the order the rows are scrolled
+        self.tile_sources = {} # tile key -> Game_Record, taken on the Tk thread so the workers never read the library
+        art_folder = config.settings['art_folder'] or os.path.join(self.current_dir, 'Art')
+        self.art_resolver = Art_Resolver(default_art_sources(self.steam_executable_current, art_folder, self.api_key,
+                                                             self.giant_bomb_url, config.settings['art_http_sources']),
+                                         budget_ms=config.settings['art_budget_ms']
+                                         )
+        self.art_pack = Art_Pack(os.path.join(self.current_dir, 'Cache')) # Imported covers, used before any art source
+        self.art_pack_importing = False
+        self.prefetcher = Tile_Prefetcher(self.prepare_tile_art,
+                                          lambda key, data, size: self.dispatcher.post('tile_art', (key, data, size)),
+                                          self.image_cache.has
+                                          )
+
+        # Disk usage report, measured on a background thread
+        self.disk_usage = Disk_Usage_Analyzer(os.path.join(self.current_dir, 'Cache', 'disk_usage.json'))
+        self.disk_usage_running = False
+        self.disk_usage_window = None
+
+        # Settings window, created on first open and hidden/shown after that
+        self.settings_Window = None
+        self.path_previews = {} # (launcher section, path) -> result of its background check ex: '12 games found'
+        self.path_checks = {} # (launcher section, path index) -> candidate path being checked
+        self.settings_status_labels = {} # launcher section -> label showing the last candidate's check
+
+        # Diagnostics panel, toggled from the menu bar. Every component's own counters are read when it refreshes.
+        self.diagnostics_window = None
+        self.diagnostics_job = None
+        self.register_metric_sources()
+        self.dispatcher.start()
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close) # Save staged changes before exiting
+
+        # Warm start: build the dashboard from the library index, then check the manifests in the background
+        index_loaded = self.load_cached_library()
+        self.create_dashboard(rescan=not index_loaded)
+        if index_loaded:
+            self.revalidate_library()
+
+    def on_close(self):
+        self.flush_config()
+        if self.diagnostics_job is not None:
+            self.root.after_cancel(self.diagnostics_job)
+        self.dispatcher.stop() # Releases workers blocked on a full queue
+        self.instance_server.stop()
+        self.prefetcher.stop()
+        self.art_resolver.stop()
+        self.art_pack.close()
+        if self.watchdog:
+            self.watchdog.stop()
+        if self.warmup:
+            self.warmup.stop()
+        self.root.destroy()
+        stop_tracing() # Written before logging stops, so where it went is logged
+        shutdown_logging() # Writes out the queued records
 
-    # Function to load the config file to use for the Listbox of Games.
-    def load_config(self):
-        print(f"Reading in data from config file...")
-        paths_data = read_config_file(self.config_path)
-        section_vars = create_section_vars(paths_data)
-        self.paths_dict = store_path_vars(section_vars)
-
-        # Add games to array from Steam games
-        steam_paths = self.paths_dict['Steam']
-        if steam_paths['path1']:
-            try:
-                self.steam_games.update(get_steam_games(steam_paths['path1']))
-            except ValueError as val_err:
-                val_err = "[Value Error] dictionary update sequence element #0 has length 1; 2 is required"
-                messagebox.showerror("Error", val_err)
+# -----------------------------------------------------------------------------------------
+    # Commands forwarded by later invocations and results of background work arrive on other threads,
+    # Tk is only touched from these handlers
+    def register_ui_handlers(self):
+        dispatcher = self.dispatcher
+        dispatcher.register('instance_message', self.handle_instance_message)
+        dispatcher.register('library_scan', lambda result: self.apply_library_scan(*result),
+                            coalesce=lambda result: 'latest') # Only the newest scan matters
+        dispatcher.register('tile_art', self.apply_tile_art, coalesce=lambda result: result[0], batch=True)
+        dispatcher.register('disk_usage', self.show_disk_usage_report, coalesce=lambda report: 'latest')
+        dispatcher.register('library_health', self.apply_library_health, coalesce=lambda broken_games: 'latest')
+        dispatcher.register('path_preview', lambda result: self.apply_path_preview(*result))
+        dispatcher.register('art_pack', lambda result: self.apply_art_pack_import(*result))
+
+    def handle_instance_message(self, message):
+        command = message.get('command')
+        log.info("Received '%s' from another instance", command)
+        if command == 'show':
+            self.show_window()
+        elif command == 'rescan':
+            self.create_dashboard()
+        elif command == 'reload_art_pack':
+            self.reload_art_pack()
+        elif command == 'launch':
+            matches = self.library.find(message.get('game', ''))
+            if len(matches) == 1:
+                self.launch_record(matches[0])
+            else:
+                self.show_window()
+                messagebox.showerror("Launcher", f"{len(matches)} games match '{message.get('game', '')}'")
 
-        if steam_paths['path2']:
-            try:
-                self.steam_games.update(get_steam_games(steam_paths['path2']))
-            except ValueError as val_err:
-                val_err = "[Value Error] dictionary update sequence element #0 has length 1; 2 is required"
-                messagebox.showerror("Error", val_err)
+    def show_window(self):
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
 
-        if not steam_paths['path1'] and not steam_paths['path2']: # Clear the array if there is nothing in the config for Steam
-            self.steam_games.clear() 
+    def launch_record(self, record):
+        if record.launcher == 'Steam':
+            self.play_game(record.key, launch_steam_game, record.app_id, self.steam_executable_current, record.name)
+        else:
+            self.play_game(record.key, launch_epic_game, record.executable, record.name, record.launcher_executable)
 
-        # Add games to array from Epic games
-        epic_paths = self.paths_dict['Epic Games']
-        launcher_executable_path = self.paths_dict['Epic Games']['executable']
+# -----------------------------------------------------------------------------------------
+    # Fill the library from the memory mapped index. Returns False when there is no index for the current config.
+    @traced(category="scan")
+    def load_cached_library(self):
+        config = self.config_service.get()
+        index = load_library_index(self.library_index_path)
+        if index is None:
+            return False
+        with index:
+            if index.config_mtime != config.mtime: # Library paths may have changed since it was written
+                return False
+            orders = {order: index.ordered(order) for order in SORT_ORDERS}
+            self.library.load_presorted(index_records(index), orders)
+        log.info("Loaded %d games from the library index", len(self.library.records))
+        return True
+
+    # Re-read the manifests on a background thread, the dashboard is only rebuilt if something changed
+    def revalidate_library(self):
+        config = self.config_service.get()
+
+        def scan():
+            errors = []
+            library_records = scan_library_records(config, on_error=errors.append)
+            self.dispatcher.post('library_scan', (config, library_records, errors))
+
+        threading.Thread(target=scan, name="Library_Revalidation", daemon=True).start()
+
+    # Check every game's files on a background thread, the Tk thread only gets the results
+    def check_library_health(self):
+        records = list(self.library.records.values())
+
+        def check():
+            self.dispatcher.post('library_health', self.library_health.check(records))
+
+        threading.Thread(target=check, name="Library_Health_Check", daemon=True).start()
+
+    def apply_library_health(self, broken_games):
+        if self.config_service.get().settings['broken_games'] == 'show' or broken_games == self.broken_games:
+            return # The tiles already show these results
+        log.info("%d games look uninstalled now, rebuilding dashboard...", len(broken_games))
+        self.checked_broken_games = broken_games
+        self.create_dashboard(rescan=False)
+
+    @traced(category="scan")
+    def apply_library_scan(self, config, library_records, errors):
+        for message in errors:
+            messagebox.showerror("Error", message)
+        changed = [self.library.sync(launcher, records) for launcher, records in library_records.items()]
+        if any(changed):
+            log.info("Library changed since the index was written, rebuilding dashboard...")
+            save_library_index(self.library_index_path, self.library, config)
+            self.create_dashboard(rescan=False)
 
-        if epic_paths['path1']:
-            try:
-                self.epic_games.update(get_epic_games(epic_paths['path1'], launcher_executable_path))
-            except ValueError as val_err:
-                val_err = "[Value Error] dictionary update sequence element #0 has length 1; 2 is required"
-                messagebox.showerror("Error", val_err)
-        
-        if not epic_paths['path1']: # Clear the array if there is nothing in the config for Epic Games
-            self.epic_games.clear()
+    # Function to load the config file to use for the Listbox of Games.
+    @traced(category="scan")
+    def load_config(self):
+        log.debug("Reading in data from config file...")
+        config = self.config_service.get() # Cached, only re-parsed if 'config.ini' changed on disk
+        self.paths_dict = config.launchers
+
+        # Add games to the library from every Steam and Epic Games library path
+        if self.rescan_on_build:
+            library_records = scan_library_records(config, on_error=lambda message: messagebox.showerror("Error", message))
+            for launcher, records in library_records.items():
+                self.library.sync(launcher, records) # Only changed games are re-sorted
+            save_library_index(self.library_index_path, self.library, config) # Lets the next start up skip the scan
+
+        # Games whose install folder or executable is gone are hidden or marked before any tile or art work. The
+        # last known results are used right away, the check itself runs in the background and rebuilds if they changed.
+        broken_games_mode = config.settings['broken_games']
+        if broken_games_mode == 'show':
+            self.broken_games = {}
+        elif self.checked_broken_games is not None: # Rebuilding for the results of a check, no need for another
+            self.broken_games, self.checked_broken_games = self.checked_broken_games, None
+        else:
+            self.broken_games = self.library_health.known(self.library.records.values())
+            self.check_library_health()
+        hidden = self.broken_games if broken_games_mode == 'hide' else {}
+
+        # Arrays of games in the current sort order ex: '{'Garrys Mod': '4000'}'
+        self.steam_games = {}
+        for key in self.library.ordered(self.sort_order, 'Steam'):
+            if key in hidden:
+                continue
+            record = self.library.get(key)
+            self.steam_games[record.name] = record.app_id
+
+        self.epic_games = {}
+        for key in self.library.ordered(self.sort_order, 'Epic Games'):
+            if key in hidden:
+                continue
+            record = self.library.get(key)
+            self.epic_games[record.name] = {
+                "Executable": record.executable,
+                "Launcher Executable": record.launcher_executable
+            }
 
     def get_windows_theme(self): # returns window's current theme and sets self.color to it and returns it 
         # Path to the registry key
@@ -191,14 +398,22 @@ class Main_Window:
                 return self.color
 
         except Exception as e:
-            print(f"Error accessing the registry: {e}")
+            log.warning("Error accessing the registry: %s", e)
             return None
         
 
 # -----------------------------------------------------------------------------------------
     # Creates the main dashboard that you see on start up
-    def create_dashboard(self):
+    @traced(category="render")
+    def create_dashboard(self, rescan=True):
+        self.rescan_on_build = rescan # Scan the library paths, or use the library as it is
         self.Kill_All_Widgets() # Kill all widgets on the current screen
+        self.tiles = {} # The old canvases are gone, their images stay in the cache for the new ones
+        self.row_tiles = {'steam': [], 'epic': []}
+        self.row_visible = {'steam': [], 'epic': []}
+        self.row_windows = {'steam': (0, 0), 'epic': (0, 0)}
+        self.prefetcher.reset() # Queued art jobs belong to the old tiles
+        self.search_index.clear()
         self.create_menu_bar() # Create the top menu bar
         # Create Steam Portion of the dashboard
 
@@ -251,6 +466,8 @@ class Main_Window:
                        )
 
         self.create_epic_games_list()
+        self.apply_search_filter() # Re-apply the search from before the rebuild
+        self.root.after_idle(lambda: instant("dashboard_idle", "render", tiles=len(self.tiles))) # Tk has drawn the new widgets
 
 # -----------------------------------------------------------------------------------------
     def create_menu_bar(self):
@@ -269,14 +486,7 @@ class Main_Window:
         title.pack(side="left")
 
         # Create settings button
-        if self.color == "dark":
-            settings_icon_path = os.path.join(self.current_dir, 'Icons', 'Settings-Gear-light.png') # Create full path of image
-            
-        elif self.color == "light":
-            settings_icon_path = os.path.join(self.current_dir, 'Icons', 'Settings-Gear-dark.png') # Create full path of image
-
-        settings_image = Image.open(settings_icon_path)
-        settings_icon = ctk.CTkImage(settings_image)
+        settings_icon = self.theme_icon('Settings-Gear')
         settings = ctk.CTkButton(frame,
                                  image=settings_icon,
                                  width=5,
@@ -290,13 +500,7 @@ class Main_Window:
         settings.pack(side="right", anchor="e", padx=(0,10))
 
         # Create mode toggle button
-        if self.color == "dark":
-            mode_icon_path = os.path.join(self.current_dir, 'Icons', 'Switch-Mode-light.png') # Create full path of image
-        elif self.color == "light":
-            mode_icon_path = os.path.join(self.current_dir, 'Icons', 'Switch-Mode-dark.png') # Create full path of image
-        
-        mode_image = Image.open(mode_icon_path)
-        mode_icon = ctk.CTkImage(mode_image)
+        mode_icon = self.theme_icon('Switch-Mode')
         toggle_mode = ctk.CTkButton(frame,
                                     image=mode_icon,
                                     width=5,
@@ -308,7 +512,41 @@ class Main_Window:
                                     )
         toggle_mode.pack(side="right", anchor="e", padx=(0,5))
 
+        # Create diagnostics button, shows or hides the live diagnostics panel
+        diagnostics = ctk.CTkButton(frame,
+                                    text="Diagnostics",
+                                    width=100,
+                                    command=self.Toggle_Diagnostics
+                                    )
+        diagnostics.pack(side="right", anchor="e", padx=(0,10))
 
+        # Create disk usage button, the report is measured in the background
+        disk_usage = ctk.CTkButton(frame,
+                                   text="Disk Usage",
+                                   width=100,
+                                   command=self.Show_Disk_Usage
+                                   )
+        disk_usage.pack(side="right", anchor="e", padx=(0,10))
+
+        # Create sort menu, reorders the existing tiles without rescanning
+        sort_menu = ctk.CTkOptionMenu(frame,
+                                      values=list(SORT_ORDERS.values()),
+                                      variable=self.sort_var,
+                                      command=self.change_sort_order,
+                                      width=150
+                                      )
+        sort_menu.pack(side="right", anchor="e", padx=(0,10))
+
+        # Create search box, filters the game rows on every keystroke
+        search_entry = ctk.CTkEntry(frame,
+                                    width=250,
+                                    placeholder_text="Search games...",
+                                    textvariable=self.search_var
+                                    )
+        search_entry.pack(side="right", anchor="e", padx=(0,10))
+
+
+    @traced(category="render")
     def create_epic_games_list(self):
         self.epic_games_frame = ctk.CTkScrollableFrame(self.scrollable_frame, 
                                                   orientation="horizontal",
@@ -320,6 +558,7 @@ class Main_Window:
                               fill="both",
                               expand=True
                         )
+        self.track_row_scrolling('epic', self.epic_games_frame) # Decode tile images as they scroll into view
         
         counter = 0
         # Loop over the games in the library and run function to get photos (NOT IMPLEMENTED YET)
@@ -331,21 +570,17 @@ class Main_Window:
             counter += 1
         else:
             if counter == 0:
-                print("No games found in Steam AppManifest. Calling placeholder function...")
+                log.info("No games found in Steam AppManifest. Calling placeholder function...")
                 if self.epic_games_frame.winfo_exists(): 
                     self.epic_games_frame.pack_forget() # Destroy the scrollable frame and replace with a non scrollable one to present the text
-                    print("Games Frame Destroyed!")
+                    log.debug("Games Frame Destroyed!")
                 else:
-                    print("Games Frame doesn't exist.")
+                    log.debug("Games Frame doesn't exist.")
                 self.epic_game_placeholder_text()
         
     # -----------------------------------------------------------------------------------------
     def epic_game_placeholder_text(self):
-        if self.color == 'dark':
-            # current_text_color = "#dce4ee"
-            current_text_color = "#777777"
-        elif self.color == 'light':
-            current_text_color = "#1a1a1a"
+        current_text_color = ("#1a1a1a", "#777777") # (light, dark), switched by customtkinter with the mode
         
         self.epic_game_frame = ctk.CTkFrame(self.scrollable_frame,
                                         height=100
@@ -372,66 +607,26 @@ class Main_Window:
     def create_epic_games_button(self, game_name, game_path, launcher_path, iteration):
         
         
-        # Store the path to the play button image
-        play_button_path = os.path.join(self.current_dir, 'Icons', 'Play-Button-light.png')
-
-        # Open the play button image
-        open_image = Image.open(play_button_path)
-        play_button_image = ctk.CTkImage(open_image)
-
-        game_title = game_name
-        epic_game_image = grab_epic_game_photo(self.api_key, game_title)
-
-        if epic_game_image == None:
-            epic_game_image = Image.open(os.path.join(self.current_dir, 'Icons', 'Placeholder_Image.jpg')) # Set the image to the placeholder since the API couldn't get the photo
-        else:    
-            # Load and process the image
-            game_image_resize = epic_game_image.resize((300, 450))
-            blurred_game_photo = add_blur_gradient(game_image_resize, 10, 0.2)  # Adjust blur effect and height ratio
-            rounded_blurred_image = add_rounded_corners(blurred_game_photo, 10)  # Adjust radius of photo here
-            game_image = ImageTk.PhotoImage(rounded_blurred_image)
+        tile_key = f"epic:{game_name}"
+        self.tile_sources[tile_key] = self.healthy_record(tile_key) # Its art is resolved by the prefetcher once the tile is near the view
+        self.use_art_pack(tile_key)
 
         # Create a CTkCanvas to overlay the button on the image
-        if self.color == 'dark':
-            current_background_color = "#2b2b2b"
-        elif self.color == 'light':
-            current_background_color = "#dbdbdb"
-        canvas = ctk.CTkCanvas(self.epic_games_frame, width=300, height=450, bg=current_background_color, highlightthickness=0)
-        canvas.image = game_image # Keep reference
-        canvas.create_image(0, 0, anchor='nw', image=game_image) # Add the image to the canvas
+        canvas = ctk.CTkCanvas(self.epic_games_frame, width=300, height=450, bg=self.tile_background_color(), highlightthickness=0)
+        image_item = canvas.create_image(0, 0, anchor='nw') # The image is added by 'show_tile_image' when visible
         canvas.grid(row=0, column=iteration, padx=10, pady=(10, 10))
+        self.register_tile('epic', tile_key, game_name, canvas, image_item)
+        self.mark_broken_tile(tile_key, game_name, canvas)
 
         # Add the play button on top of the image
-        epic_play_button = ctk.CTkButton(
-            canvas,
-            text="Play",
-            image=play_button_image,
-            font=("Ariel", 16, "bold"),
-            fg_color="transparent",
-            bg_color= '#059212',
-            text_color="white",
-            width=135,
-            height=50,
-            hover_color="#06D001",
-            corner_radius=0,
-            border_width=0,
-            anchor="center",
-            command=lambda:launch_epic_game(game_path, game_name, launcher_path)
-        )
-
-        # Set button padding
-        padding_x = 10
-        button_x = (300 - padding_x) / 2  # Center button with padding
-        button_y = 400  # Position button near the bottom of the canvas
-
-        # Place the button on the canvas with padding
-        canvas.create_window(button_x, button_y, window=epic_play_button)
+        self.create_play_button(canvas, lambda:self.play_game(tile_key, launch_epic_game, game_path, game_name, launcher_path))
 
 
 
 
 
 # -----------------------------------------------------------------------------------------
+    @traced(category="render")
     def create_steam_games_list(self):
         # Array of Games
         self.steam_games_frame = ctk.CTkScrollableFrame(self.scrollable_frame, 
@@ -443,61 +638,31 @@ class Main_Window:
                          fill="both",
                          expand=True
                         )
+        self.track_row_scrolling('steam', self.steam_games_frame) # Decode tile images as they scroll into view
 
         
 
         # Create button on the frame and fill it with the steam game
+        self.load_config() # run function that fills the library and the dictionary of steam games ex: '{'Garrys Mod': '4000'}'
         
-        # Array of Game names and App ids sperately taken from self.steam_games array
-        game_names = []
-        app_ids = []
-
-        self.load_config() # run function that returns dictionary of steam games ex: '{'Garrys Mod': '4000'}'
-        
-        # Sort the Dictionary by A-Z
-        # print(f"Load config returns Steam (UNSORTED): '{self.steam_games}'")
-        self.steam_games = OrderedDict(sorted(self.steam_games.items()))
-        print()
-        print(f"Sorted Steam Games Dictionary: '{self.steam_games}'")
-        # print(f"Load config returns Epic (UNSORTED): {self.epic_games}")
-        self.epic_games = OrderedDict(sorted(self.epic_games.items()))
-        print()
-        print(f"Sorted Epic Games Dictionary: {self.epic_games}")
-        
-        # Process each config string
-        for config_string in self.steam_games:
-            # Extract the game name and app ID
-            for game_name, app_id in self.steam_games.items():
-                game_names.append(game_name)
-                app_ids.append(app_id)
-
-        # print("Game Names:", game_names)  
-        # print("App IDs:", app_ids)
-
-        # C:\Program Files (x86)\Steam\appcache\librarycache (This is steam's logos folder path)
-        # print (f"Steam exe path var: {steam_logo_path}")
-        # Example of photo name of logo
-        # 4000_library_600x900.jpg
-
-        steam_exe_path = self.steam_exe.get() # Store the exe path in var to manipulate
-        steam_logo_path = steam_exe_path.replace('steam.exe', 'appcache\\librarycache\\') # var that stores the icon cache of all photos
-        
-        logo_600x900 = "_library_600x900.jpg" # last half of the jpg file that is the same
+        # Already in the selected sort order, the library keeps its views sorted
+        log.debug("Sorted Steam Games Dictionary: '%s'", self.steam_games) # Formatted only when DEBUG is on
+        log.debug("Sorted Epic Games Dictionary: %s", self.epic_games)
+
+        # The logo comes from Steam's 'appcache/librarycache' (found by the scan), the user's art folder or an
+        # online source, whichever 'Art_Resolver' gets first
         counter = 0
         for game_name, app_id in self.steam_games.items():
-            
-            app_id_logo_path = steam_logo_path + app_id + logo_600x900 # Path to game's logo
-            # print(f"Calling Function 'Create Steam Button' with {app_id_logo_path} as logo and {game_name} as game")
-            self.create_steam_game_button(app_id_logo_path, game_name, app_id, counter) # Function call to create steam game button
+            self.create_steam_game_button(game_name, app_id, counter) # Function call to create steam game button
             counter = counter + 1
         else:
             if counter == 0:
-                print("No games found in Steam AppManifest. Calling placeholder function...")
+                log.info("No games found in Steam AppManifest. Calling placeholder function...")
                 if self.steam_games_frame.winfo_exists(): 
                     self.steam_games_frame.pack_forget() # Destroy the scrollable frame and replace with a non scrollable one to present the text
-                    print("Games Frame Destroyed!")
+                    log.debug("Games Frame Destroyed!")
                 else:
-                    print("Games Frame doesn't exist.")
+                    log.debug("Games Frame doesn't exist.")
                 self.steam_game_placeholder_text()
 
                 
@@ -505,11 +670,7 @@ class Main_Window:
 
 # -----------------------------------------------------------------------------------------
     def steam_game_placeholder_text(self):
-        if self.color == 'dark':
-            # current_text_color = "#dce4ee"
-            current_text_color = "#777777"
-        elif self.color == 'light':
-            current_text_color = "#1a1a1a"
+        current_text_color = ("#1a1a1a", "#777777") # (light, dark), switched by customtkinter with the mode
         
         self.steam_game_frame = ctk.CTkFrame(self.scrollable_frame,
                                         height=100
@@ -536,30 +697,17 @@ class Main_Window:
         
 
 # -----------------------------------------------------------------------------------------    
-    def create_steam_game_button(self, logo_path, game_name, app_id, iteration):
-        # Store the path to the play button image
-        play_button_path = os.path.join(self.current_dir, 'Icons', 'Play-Button-light.png')
-
-        # Open the play button image
-        open_image = Image.open(play_button_path)
-        play_button_image = ctk.CTkImage(open_image)
-
-        # Load and process the image
-        game_image_open = Image.open(logo_path)
-        game_image_resize = game_image_open.resize((300, 450))
-        blurred_game_photo = add_blur_gradient(game_image_resize, 10, 0.2)  # Adjust blur effect and height ratio
-        rounded_blurred_image = add_rounded_corners(blurred_game_photo, 10) # Adjust radius of photo here
-        game_image = ImageTk.PhotoImage(rounded_blurred_image)
+    def create_steam_game_button(self, game_name, app_id, iteration):
+        tile_key = f"steam:{app_id}"
+        self.tile_sources[tile_key] = self.healthy_record(tile_key) # Its art is resolved by the prefetcher once the tile is near the view
+        self.use_art_pack(tile_key)
 
         # Create a CTkCanvas to overlay the button on the image
-        if self.color == 'dark':
-            current_background_color = "#2b2b2b"
-        elif self.color == 'light':
-            current_background_color = "#dbdbdb"
-        canvas = ctk.CTkCanvas(self.steam_games_frame, width=300, height=450, bg=current_background_color, highlightthickness=0)
-        canvas.image = game_image # Keep reference
-        canvas.create_image(0, 0, anchor='nw', image=game_image) # Add the image to the canvas
+        canvas = ctk.CTkCanvas(self.steam_games_frame, width=300, height=450, bg=self.tile_background_color(), highlightthickness=0)
+        image_item = canvas.create_image(0, 0, anchor='nw') # The image is added by 'show_tile_image' when visible
         canvas.grid(row=0, column=iteration, padx=10, pady=(10, 10))
+        self.register_tile('steam', tile_key, game_name, canvas, image_item)
+        self.mark_broken_tile(tile_key, game_name, canvas)
 
         # Add Game Name above the button
         # steam_game_text = ctk.CTkLabel(
@@ -569,40 +717,417 @@ class Main_Window:
         # )
 
         # Add the play button on top of the image
-        steam_play_button = ctk.CTkButton(
-            canvas,
-            text="Play",
-            image=play_button_image,
-            font=("Ariel", 16, "bold"),
-            fg_color="transparent",
-            bg_color= '#059212',
-            text_color="white",
-            width=135,
-            height=50,
-            hover_color="#06D001",
-            corner_radius=0,
-            border_width=0,
-            anchor="center",
-            command=lambda:launch_steam_game(app_id, self.steam_executable_current, game_name)
-        )
+        self.create_play_button(canvas, lambda:self.play_game(tile_key, launch_steam_game, app_id, self.steam_executable_current, game_name))
 
+# -----------------------------------------------------------------------------------------
+    # The play button of a tile, drawn on the tile's canvas. Its colors don't depend on the theme, and unlike a
+    # 'CTkButton' it isn't redrawn by customtkinter on every mode switch.
+    def create_play_button(self, canvas, command):
         # Set button padding
         padding_x = 10
         button_x = (300 - padding_x) / 2  # Center button with padding
         button_y = 400  # Position button near the bottom of the canvas
+        width, height = 135, 50
+
+        tag = "play_button"
+        background = canvas.create_rectangle(button_x - width / 2, button_y - height / 2, button_x + width / 2, button_y + height / 2,
+                                             fill='#059212', width=0, tags=tag)
+        canvas.create_image(button_x - 22, button_y, image=self.play_button_photo(), tags=tag)
+        canvas.create_text(button_x + 12, button_y, text="Play", fill="white", font=("Ariel", 16, "bold"), tags=tag)
+
+        canvas.tag_bind(tag, "<Enter>", lambda event: canvas.itemconfig(background, fill="#06D001"))
+        canvas.tag_bind(tag, "<Leave>", lambda event: canvas.itemconfig(background, fill="#059212"))
+        canvas.tag_bind(tag, "<ButtonRelease-1>", lambda event: command())
+
+    # The game's record, or None when it looks uninstalled so no art is looked up for it
+    def healthy_record(self, tile_key):
+        if tile_key in self.broken_games:
+            return None
+        return self.library.get(tile_key)
+
+    # A game that looks uninstalled gets its name and the problem instead of art. It can still be launched,
+    # the launcher then offers to repair or reinstall it.
+    def mark_broken_tile(self, tile_key, game_name, canvas):
+        problem = self.broken_games.get(tile_key)
+        if problem is None:
+            return
+        canvas.create_text(150, 200, text=f"{game_name}\n\nNot installed\n{problem}", fill="#8a8a8a", width=260,
+                           justify="center", font=("Ariel", 16, "bold"))
+
+    # Loaded once, shared by every tile
+    def play_button_photo(self):
+        if self.play_photo is None:
+            play_button_path = os.path.join(self.current_dir, 'Icons', 'Play-Button-light.png')
+            self.play_photo = ImageTk.PhotoImage(Image.open(play_button_path).resize((20, 20)))
+        return self.play_photo
+
 
-        # Place the button on the canvas with padding
-        canvas.create_window(button_x, button_y, window=steam_play_button)
+# -----------------------------------------------------------------------------------------
+    # Tile image visibility. Only the tiles in (or next to) the visible part of a row hold a decoded 'PhotoImage'.
+    def register_tile(self, row, tile_key, game_name, canvas, image_item):
+        column = len(self.row_tiles[row])
+        self.tiles[tile_key] = {'canvas': canvas, 'image_item': image_item, 'shown': False, 'row': row, 'column': column,
+                                'theme': self.color}
+        self.row_tiles[row].append(tile_key)
+        self.row_visible[row].append(tile_key)
+        self.search_index.add(tile_key, game_name)
+        if self.warmup:
+            canvas.bind("<Enter>", lambda event: self.schedule_warmup(tile_key))
+            canvas.bind("<Leave>", lambda event: self.cancel_warmup())
+
+    # Warm a game's files once the pointer has rested on its tile, passing over tiles while moving doesn't count
+    def schedule_warmup(self, tile_key, delay_ms=400):
+        self.cancel_warmup()
+        self.warmup_job = self.root.after(delay_ms, self.warm_game, tile_key)
+
+    def cancel_warmup(self):
+        if self.warmup_job is not None:
+            self.root.after_cancel(self.warmup_job)
+            self.warmup_job = None
+
+    def warm_game(self, tile_key):
+        self.cancel_warmup() # Also when called straight from 'play_game'
+        record = self.library.get(tile_key)
+        if self.warmup and record is not None:
+            self.warmup.request(tile_key, record.install_dir, record.executable)
+
+    def track_row_scrolling(self, row, games_frame):
+        scrollbar_set = games_frame._scrollbar.set # The scrollable frame's own handler, still needs to be called
+
+        def on_scroll(first, last): # Called by Tk whenever the row is scrolled or resized
+            scrollbar_set(first, last)
+            self.refresh_visible_tiles(row, float(first), float(last))
+
+        games_frame._parent_canvas.configure(xscrollcommand=on_scroll)
+
+    def refresh_visible_tiles(self, row, first, last):
+        tile_keys = self.row_visible[row]
+        if not tile_keys:
+            return
+        # Every tile has the same width so the visible fraction of the row maps straight to tile indexes
+        first_index = max(int(first * len(tile_keys)) - 1, 0)
+        last_index = min(int(last * len(tile_keys)) + 1, len(tile_keys))
+        self.row_windows[row] = (first_index, last_index)
+        for tile_key in tile_keys[first_index:last_index]:
+            self.restyle_tile(self.tiles[tile_key])
+            self.show_tile_image(tile_key)
+        self.prefetcher.update_row(row, tile_keys, first_index, last_index) # Prepare the art of what comes next
+
+        # Decode the next few prepared tiles once Tk is idle, so they are ready before they scroll into view
+        if row not in self.decode_ahead_pending:
+            self.decode_ahead_pending.add(row)
+            self.root.after_idle(self.decode_ahead, row)
+
+    def decode_ahead(self, row):
+        self.decode_ahead_pending.discard(row)
+        tile_keys = self.row_visible[row]
+        first_index, last_index = self.row_windows[row]
+        if self.prefetcher.directions.get(row, 1) > 0:
+            ahead = tile_keys[last_index:last_index + self.prefetcher.lookahead]
+        else:
+            ahead = tile_keys[max(first_index - self.prefetcher.lookahead, 0):first_index]
+        for tile_key in ahead:
+            self.show_tile_image(tile_key)
+
+    # A cover imported in the art pack goes straight into the image cache, the prefetcher then skips the tile.
+    # A dict lookup and a slice of the pack's map: no file probing, network or image processing.
+    def use_art_pack(self, tile_key, replace=False):
+        record = self.tile_sources.get(tile_key)
+        if record is None or (self.image_cache.has(tile_key) and not replace):
+            return
+        name = self.art_pack.lookup(record)
+        tile = self.art_pack.get(name) if name else None
+        if tile is not None:
+            self.image_cache.put_bytes(tile_key, *tile)
+
+    # Runs on a prefetcher worker: load and process a tile's art. Returns (png bytes, size), or None when there is none.
+    # 'Art_Unavailable' (rate limited, server down) is passed on, the prefetcher tries the tile again later.
+    # Must not touch Tk.
+    @traced(category="art")
+    def prepare_tile_art(self, tile_key):
+        record = self.tile_sources.get(tile_key)
+        if record is None:
+            return None
+        game_image = self.art_resolver.resolve(record) # First acceptable cover of any source, within the budget
+        if game_image is None:
+            log.debug("No art found for '%s'", tile_key)
+            return None # The tile keeps its plain background
+
+        # Load and process the image
+        return encode_tile(process_game_photo(game_image)) # Stored compressed, decoded once the tile is visible
+
+    # The tiles prefetched since the last frame arrived on the Tk thread as [(tile key, bytes, size), ...].
+    # Only the ones in, or about to come into, view are decoded, all of them in one pass.
+    def apply_tile_art(self, results):
+        lookahead = self.prefetcher.lookahead
+        near_view = []
+        for tile_key, data, size in results:
+            self.image_cache.put_bytes(tile_key, data, size)
+            tile = self.tiles.get(tile_key)
+            if tile is None or tile_key not in self.row_visible[tile['row']]:
+                continue
+            first_index, last_index = self.row_windows[tile['row']]
+            if first_index - lookahead <= tile['column'] < last_index + lookahead:
+                near_view.append(tile_key)
+        increment('tile_art_arrived', len(results))
+        for tile_key in near_view:
+            self.show_tile_image(tile_key)
+
+    def show_tile_image(self, tile_key):
+        tile = self.tiles.get(tile_key)
+        photo = self.image_cache.get_photo(tile_key) # Also marks the tile as recently used
+        if tile is None or tile['shown'] or photo is None:
+            return
+        tile['canvas'].itemconfig(tile['image_item'], image=photo)
+        tile['shown'] = True
+
+    def clear_tile_image(self, tile_key): # Called by the image cache when it evicts a tile's 'PhotoImage'
+        tile = self.tiles.get(tile_key)
+        if tile is None or not tile['shown']:
+            return
+        tile['canvas'].itemconfig(tile['image_item'], image='')
+        tile['shown'] = False
 
+# -----------------------------------------------------------------------------------------
+    # Switch the ordering of the game rows. The library's views are already sorted, the tiles are only moved.
+    def change_sort_order(self, label):
+        for order, order_label in SORT_ORDERS.items():
+            if order_label == label:
+                self.sort_order = order
+        self.apply_sort_order()
+
+    def apply_sort_order(self):
+        for row, launcher in (('steam', 'Steam'), ('epic', 'Epic Games')):
+            self.row_tiles[row] = [key for key in self.library.ordered(self.sort_order, launcher) if key in self.tiles]
+        self.apply_search_filter() # Re-grids the tiles that moved
+
+    @traced(category="launch")
+    def play_game(self, tile_key, launch_function, *launch_args):
+        self.warm_game(tile_key) # Skipped when the hover already warmed it
+        self.library.mark_played(tile_key)
+        if self.sort_order == 'last_played':
+            self.apply_sort_order()
+        launch_function(*launch_args)
+
+# -----------------------------------------------------------------------------------------
+    # Filter the game rows in place: matching tiles are moved together, the rest are hidden (not destroyed).
+    def apply_search_filter(self):
+        matches = self.search_index.search(self.search_var.get()) # None means no filter
+        for row, games_frame in (('steam', getattr(self, 'steam_games_frame', None)), ('epic', getattr(self, 'epic_games_frame', None))):
+            visible = [key for key in self.row_tiles[row] if matches is None or key in matches]
+            if visible == self.row_visible[row]:
+                continue
+
+            previously_visible = set(self.row_visible[row])
+            for key in previously_visible:
+                if matches is not None and key not in matches:
+                    self.tiles[key]['canvas'].grid_remove()
+            for column, key in enumerate(visible):
+                tile = self.tiles[key]
+                if tile['column'] != column or key not in previously_visible: # Only re-grid tiles that moved or reappeared
+                    tile['canvas'].grid(row=0, column=column)
+                    tile['column'] = column
+            self.row_visible[row] = visible
+            self.prefetcher.cancel_row(row) # Jobs queued for the old filter are stale
+
+            if games_frame is not None and games_frame.winfo_exists():
+                games_frame._parent_canvas.xview_moveto(0) # Show the first match
+                self.root.after_idle(self.refresh_row, row, games_frame) # Decode the tiles that are now in view
+
+    def refresh_row(self, row, games_frame):
+        if games_frame.winfo_exists():
+            first, last = games_frame._parent_canvas.xview()
+            self.refresh_visible_tiles(row, first, last)
 
 # -----------------------------------------------------------------------------------------
-    def Show_Settings_Menu(self): # This function should wipe all widgets on screen and then show the settings menu
-        print("Settings Menu!")
-        #self.Kill_All_Widgets() # Kill all widgets on the current screen
-        self.Create_Settings_Widgets() # Creates settings widgets
+    # Disk usage window. Opens at once, the report is filled in when the background measurement is done.
+    def Show_Disk_Usage(self):
+        if self.disk_usage_window is None or not self.disk_usage_window.winfo_exists():
+            self.disk_usage_window = ctk.CTkToplevel(self.root)
+            self.disk_usage_window.geometry("700x500")
+            self.disk_usage_window.title("Disk Usage")
+            self.disk_usage_window.iconbitmap(self.icon_path)
+            self.Set_Title_Bar(windll.user32.GetParent(self.disk_usage_window.winfo_id()))
+            self.disk_usage_text = ctk.CTkTextbox(self.disk_usage_window, font=("Consolas", 14))
+            self.disk_usage_text.pack(fill="both", expand=True, padx=10, pady=10)
+        self.disk_usage_window.lift()
+        self.set_disk_usage_text("Measuring disk usage...")
+
+        if self.disk_usage_running:
+            return
+        self.disk_usage_running = True
+        records = list(self.library.records.values())
+
+        def measure():
+            report = {'error': "the measurement stopped unexpectedly"}
+            try:
+                report = self.disk_usage.report(records)
+            except OSError as os_error:
+                report = {'error': str(os_error)}
+            except Exception:
+                log.exception("Measuring disk usage failed")
+            finally:
+                self.dispatcher.post('disk_usage', report) # Always answered, the report clears 'disk_usage_running'
+
+        threading.Thread(target=measure, name="Disk_Usage", daemon=True).start()
+
+    def show_disk_usage_report(self, report):
+        self.disk_usage_running = False
+        if 'error' in report:
+            self.set_disk_usage_text(f"Could not measure disk usage: {report['error']}")
+            return
+        lines = ["Libraries"]
+        for library in report['libraries']:
+            lines.append(f"  {format_size(library['size']):>10}  {library['launcher']}  {library['path']}")
+        lines += ["", "Games"]
+        for game in report['games']:
+            lines.append(f"  {format_size(game['size']):>10}  {game['name']} ({game['launcher']})")
+        lines += ["", f"  {format_size(report['total']):>10}  Total"]
+        self.set_disk_usage_text("\n".join(lines))
+
+    def set_disk_usage_text(self, text):
+        if self.disk_usage_window is None or not self.disk_usage_window.winfo_exists():
+            return
+        self.disk_usage_text.configure(state="normal")
+        self.disk_usage_text.delete("1.0", "end")
+        self.disk_usage_text.insert("1.0", text)
+        self.disk_usage_text.configure(state="disabled")
+
+# -----------------------------------------------------------------------------------------
+    # Components publish their own counters, they are only read while the diagnostics panel is open
+    def register_metric_sources(self):
+        metrics.add_source('dashboard', self.dashboard_stats)
+        metrics.add_source('image_cache', self.image_cache.stats)
+        metrics.add_source('tile_store', self.image_cache.compressed.stats)
+        metrics.add_source('prefetcher', self.prefetcher.stats)
+        metrics.add_source('art_resolver', self.art_resolver.stats)
+        metrics.add_source('art_pack', self.art_pack.stats)
+        metrics.add_source('dispatcher', self.dispatcher.stats)
+        metrics.add_source('library_health', self.library_health.stats)
+        if self.watchdog:
+            metrics.add_source('watchdog', self.watchdog.stats)
+        if self.warmup:
+            metrics.add_source('warmup', self.warmup.stats)
+
+    def dashboard_stats(self):
+        games = {}
+        for record in self.library.records.values():
+            games[record.launcher] = games.get(record.launcher, 0) + 1
+        return {
+            "games": games,
+            "uninstalled": len(self.broken_games),
+            "canvases": len(self.tiles),
+            "photo_images": len(self.image_cache.decoded),
+            "tiles_shown": sum(1 for tile in self.tiles.values() if tile['shown']),
+            "rss_bytes": process_rss()
+        }
+
+    # Shows the panel and refreshes it every second while it is visible, or hides it
+    def Toggle_Diagnostics(self):
+        window = self.diagnostics_window
+        if window is not None and window.winfo_exists() and window.state() != 'withdrawn':
+            self.hide_diagnostics()
+            return
+        if window is None or not window.winfo_exists():
+            self.diagnostics_window = ctk.CTkToplevel(self.root)
+            self.diagnostics_window.geometry("700x600")
+            self.diagnostics_window.title("Diagnostics")
+            self.diagnostics_window.iconbitmap(self.icon_path)
+            self.Set_Title_Bar(windll.user32.GetParent(self.diagnostics_window.winfo_id()))
+            self.diagnostics_text = ctk.CTkTextbox(self.diagnostics_window, font=("Consolas", 13))
+            self.diagnostics_text.pack(fill="both", expand=True, padx=10, pady=10)
+            self.diagnostics_window.protocol("WM_DELETE_WINDOW", self.hide_diagnostics)
+        else:
+            self.diagnostics_window.deiconify()
+        self.diagnostics_window.lift()
+        self.refresh_diagnostics()
+
+    def hide_diagnostics(self):
+        if self.diagnostics_job is not None:
+            self.root.after_cancel(self.diagnostics_job)
+            self.diagnostics_job = None
+        self.diagnostics_window.withdraw()
+
+    def refresh_diagnostics(self, interval_ms=1000):
+        self.diagnostics_job = None
+        if self.diagnostics_window is None or not self.diagnostics_window.winfo_exists():
+            return
+        text = self.diagnostics_text
+        try:
+            scroll = text.yview()[0] # Kept across refreshes
+            text.configure(state="normal")
+            text.delete("1.0", "end")
+            text.insert("1.0", self.diagnostics_report(metrics.snapshot()))
+            text.configure(state="disabled")
+            text.yview_moveto(scroll)
+        except Exception as report_error: # One bad refresh must not stop the panel updating
+            log.warning("Could not refresh the diagnostics panel: %s", report_error)
+        finally:
+            self.diagnostics_job = self.root.after(interval_ms, self.refresh_diagnostics)
+
+    # A source whose stats failed is only '{'error': ...}' in the snapshot, its numbers show as 0 here
+    # and the error under 'Components'.
+    def diagnostics_report(self, snapshot):
+        sources = snapshot['sources']
+        dashboard = sources.get('dashboard', {})
+        cache = sources.get('image_cache', {})
+        prefetcher = sources.get('prefetcher', {})
+        dispatcher = sources.get('dispatcher', {})
+        frames = snapshot['samples'].get('frame_latency_ms')
+        games = ", ".join(f"{launcher} {count}" for launcher, count in sorted(dashboard.get('games', {}).items())) or "none"
+        rss_bytes = dashboard.get('rss_bytes')
+
+        lines = [f"Games indexed     {games} ({dashboard.get('uninstalled', 0)} look uninstalled)",
+                 f"Tiles             {dashboard.get('canvases', 0)} canvases, {dashboard.get('photo_images', 0)} PhotoImages, "
+                 f"{cache.get('compressed_entries', 0)} compressed ({format_size(cache.get('compressed_bytes', 0))})",
+                 f"Art cache         {cache.get('hit_rate', 0):.0%} hits ({cache.get('hits', 0)} hits, "
+                 f"{cache.get('misses', 0)} misses, {cache.get('evictions', 0)} evictions)",
+                 f"Pending work      {prefetcher.get('pending', 0)} tiles queued, {prefetcher.get('in_flight', 0)} in flight, "
+                 f"{dispatcher.get('pending', 0)} results waiting for the UI",
+                 f"Memory (RSS)      {format_size(rss_bytes) if rss_bytes else 'unknown'}"]
+        if frames and frames['count']:
+            lines.append(f"Frame latency     p50 {frames['p50']:.1f} ms, p95 {frames['p95']:.1f} ms, "
+                         f"p99 {frames['p99']:.1f} ms, max {frames['max']:.1f} ms (last {frames['count']} frames)")
+
+        lines += ["", "Last scan per library root"]
+        scans = {name[len("scan_ms "):]: value for name, value in snapshot['gauges'].items() if name.startswith("scan_ms ")}
+        for path, milliseconds in sorted(scans.items()):
+            lines.append(f"  {milliseconds:>8.1f} ms  {path}")
+        if not scans:
+            lines.append("  No scan since start up (loaded from the library index)")
+
+        lines += ["", "Components"]
+        for name, stats in sources.items():
+            lines.append(f"  {name}")
+            for key, value in stats.items():
+                lines.append(f"    {key:<22} {value:.3f}" if isinstance(value, float) else f"    {key:<22} {value}")
+        if snapshot['counters']:
+            lines += ["", "Counters"] + [f"  {name:<24} {value}" for name, value in sorted(snapshot['counters'].items())]
+        if snapshot['samples']:
+            lines += ["", "Samples"] + [f"  {name:<24} p50 {summary['p50']:.1f}, p95 {summary['p95']:.1f}, "
+                                        f"max {summary['max']:.1f} ({summary['count']})"
+                                        for name, summary in sorted(snapshot['samples'].items())]
+
+        events = recent_events(logging.WARNING)[-10:]
+        lines += ["", "Recent warnings"] + [f"  {event}" for event in events] + ([] if events else ["  None"])
+        return "\n".join(lines)
+
+# -----------------------------------------------------------------------------------------
+    # Built the first time it is opened, after that the same window is shown again with its state intact
+    def Show_Settings_Menu(self):
+        log.debug("Settings Menu!")
+        if self.settings_Window is None or not self.settings_Window.winfo_exists():
+            self.Create_Settings_Widgets() # Creates settings widgets
+            for section, path_vars in self.path_vars.items(): # Show how many games each saved path has
+                for path_var in path_vars:
+                    self.check_library_path(section, None, path_var.get())
+        else:
+            self.settings_Window.deiconify()
+        self.settings_Window.lift()
         
     def refresh_launchers(self):
-        self.settings_Window.destroy()
+        self.settings_Window.withdraw() # Hidden, not destroyed, so opening it again is instant
+        self.flush_config() # Write any staged path changes before the dashboard reads them
         if self.Update_Steam == True or self.Update_Epic == True:
             self.Update_Steam = False
             self.Update_Epic = False
@@ -635,9 +1160,12 @@ class Main_Window:
                                    expand=True, 
                                    ipady=self.scrollable_height
                                   )
+        self.settings_path_frames = {} # launcher section -> frame holding its path rows
+        self.settings_path_labels = {} # (launcher section, path) -> label showing the path's check
         
         self.load_steam_settings() # Load UI for steam path settings
         self.load_epic_games_settings() # Load UI for epic path settings
+        self.load_art_pack_settings() # Load UI for the art pack import
         popup_hwnd = windll.user32.GetParent(self.settings_Window.winfo_id())
         self.Set_Title_Bar(popup_hwnd)
         self.settings_Window.attributes('-topmost', True)
@@ -645,217 +1173,293 @@ class Main_Window:
         
 # -----------------------------------------------------------------------------------------
     def load_steam_settings(self):
+        self.load_launcher_path_settings("Steam", "Steam Manifests Path(s)", pady=(0,5)) # Load UI for steam path settings
+
+# -----------------------------------------------------------------------------------------
+    def load_epic_games_settings(self):
+        self.load_launcher_path_settings("Epic Games", "Epic Games Manifest Path(s)", pady=(5,0)) # Load UI for epic path settings
+
+# -----------------------------------------------------------------------------------------
+    def load_art_pack_settings(self):
+        art_pack_frame = ctk.CTkFrame(self.settings_frame)
+        art_pack_frame.pack(padx=5,
+                            pady=(5,0),
+                            fill="x",
+                            expand=True
+                            )
+        art_pack_text = ctk.CTkLabel(art_pack_frame,
+                                     text="Art Pack",
+                                     font=("Ariel", 20, "bold")
+                                     )
+        art_pack_text.pack(anchor="w",
+                           padx=(40,0),
+                           pady=(10,0)
+                           )
+        self.art_pack_status_label = ctk.CTkLabel(art_pack_frame, text=self.art_pack_status_text(), anchor="w")
+        self.art_pack_status_label.pack(padx=(50,0),
+                                        pady=(10,10),
+                                        side="left"
+                                        )
+        import_zip_button = ctk.CTkButton(art_pack_frame,
+                                          text="Import Zip",
+                                          command=lambda:self.browse_art_pack(zipped=True),
+                                          width=100
+                                          )
+        import_zip_button.pack(padx=(0,10),
+                               side="right"
+                               )
+        import_folder_button = ctk.CTkButton(art_pack_frame,
+                                             text="Import Folder",
+                                             command=lambda:self.browse_art_pack(zipped=False),
+                                             width=100
+                                             )
+        import_folder_button.pack(padx=(0,10),
+                                  side="right"
+                                  )
+
+# -----------------------------------------------------------------------------------------
+    # Creates the settings frame of one launcher with a row for each of its library paths
+    def load_launcher_path_settings(self, section, title, pady):
         # Create settings frame
-        steam_settings_frame = ctk.CTkFrame(self.settings_frame,
+        launcher_settings_frame = ctk.CTkFrame(self.settings_frame,
                              #fg_color = 'transparent',
                              )
-        steam_settings_frame.pack(padx=5,
-                                pady=(0,5),
+        launcher_settings_frame.pack(padx=5,
+                                pady=pady,
                                 fill="x",
                                 expand=True
                                 )
-        # Create Steam Label
-        steam_text = ctk.CTkLabel(steam_settings_frame,
-                                  text="Steam Manifests Path(s)",
+        # Create Launcher Label
+        launcher_text = ctk.CTkLabel(launcher_settings_frame,
+                                  text=title,
                                   font=("Ariel", 20, "bold")
                                   )
-        steam_text.pack(anchor="w",
+        launcher_text.pack(anchor="w",
                         padx=(40,0),
                         pady=(10,0)
                         )
 
-        # Create path frames
-        steam_entry1_frame = ctk.CTkFrame(steam_settings_frame)
-        steam_entry1_frame.pack(fill="both", pady=10, padx=10)
-
-        steam_p1_text = ctk.CTkLabel(steam_entry1_frame,
-                                  text="Path 1",
-                                  font=("Ariel", 20, "bold")
-                                  )
-        steam_p1_text.pack(anchor=tk.W,
-                        padx=(40,0),
-                        pady=(10,0)
-                        )
-        
-        # Create Steam Path entry boxes
-        # Steam entry 1
-        steam_path1_entry = ctk.CTkEntry(steam_entry1_frame,
-                                         width=300,
-                                         state="readonly",
-                                         textvariable=self.steam_path1
-                                         )
-        
-        steam_path1_entry.pack(pady=(10,10),
-                               padx=(40,0),
-                               side="left"
-                               )
-        
-        steam_path1_clear_button = ctk.CTkButton(steam_entry1_frame,
-                                                text="Clear",
-                                                command=lambda:self.clear_file(1),
-                                                width=100)
-        steam_path1_clear_button.pack(padx=(0,10),
-                                     side="right",
+        # Frame that holds the path rows, rebuilt when a path is added or removed
+        paths_frame = ctk.CTkFrame(launcher_settings_frame, fg_color='transparent')
+        paths_frame.pack(fill="x")
+        self.settings_path_frames[section] = paths_frame
+        self.load_path_rows(section)
+
+        # Result of checking the last picked folder, shown before it is saved
+        status_label = ctk.CTkLabel(launcher_settings_frame, text="", anchor="w")
+        status_label.pack(anchor="w", padx=(50,0), pady=(0,10))
+        self.settings_status_labels[section] = status_label
+
+    def load_path_rows(self, section):
+        paths_frame = self.settings_path_frames[section]
+        for widget in paths_frame.winfo_children():
+            widget.destroy()
+        for key in [key for key in self.settings_path_labels if key[0] == section]:
+            del self.settings_path_labels[key]
+
+        for index, path_var in enumerate(self.path_vars[section]):
+            # Create path frame
+            entry_frame = ctk.CTkFrame(paths_frame)
+            entry_frame.pack(fill="both", pady=10, padx=10)
+
+            path_text = ctk.CTkLabel(entry_frame,
+                                     text=f"Path {index + 1}",
+                                     font=("Ariel", 20, "bold")
                                      )
-
-        steam_path1_button = ctk.CTkButton(steam_entry1_frame,
-                                         text="Browse",
-                                         command=lambda:self.browse_file(1),
-                                         width=100
-                                         )
-        
-        steam_path1_button.pack(padx=(0,10),
-                               side="right"
-                               )
-        
-        # Steam entry 2 frame
-        steam_entry2_frame = ctk.CTkFrame(steam_settings_frame)
-        steam_entry2_frame.pack(fill="both", pady=10, padx=10)
-
-        steam_p2_text = ctk.CTkLabel(steam_entry2_frame,
-                                  text="Path 2",
-                                  font=("Ariel", 20, "bold")
-                                  )
-        steam_p2_text.pack(anchor=tk.W,
+            path_text.pack(anchor=tk.W,
+                           padx=(40,0),
+                           pady=(10,0)
+                           )
+
+            # Create Path entry box
+            path_entry = ctk.CTkEntry(entry_frame,
+                                      width=300,
+                                      state="readonly",
+                                      textvariable=path_var
+                                      )
+            path_entry.pack(pady=(10,10),
                             padx=(40,0),
-                            pady=(10,0)
+                            side="left"
                             )
 
-        # Steam entry 2
-        steam_path2_entry = ctk.CTkEntry(steam_entry2_frame,
-                                         width=300,
-                                         state="readonly",
-                                         textvariable=self.steam_path2
+            # Games found in the path, filled in by the background check
+            preview_label = ctk.CTkLabel(entry_frame,
+                                         text=self.path_previews.get((section, path_var.get()), "Checking..."),
+                                         width=150,
+                                         anchor="w"
                                          )
-        
-        steam_path2_entry.pack(pady=(10,10),
-                               padx=(40,0),
+            preview_label.pack(padx=(10,0),
                                side="left"
                                )
+            self.settings_path_labels[(section, path_var.get())] = preview_label
+
+            path_clear_button = ctk.CTkButton(entry_frame,
+                                              text="Clear",
+                                              command=lambda index=index:self.clear_file(section, index),
+                                              width=100)
+            path_clear_button.pack(padx=(0,10),
+                                   side="right",
+                                   )
 
-        steam_path2_clear_button = ctk.CTkButton(steam_entry2_frame,
-                                                text="Clear",
-                                                command=lambda:self.clear_file(2),
-                                                width=100)
-        steam_path2_clear_button.pack(padx=(0,10),
-                                     side="right",
-                                     )
+            path_button = ctk.CTkButton(entry_frame,
+                                        text="Browse",
+                                        command=lambda index=index:self.browse_file(section, index),
+                                        width=100
+                                        )
+            path_button.pack(padx=(0,10),
+                             side="right"
+                             )
 
-        steam_path2_button = ctk.CTkButton(steam_entry2_frame,
-                                         text="Browse",
-                                         command=lambda:self.browse_file(2),
-                                         width=100
-                                         )
-        
-        steam_path2_button.pack(padx=(0,10),
-                               side="right"
-                               )
+        # Browse for a new library path, appended after the existing ones
+        add_path_button = ctk.CTkButton(paths_frame,
+                                        text="Add Path",
+                                        command=lambda:self.browse_file(section, len(self.path_vars[section])),
+                                        width=100
+                                        )
+        add_path_button.pack(anchor="w",
+                             padx=(50,0),
+                             pady=(0,10)
+                             )
         
 # -----------------------------------------------------------------------------------------
-    def load_epic_games_settings(self):
-        epic_games_settings_frame = ctk.CTkFrame(self.settings_frame,
-                                                 #fg_color = 'transparent',
-                                                 )
-        
-        epic_games_settings_frame.pack(padx=5,
-                                       pady=(5,0),
-                                       fill="x",
-                                       expand=True
-                                       )
-        
-        # Create Epic Games label
-        epic_text = ctk.CTkLabel(epic_games_settings_frame,
-                                 text="Epic Games Manifest Path",
-                                 font=("Ariel", 20, "bold")
-                                 )
-        epic_text.pack(anchor="w",
-                       padx=(40,0),
-                       pady=(10,0)
-                       )
-        
-        # Create path frames
-        epic_entry1_frame = ctk.CTkFrame(epic_games_settings_frame)
-        epic_entry1_frame.pack(fill="both", pady=10, padx=10)
-
-        epic_p1_text = ctk.CTkLabel(epic_entry1_frame,
-                                  text="Path 1",
-                                  font=("Ariel", 20, "bold")
-                                  )
-        epic_p1_text.pack(anchor=tk.W,
-                        padx=(40,0),
-                        pady=(10,0)
-                        )
-        
-        # Create Epic Path entry boxes
-        # Epic entry 1
-        epic_path1_entry = ctk.CTkEntry(epic_entry1_frame,
-                                         width=300,
-                                         state="readonly",
-                                         textvariable=self.epic_path1
-                                         )
-        
-        epic_path1_entry.pack(pady=(10,10),
-                               padx=(40,0),
-                               side="left"
-                               )
-        
-        # Clear Button
-        epic_path1_clear_button = ctk.CTkButton(epic_entry1_frame,
-                                                text="Clear",
-                                                command=lambda:self.clear_file(3),
-                                                width=100)
-        epic_path1_clear_button.pack(padx=(0,10),
-                                     side="right",
-                                     )
+    # Browse for the library path 'index' of the launcher 'section'. An index past the last path adds a new one.
+    # The folder is checked in the background first, 'apply_path_preview' saves it once games are found in it.
+    def browse_file(self, section, index):
+        file_path = filedialog.askdirectory(parent=self.settings_Window)
+        if file_path:
+            self.check_library_path(section, index, file_path)
+
+    # Count the games in 'path' on a background thread. 'index' is the path slot it is meant for, None to only
+    # show the count of a saved path.
+    def check_library_path(self, section, index, path):
+        config = self.config_service.get()
+        if index is not None:
+            self.path_checks[(section, index)] = path # A later pick for the same slot wins
+            self.set_settings_status(section, f"Checking '{path}'...")
+
+        def check():
+            count, message = preview_library_path(config, section, path)
+            self.dispatcher.post('path_preview', (section, index, path, count, message))
+
+        threading.Thread(target=check, name="Path_Preview", daemon=True).start()
+
+    def apply_path_preview(self, section, index, path, count, message):
+        self.path_previews[(section, path)] = message
+        label = self.settings_path_labels.get((section, path))
+        if label is not None and label.winfo_exists():
+            label.configure(text=message)
+        if index is None or self.path_checks.get((section, index)) != path:
+            return # Only a count, or a newer folder was picked since
+        del self.path_checks[(section, index)]
+
+        if count == 0:
+            self.set_settings_status(section, f"'{path}': {message}, not saved")
+            return
+        if index > len(self.path_vars[section]): # Paths were cleared while it was checked
+            index = len(self.path_vars[section])
+        self.config_service.set_path(section, index, path) # Staged, written in one batch by 'flush_config'
+        if index < len(self.path_vars[section]):
+            self.path_vars[section][index].set(path)
+        else:
+            self.path_vars[section].append(StringVar(value=path))
+        self.load_path_rows(section)
+        self.set_settings_status(section, f"'{path}': {message}")
+        log.info("%s Path%d Updated to '%s'", section, index + 1, path)
+        self.mark_launcher_updated(section)
 
+    def set_settings_status(self, section, text):
+        label = self.settings_status_labels.get(section)
+        if label is not None and label.winfo_exists():
+            label.configure(text=text)
 
-        epic_path1_button = ctk.CTkButton(epic_entry1_frame,
-                                         text="Browse",
-                                         command=lambda:self.browse_file(3),
-                                         width=100
-                                         )
-        
-        epic_path1_button.pack(padx=(0,10),
-                               side="right"
-                               )
-        
 # -----------------------------------------------------------------------------------------
-    def browse_file(self, id):
-        file_path = filedialog.askdirectory()
-        if file_path:
-            if id == 1:
-                self.steam_path1.set(file_path)
-                update_config(self.config_path, self.steam_path1.get(), 1)
-                print(f"Path1 Updated to '{file_path}'")
-                self.Update_Steam = True
-            elif id == 2:
-                self.steam_path2.set(file_path)
-                update_config(self.config_path, self.steam_path2.get(), 2)
-                print(f"Path2 Updated to '{file_path}'")
-                self.Update_Steam = True
-            elif id == 3:
-                self.epic_path1.set(file_path)
-                update_config(self.config_path, self.epic_path1.get(), 3)
-                print(f"Path3 Updated to '{file_path}'")
-                self.Update_Epic = True
+    # Import a folder or zip of covers as the art pack, on a background thread ('import_art_pack' replaces the pack).
+    def browse_art_pack(self, zipped):
+        if self.art_pack_importing:
+            return
+        if zipped:
+            source = filedialog.askopenfilename(parent=self.settings_Window, filetypes=[("Zip archives", "*.zip")])
+        else:
+            source = filedialog.askdirectory(parent=self.settings_Window)
+        if not source:
+            return
+        self.art_pack_importing = True
+        self.set_art_pack_status(f"Importing '{source}'...")
+        cache_dir = os.path.join(self.current_dir, 'Cache')
+
+        def import_pack():
+            try:
+                result = import_art_pack(source, cache_dir)
+            except OSError as os_error:
+                result = {'error': str(os_error)}
+            self.dispatcher.post('art_pack', (source, result))
+
+        threading.Thread(target=import_pack, name="Art_Pack_Import", daemon=True).start()
+
+    def apply_art_pack_import(self, source, result):
+        self.art_pack_importing = False
+        if 'error' in result:
+            log.warning("Could not import the art pack '%s': %s", source, result['error'])
+            self.set_art_pack_status(f"Could not import '{source}': {result['error']}")
+            return
+        log.info("Imported %d covers from '%s' in %.1fs (%d skipped, %d duplicates)", result['imported'], source,
+                 result['seconds'], result['skipped'], result['duplicates'])
+        self.reload_art_pack()
+        self.set_art_pack_status(f"{result['imported']} covers imported, {result['skipped']} skipped")
+
+    # Load the current pack and give its covers to the tiles already on the dashboard.
+    def reload_art_pack(self):
+        self.art_pack.load()
+        for tile_key in self.tiles:
+            self.use_art_pack(tile_key, replace=True) # The pack's cover wins over one found by the art sources
+        for row in self.row_windows:
+            first_index, last_index = self.row_windows[row]
+            for tile_key in self.row_visible[row][first_index:last_index]:
+                self.show_tile_image(tile_key)
+
+    def art_pack_status_text(self):
+        stats = self.art_pack.stats()
+        if not stats['covers']:
+            return "No art pack imported"
+        return f"{stats['covers']} covers from '{stats['source']}'"
+
+    def set_art_pack_status(self, text):
+        label = getattr(self, 'art_pack_status_label', None)
+        if label is not None and label.winfo_exists():
+            label.configure(text=text)
 
 # -----------------------------------------------------------------------------------------
-    def clear_file(self, id):
-        if id == 1:
-            self.steam_path1.set(" ")
-            update_config(self.config_path, self.steam_path1.get(), 1)
-            self.Update_Steam = True
-            print("Cleared Path1")
-        elif id == 2:
-            self.steam_path2.set(" ")
-            update_config(self.config_path, self.steam_path2.get(), 2)
-            print("Cleared Path2")
+    def clear_file(self, section, index):
+        self.config_service.remove_path(section, index)
+        del self.path_vars[section][index]
+        for key in [key for key in self.path_checks if key[0] == section and key[1] >= index]:
+            del self.path_checks[key] # Their slots moved, the picks are dropped
+        self.load_path_rows(section)
+        log.info("Cleared %s Path%d", section, index + 1)
+        self.mark_launcher_updated(section)
+
+    def mark_launcher_updated(self, section):
+        if section == "Steam":
             self.Update_Steam = True
-        elif id == 3:
-            self.epic_path1.set(" ")
-            update_config(self.config_path, self.epic_path1.get(), 3)
-            print("Cleared Path3")
+        elif section == "Epic Games":
             self.Update_Epic = True
+        self.schedule_config_flush()
+
+# -----------------------------------------------------------------------------------------
+    # Coalesce config changes: every change pushes the write back, so a burst of edits is written once.
+    def schedule_config_flush(self, delay_ms=1000):
+        if self.config_flush_job is not None:
+            self.root.after_cancel(self.config_flush_job)
+        self.config_flush_job = self.root.after(delay_ms, self.flush_config)
+
+    def flush_config(self):
+        if self.config_flush_job is not None:
+            self.root.after_cancel(self.config_flush_job)
+            self.config_flush_job = None
+        try:
+            self.config_service.flush()
+        except OSError as os_error:
+            messagebox.showerror("Error", f"Failed to save 'config.ini': {os_error}")
 
 # -----------------------------------------------------------------------------------------
     def Settings_Menu_Bar(self):
@@ -866,13 +1470,7 @@ class Main_Window:
                             pady=(0, 0))
         
         # Create back button
-        if self.color == "dark":
-            back_button_icon_path = os.path.join(self.current_dir, 'Icons', 'Back-Arrow-light.png')
-        elif self.color == "light":
-            back_button_icon_path = os.path.join(self.current_dir, 'Icons', 'Back-Arrow-dark.png')
-        
-        back_button_image = Image.open(back_button_icon_path)
-        back_button_icon = ctk.CTkImage(back_button_image)
+        back_button_icon = self.theme_icon('Back-Arrow')
         # back_button = ctk.CTkButton(Menu_Bar_Frame,
         #                             image=back_button_icon,
         #                             width=5,
@@ -899,7 +1497,7 @@ class Main_Window:
 
 # -----------------------------------------------------------------------------------------
     def Kill_All_Widgets(self):
-        print("Running Destory All Widgets Function...")
+        log.debug("Running Destory All Widgets Function...")
         # Loop through all widgets in current app and destroy
         counter = 0
         for widget in self.root.winfo_children():
@@ -907,9 +1505,9 @@ class Main_Window:
                 widget.destroy()
                 counter = counter + 1
         if counter > 0:
-            print (f"Destroyed {counter} Frames with widgets!")
+            log.debug("Destroyed %d Frames with widgets!", counter)
         elif counter <= 0:
-            print ("No Widgets destroyed.")
+            log.debug("No Widgets destroyed.")
 
 # -----------------------------------------------------------------------------------------
     def Toggle_Color(self):
@@ -921,12 +1519,49 @@ class Main_Window:
             return self.color
         
 # ----------------------------------------------------------------------------------------- 
+    # Switch in place: customtkinter redraws its own widgets (icons carry both variants), the tiles in view get
+    # their new background now and the rest in idle time batches. Nothing is rebuilt or rescanned.
+    @traced(category="render")
     def Toggle_Mode(self):
         self.Toggle_Color()
-        self.Kill_All_Widgets()
         ctk.set_appearance_mode(self.color)
         self.Set_Title_Bar(self.HWND)
-        self.create_dashboard()
+        for window in (self.settings_Window, self.disk_usage_window):
+            if window is not None and window.winfo_exists():
+                self.Set_Title_Bar(windll.user32.GetParent(window.winfo_id()))
+        for row, (first_index, last_index) in self.row_windows.items():
+            for tile_key in self.row_visible[row][first_index:last_index]:
+                self.restyle_tile(self.tiles[tile_key])
+        if self.theme_job is not None:
+            self.root.after_cancel(self.theme_job)
+        self.theme_job = self.root.after_idle(self.restyle_tiles, list(self.tiles.values()))
+
+    def restyle_tiles(self, tiles, batch_size=200):
+        for tile in tiles[:batch_size]:
+            self.restyle_tile(tile)
+        if len(tiles) > batch_size:
+            self.theme_job = self.root.after_idle(self.restyle_tiles, tiles[batch_size:])
+        else:
+            self.theme_job = None
+
+    def restyle_tile(self, tile):
+        if tile['theme'] != self.color and tile['canvas'].winfo_exists():
+            tile['canvas'].configure(bg=self.tile_background_color())
+            tile['theme'] = self.color
+
+    def tile_background_color(self):
+        if self.color == 'light':
+            return "#dbdbdb"
+        return "#2b2b2b"
+
+    # An icon with both theme variants ('<name>-dark.png' is drawn in light mode and the other way around),
+    # opened once and reused by every rebuild of the menu bars.
+    def theme_icon(self, name):
+        if name not in self.icons:
+            light_image = Image.open(os.path.join(self.current_dir, 'Icons', f'{name}-dark.png'))
+            dark_image = Image.open(os.path.join(self.current_dir, 'Icons', f'{name}-light.png'))
+            self.icons[name] = ctk.CTkImage(light_image=light_image, dark_image=dark_image)
+        return self.icons[name]
 
 # -----------------------------------------------------------------------------------------
 
@@ -0,0 +1,149 @@
+# ----------------------------------
+#      File Name: Metrics.py
+#           Date: 10/19/26
+#    Description: Live numbers about the running launcher, shown by the diagnostics panel.
+#                 1. Counters ('increment'), gauges ('set_gauge') and samples ('observe', kept in a ring of the
+#                    last 'SAMPLE_WINDOW' values for percentiles) can be published from any thread.
+#                 2. Components that already count things expose them with 'add_source(name, stats)', the
+#                    'stats' function is only called when a snapshot is taken, so publishing costs nothing.
+#                 3. 'snapshot()' returns everything as plain dicts, with p50/p95/p99 for every sample ring.
+#                 Publishing is a dict update under a lock (well under a microsecond), cheap enough for the
+#                 main loop and the scan workers.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import logging                                                      # For the module logger
+import os                                                           # For reading the process memory on Linux
+import sys                                                          # For picking the process memory query
+import threading                                                    # For guarding the metrics
+from collections import deque                                       # For the sample rings
+
+log = logging.getLogger(__name__)
+
+SAMPLE_WINDOW = 1024 # Samples kept per name, percentiles describe the recent past
+#
+# ------------------------------------------------------------------------------
+# Metrics Registry Class
+
+class Metrics_Registry:
+    def __init__(self, window=SAMPLE_WINDOW):
+        self.window = window
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.samples = {} # name -> deque of the last 'window' values
+        self.sources = {} # name -> function returning a dict of the component's own counters
+
+    def increment(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name, value):
+        with self.lock:
+            self.gauges[name] = value
+
+    def observe(self, name, value):
+        with self.lock:
+            ring = self.samples.get(name)
+            if ring is None:
+                ring = self.samples[name] = deque(maxlen=self.window)
+            ring.append(value)
+
+    def add_source(self, name, stats):
+        with self.lock:
+            self.sources[name] = stats
+
+    def remove_source(self, name):
+        with self.lock:
+            self.sources.pop(name, None)
+
+    # Everything published so far. Sources run outside the lock, a failing one is reported instead of raising.
+    def snapshot(self):
+        with self.lock:
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            samples = {name: list(ring) for name, ring in self.samples.items()}
+            sources = dict(self.sources)
+        source_stats = {}
+        for name, stats in sources.items():
+            try:
+                source_stats[name] = stats()
+            except Exception as error:
+                source_stats[name] = {'error': str(error)}
+        return {
+            'counters': counters,
+            'gauges': gauges,
+            'samples': {name: summarize(values) for name, values in samples.items()},
+            'sources': source_stats
+        }
+
+    def clear(self):
+        with self.lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.samples.clear()
+
+# count, p50, p95, p99 and max of a list of samples.
+def summarize(values):
+    if not values:
+        return {'count': 0, 'p50': 0, 'p95': 0, 'p99': 0, 'max': 0}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {
+        'count': len(ordered),
+        'p50': ordered[round(last * 0.50)],
+        'p95': ordered[round(last * 0.95)],
+        'p99': ordered[round(last * 0.99)],
+        'max': ordered[last]
+    }
+#
+# ------------------------------------------------------------------------------
+# The launcher's registry, every module publishes to this one.
+
+metrics = Metrics_Registry()
+increment = metrics.increment
+set_gauge = metrics.set_gauge
+observe = metrics.observe
+add_source = metrics.add_source
+#
+# ------------------------------------------------------------------------------
+# Resident memory of this process in bytes, None when it can't be read.
+
+def process_rss():
+    try:
+        if sys.platform == 'win32':
+            return windows_rss()
+        with open('/proc/self/statm', 'r') as file: # Linux: resident pages are the second field
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource                                             # For the peak on other Unix systems
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024 # Bytes on macOS, KB elsewhere
+    except (ImportError, OSError):
+        return None
+
+def windows_rss():
+    import ctypes                                                   # For 'K32GetProcessMemoryInfo'
+    from ctypes import wintypes                                     # For the structure's field types
+
+    class Process_Memory_Counters(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+    # Declared types, the default 'int' would cut the pseudo handle of a 64 bit process to 32 bits
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.GetCurrentProcess.argtypes = []
+    kernel32.K32GetProcessMemoryInfo.restype = wintypes.BOOL
+    kernel32.K32GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(Process_Memory_Counters), wintypes.DWORD]
+
+    counters = Process_Memory_Counters()
+    counters.cb = ctypes.sizeof(counters)
+    if not kernel32.K32GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+        return None
+    return counters.WorkingSetSize
@@ -0,0 +1,94 @@
+# ----------------------------------
+#      File Name: Search_Index.py
+#           Date: 10/19/26
+#    Description: In-memory search index over the titles of the scanned game library.
+#                 1. Queries of 3+ characters are answered from a trigram index (intersection of the
+#                    posting sets of the query's trigrams) and then verified as a real substring match.
+#                 2. Shorter queries scan the titles, so they match anywhere in a title too ('ad' finds 'Hades'),
+#                    the same as a longer query would.
+#                 3. The last result is kept, so typing one more character only narrows that result
+#                    instead of searching the whole library again.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import re                                                           # For working with regex
+#
+# ------------------------------------------------------------------------------
+# Normalizes a title or query: lower case, punctuation dropped, whitespace collapsed.
+
+def normalize_title(title):
+    title = re.sub(r'[^\w\s]', '', title.lower())
+    return ' '.join(title.split())
+#
+# ------------------------------------------------------------------------------
+# Search Index Class
+
+class Search_Index:
+    def __init__(self):
+        self.titles = {} # key -> normalized title
+        self.trigrams = {} # trigram -> set of keys
+        self.last_query = None
+        self.last_result = None
+
+    def add(self, key, title):
+        if key in self.titles:
+            self.remove(key)
+        normalized = normalize_title(title)
+        self.titles[key] = normalized
+        for trigram in self.title_trigrams(normalized):
+            self.trigrams.setdefault(trigram, set()).add(key)
+        self.last_query = None # The library changed, the cached result is stale
+
+    def remove(self, key):
+        normalized = self.titles.pop(key, None)
+        if normalized is None:
+            return
+        for trigram in self.title_trigrams(normalized):
+            postings = self.trigrams.get(trigram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self.trigrams[trigram]
+        self.last_query = None
+
+    def clear(self):
+        self.__init__()
+
+    def title_trigrams(self, normalized):
+        return {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+
+    # Return the set of keys whose title contains the query, or None for an empty query (everything matches).
+    def search(self, query):
+        query = normalize_title(query)
+        if not query:
+            return None
+
+        # Typing one more character can only narrow the previous (substring) result
+        if self.last_query and query.startswith(self.last_query) and self.last_result is not None:
+            result = {key for key in self.last_result if query in self.titles[key]}
+        else:
+            result = self.trigram_search(query)
+
+        self.last_query = query
+        self.last_result = result
+        return result
+
+    def trigram_search(self, query):
+        trigrams = self.title_trigrams(query)
+        if not trigrams: # Shorter than a trigram, fall back to a plain scan
+            return {key for key, title in self.titles.items() if query in title}
+
+        postings = []
+        for trigram in trigrams:
+            keys = self.trigrams.get(trigram)
+            if not keys:
+                return set()
+            postings.append(keys)
+        postings.sort(key=len) # Intersect starting from the rarest trigram
+
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                return candidates
+        return {key for key in candidates if query in self.titles[key]} # Trigrams can match out of order
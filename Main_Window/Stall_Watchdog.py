@@ -0,0 +1,118 @@
+# ----------------------------------
+#      File Name: Stall_Watchdog.py
+#           Date: 10/19/26
+#    Description: Opt-in watchdog that detects when the Tk main loop stops responding.
+#                 1. The Tk thread sends a heartbeat every 'interval_ms' through 'root.after'.
+#                 2. A background thread checks the time since the last heartbeat. Once it is over
+#                    'threshold_ms' the main thread's Python stack is captured (via 'sys._current_frames')
+#                    and written to the stall log with a timestamp, then sampled again every threshold
+#                    for as long as the stall lasts (up to 'max_samples').
+#                 3. When the heartbeats resume, the total length of the stall is logged.
+#                 Enable with 'watchdog = true' in the '[Launcher]' section of 'config.ini'
+#                 or by setting the 'ROCKET_WATCHDOG' environment variable to 1.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import sys                                                          # For reading the main thread's current frame
+import threading                                                    # For the watchdog thread
+import time                                                         # For time-related functions
+import traceback                                                    # For formatting the captured stack
+from datetime import datetime                                       # For the timestamps in the log
+
+log = logging.getLogger(__name__)
+#
+# ------------------------------------------------------------------------------
+# Returns True when the watchdog was turned on by the environment variable or the launcher settings.
+
+def watchdog_enabled(settings):
+    return os.getenv('ROCKET_WATCHDOG', '') == '1' or settings.get('watchdog', False)
+#
+# ------------------------------------------------------------------------------
+# Stall Watchdog Class
+
+class Stall_Watchdog:
+    def __init__(self, root, log_path, threshold_ms=500, interval_ms=100, max_samples=5):
+        self.root = root
+        self.log_path = log_path
+        self.threshold = threshold_ms / 1000
+        self.interval_ms = interval_ms
+        self.max_samples = max_samples # Stack samples written per stall
+
+        self.main_thread_id = threading.main_thread().ident
+        self.last_beat = time.monotonic()
+        self.stall_started = None # Time of the last heartbeat before the current stall
+        self.samples = 0
+        self.stall_count = 0
+        self.longest_stall = 0.0
+
+        self.after_job = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        self.last_beat = time.monotonic()
+        self.beat()
+        self.thread = threading.Thread(target=self.run, name="Stall_Watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.after_job is not None:
+            try:
+                self.root.after_cancel(self.after_job)
+            except Exception: # The root window may already be destroyed
+                pass
+            self.after_job = None
+
+    # Runs on the Tk thread.
+    def beat(self):
+        self.last_beat = time.monotonic()
+        self.after_job = self.root.after(self.interval_ms, self.beat)
+
+    # Runs on the watchdog thread.
+    def run(self):
+        check_every = self.interval_ms / 2000
+        while not self.stop_event.wait(check_every):
+            now = time.monotonic()
+            last_beat = self.last_beat
+            gap = now - last_beat
+
+            if self.stall_started is not None and last_beat > self.stall_started: # Heartbeats are back
+                self.end_stall(last_beat)
+
+            if gap >= self.threshold * (self.samples + 1) and self.samples < self.max_samples:
+                if self.stall_started is None:
+                    self.stall_started = last_beat
+                    self.stall_count += 1
+                self.samples += 1
+                self.write_sample(gap)
+
+    def end_stall(self, resumed_at):
+        length = resumed_at - self.stall_started
+        self.longest_stall = max(self.longest_stall, length)
+        self.write_log(f"Main loop resumed after {length * 1000:.0f} ms\n\n")
+        self.stall_started = None
+        self.samples = 0
+
+    def write_sample(self, gap):
+        frame = sys._current_frames().get(self.main_thread_id)
+        stack = ''.join(traceback.format_stack(frame)) if frame is not None else "  <main thread stack unavailable>\n"
+        self.write_log(f"Main loop stalled for {gap * 1000:.0f} ms (sample {self.samples}), main thread stack:\n{stack}")
+
+    def write_log(self, text):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        try:
+            with open(self.log_path, 'a', encoding='utf-8') as log_file:
+                log_file.write(f"[{timestamp}] {text}")
+        except OSError as os_error:
+            log.warning("Stall watchdog could not write to '%s': %s", self.log_path, os_error)
+
+    def stats(self):
+        return {
+            "stalls": self.stall_count,
+            "longest_stall_ms": self.longest_stall * 1000,
+            "stalled_now": self.stall_started is not None
+        }
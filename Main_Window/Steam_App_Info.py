@@ -0,0 +1,218 @@
+# ----------------------------------
+#      File Name: Steam_App_Info.py
+#           Date: 10/19/26
+#    Description: Reads the metadata of installed Steam apps from Steam's binary 'appcache/appinfo.vdf'.
+#                 1. The file is memory mapped and walked once, front to back. Every entry starts with its app id
+#                    and byte size, so apps that are not installed are skipped without decoding them.
+#                 2. For the installed ones the binary KeyValues blob is decoded into nested dicts, giving the
+#                    real name, the app type (Game, Tool, Demo, ...) and the library art assets.
+#                 3. Supported versions: 0x07564427, 0x07564428 (adds a binary SHA-1 per entry) and 0x07564429
+#                    (keys are indexes into a string table at the end of the file).
+#                 Every read is bounded by the declared size of its entry: a corrupt entry is skipped (that app
+#                 falls back to its appmanifest) and a truncated file is rejected as a whole.
+#                 Results are cached by the file's mtime, Steam rewrites it whenever an app's info changes.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import logging                                                      # For the module logger
+import mmap                                                         # For mapping the file instead of reading it
+import os                                                           # For interacting with the current operating sys
+import struct                                                       # For the binary layout
+import threading                                                    # For guarding the cache between scanner threads
+
+log = logging.getLogger(__name__)
+
+APPINFO_VERSIONS = {0x07564427: 27, 0x07564428: 28, 0x07564429: 29} # magic -> version
+GAME_TYPES = {'game', 'demo', 'mod'} # App types shown on the dashboard, tools/redistributables/DLC are not
+
+HEADER = struct.Struct('<II') # magic, universe
+STRING_TABLE_OFFSET = struct.Struct('<q') # version 29 only, follows the header
+ENTRY_START = struct.Struct('<II') # app id, byte size of the rest of the entry
+ENTRY_HEADER_SIZE = {27: 40, 28: 60, 29: 60} # info state, last updated, pics token, text SHA-1, change number (+ binary SHA-1)
+INT32 = struct.Struct('<i')
+UINT32 = struct.Struct('<I')
+FLOAT32 = struct.Struct('<f')
+UINT64 = struct.Struct('<Q')
+INT64 = struct.Struct('<q')
+
+# Binary KeyValues value types
+KV_SECTION, KV_STRING, KV_INT32, KV_FLOAT32, KV_POINTER, KV_WIDE_STRING, KV_COLOR, KV_UINT64 = range(8)
+KV_END, KV_INT64, KV_END_ALT = 0x08, 0x0A, 0x0B
+MAX_KV_DEPTH = 64 # Deeper nesting only happens in a corrupt entry
+NUMBER_FORMATS = {KV_INT32: INT32, KV_POINTER: INT32, KV_COLOR: UINT32, KV_FLOAT32: FLOAT32, KV_UINT64: UINT64,
+                  KV_INT64: INT64}
+
+app_info_cache = {} # appinfo path -> (mtime_ns, app ids asked for, result)
+app_info_lock = threading.Lock()
+#
+# ------------------------------------------------------------------------------
+# Metadata of the given app ids from the appinfo of a Steam install, cached by the file's mtime.
+# Returns {} when the file is missing or can't be read, callers then fall back to the appmanifests.
+
+def load_steam_app_info(steam_executable, app_ids):
+    if not steam_executable:
+        return {}
+    appinfo_path = os.path.join(os.path.dirname(steam_executable), 'appcache', 'appinfo.vdf')
+    app_ids = frozenset(str(app_id) for app_id in app_ids)
+    try:
+        mtime = os.stat(appinfo_path).st_mtime_ns
+    except OSError:
+        return {}
+
+    with app_info_lock:
+        cached = app_info_cache.get(appinfo_path)
+        if cached is not None and cached[0] == mtime and app_ids <= cached[1]:
+            return cached[2]
+        try:
+            result = read_app_info(appinfo_path, app_ids)
+        except (OSError, ValueError, IndexError, struct.error) as error:
+            log.warning("Could not read '%s': %s", appinfo_path, error)
+            return {}
+        app_info_cache[appinfo_path] = (mtime, app_ids, result)
+        return result
+#
+# ------------------------------------------------------------------------------
+# One sequential pass over 'appinfo.vdf'. Returns app id -> {'name', 'type', 'installdir', 'assets', 'assets_full'}
+# for every app id in 'app_ids' that has an entry. Raises ValueError for an unknown version or a truncated file.
+
+def read_app_info(appinfo_path, app_ids):
+    with open(appinfo_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            magic, _ = HEADER.unpack_from(buffer, 0)
+            version = APPINFO_VERSIONS.get(magic)
+            if version is None:
+                raise ValueError(f"unsupported appinfo version 0x{magic:08x}")
+            offset = HEADER.size
+            strings = None
+            end = len(buffer)
+            if version >= 29:
+                (end,) = STRING_TABLE_OFFSET.unpack_from(buffer, offset)
+                offset += STRING_TABLE_OFFSET.size
+                if not offset <= end <= len(buffer):
+                    raise ValueError(f"string table offset {end} is outside the file")
+                strings = read_string_table(buffer, end)
+
+            apps = {}
+            while offset + ENTRY_START.size <= end:
+                app_id, size = ENTRY_START.unpack_from(buffer, offset)
+                if app_id == 0: # End marker
+                    break
+                data_start = offset + ENTRY_START.size
+                offset = data_start + size # Next entry, whether or not this one is decoded
+                if offset > end:
+                    raise ValueError(f"entry of app {app_id} runs past the end of the file")
+                if str(app_id) not in app_ids:
+                    continue
+                try:
+                    data, _ = read_binary_kv(buffer, data_start + ENTRY_HEADER_SIZE[version], strings, limit=offset)
+                except (ValueError, IndexError, struct.error) as error:
+                    log.debug("Skipping the corrupt appinfo entry of app %d: %s", app_id, error)
+                    continue # Falls back to its appmanifest
+                app = data.get('appinfo', data)
+                apps[str(app_id)] = app_fields(app if isinstance(app, dict) else {})
+            return apps
+
+# The fields the launcher uses out of an app's decoded KeyValues.
+def app_fields(app):
+    common = app.get('common')
+    config = app.get('config')
+    common = common if isinstance(common, dict) else {}
+    config = config if isinstance(config, dict) else {}
+    return {
+        'name': common.get('name'),
+        'type': common.get('type'),
+        'installdir': config.get('installdir'),
+        'assets': common.get('library_assets', {}),
+        'assets_full': common.get('library_assets_full', {})
+    }
+
+def read_string_table(buffer, offset):
+    (count,) = UINT32.unpack_from(buffer, offset)
+    offset += UINT32.size
+    strings = []
+    for _ in range(count):
+        string, offset = read_c_string(buffer, offset, len(buffer))
+        strings.append(string)
+    return strings
+
+# A NUL terminated UTF-8 string that must end before 'limit'.
+def read_c_string(buffer, offset, limit):
+    end = buffer.find(b'\0', offset, limit)
+    if end == -1:
+        raise ValueError(f"unterminated string at {offset}")
+    return buffer[offset:end].decode('utf-8', errors='replace'), end + 1
+
+# Raise ValueError unless 'count' bytes from 'offset' fit before 'limit'.
+def check_bounds(offset, count, limit):
+    if offset + count > limit:
+        raise ValueError(f"value at {offset} runs past the end of its entry")
+#
+# ------------------------------------------------------------------------------
+# Decode one binary KeyValues section starting at 'offset'. Returns (dict, offset after its end marker).
+# Keys are lower cased like the text parsers; 'strings' is the version 29 key table, None for inline keys.
+# Nothing at or after 'limit' (the end of the entry) is read, ValueError is raised instead.
+
+def read_binary_kv(buffer, offset, strings=None, limit=None, depth=0):
+    if limit is None:
+        limit = len(buffer)
+    if depth > MAX_KV_DEPTH:
+        raise ValueError(f"sections nested deeper than {MAX_KV_DEPTH} at {offset}")
+    node = {}
+    while True:
+        check_bounds(offset, 1, limit)
+        kind = buffer[offset]
+        offset += 1
+        if kind in (KV_END, KV_END_ALT):
+            return node, offset
+        if strings is None:
+            key, offset = read_c_string(buffer, offset, limit)
+        else:
+            check_bounds(offset, UINT32.size, limit)
+            (key_index,) = UINT32.unpack_from(buffer, offset)
+            if key_index >= len(strings):
+                raise ValueError(f"key index {key_index} at {offset} is outside the string table")
+            key = strings[key_index]
+            offset += UINT32.size
+
+        if kind == KV_SECTION:
+            value, offset = read_binary_kv(buffer, offset, strings, limit, depth + 1)
+        elif kind == KV_STRING:
+            value, offset = read_c_string(buffer, offset, limit)
+        elif kind in NUMBER_FORMATS:
+            number_format = NUMBER_FORMATS[kind]
+            check_bounds(offset, number_format.size, limit)
+            (value,) = number_format.unpack_from(buffer, offset)
+            offset += number_format.size
+        elif kind == KV_WIDE_STRING:
+            end = offset
+            while end + 2 <= limit and buffer[end:end + 2] != b'\0\0':
+                end += 2
+            if end + 2 > limit:
+                raise ValueError(f"unterminated wide string at {offset}")
+            value = buffer[offset:end].decode('utf-16-le', errors='replace')
+            offset = end + 2
+        else:
+            raise ValueError(f"unknown KeyValues type 0x{kind:02x} at {offset - 1}")
+        node.setdefault(key.lower(), value)
+#
+# ------------------------------------------------------------------------------
+# The 600x900 library capsule of an app, or None when Steam hasn't downloaded it.
+# Older clients cache it as '<appid>_library_600x900.jpg', newer ones in a folder per app, named by the asset hash
+# listed under 'library_assets_full'.
+
+def steam_art_path(steam_executable, app_id, info=None):
+    if not steam_executable:
+        return None
+    library_cache = os.path.join(os.path.dirname(steam_executable), 'appcache', 'librarycache')
+    candidates = [os.path.join(library_cache, f"{app_id}_library_600x900.jpg"),
+                  os.path.join(library_cache, str(app_id), "library_600x900.jpg")]
+    if info:
+        assets = info['assets_full'] if isinstance(info['assets_full'], dict) else {} # Any node type in a damaged file
+        capsule = assets.get('library_capsule')
+        image = capsule.get('image') if isinstance(capsule, dict) else None
+        if isinstance(image, dict) and isinstance(image.get('english'), str) and image['english']:
+            candidates.insert(0, os.path.join(library_cache, str(app_id), *image['english'].split('/')))
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
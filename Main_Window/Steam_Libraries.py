@@ -0,0 +1,142 @@
+# ----------------------------------
+#      File Name: Steam_Libraries.py
+#           Date: 10/19/26
+#    Description: Finds every Steam library from Steam's own 'libraryfolders.vdf', so multi drive setups don't
+#                 have to add each 'steamapps' folder to 'config.ini' by hand.
+#                 1. 'libraryfolders.vdf' (next to 'steam.exe' in 'steamapps' or 'config') lists every library
+#                    root and, since 2021, the app ids installed in it.
+#                 2. Libraries whose app list is empty are skipped without listing their folder.
+#                 3. The paths in 'config.ini' are still scanned, discovered libraries are added to them.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+
+log = logging.getLogger(__name__)
+
+VDF_ESCAPES = {'n': '\n', 't': '\t', '\\': '\\', '"': '"'}
+#
+# ------------------------------------------------------------------------------
+# Parse Valve's text KeyValues format ('"key" "value"' pairs and '"key" { ... }' blocks) into nested dicts.
+# Keys are lower cased, the first occurrence of a key wins (as in 'read_steam_manifest').
+
+def parse_vdf(text):
+    root = {}
+    stack = [root]
+    pending_key = None
+    index = 0
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if char.isspace():
+            index += 1
+        elif char == '/' and text.startswith('//', index): # Comment to the end of the line
+            end = text.find('\n', index)
+            index = length if end == -1 else end
+        elif char == '{':
+            block = {}
+            if pending_key is not None:
+                stack[-1].setdefault(pending_key, block)
+            stack.append(block)
+            pending_key = None
+            index += 1
+        elif char == '}':
+            if len(stack) > 1:
+                stack.pop()
+            pending_key = None
+            index += 1
+        else:
+            token, index = read_vdf_token(text, index)
+            if pending_key is None:
+                pending_key = token.lower()
+            else:
+                stack[-1].setdefault(pending_key, token)
+                pending_key = None
+    return root
+
+# Read one quoted (or bare) token starting at 'index'. Returns (token, index after it).
+def read_vdf_token(text, index):
+    characters = []
+    if text[index] == '"':
+        index += 1
+        while index < len(text) and text[index] != '"':
+            if text[index] == '\\' and index + 1 < len(text):
+                index += 1
+                characters.append(VDF_ESCAPES.get(text[index], '\\' + text[index]))
+            else:
+                characters.append(text[index])
+            index += 1
+        return ''.join(characters), index + 1
+    while index < len(text) and not text[index].isspace() and text[index] not in '{}"':
+        characters.append(text[index])
+        index += 1
+    return ''.join(characters), index
+#
+# ------------------------------------------------------------------------------
+# Read 'libraryfolders.vdf'. Returns a list of {'path': '<root>/steamapps', 'apps': set of app ids or None}.
+# 'apps' is None for the old format, which only lists the paths.
+
+def read_library_folders(vdf_path):
+    with open(vdf_path, 'r', encoding='utf-8', errors='replace') as file:
+        data = parse_vdf(file.read())
+    folders = data.get('libraryfolders', data.get('libraryfolder', {}))
+
+    libraries = []
+    for key, value in folders.items():
+        if not key.isdigit(): # 'contentstatsid' and other settings
+            continue
+        if isinstance(value, dict):
+            if 'path' not in value:
+                continue
+            apps = value.get('apps')
+            libraries.append({'path': os.path.join(value['path'], 'steamapps'),
+                              'apps': set(apps) if isinstance(apps, dict) else None})
+        else:
+            libraries.append({'path': os.path.join(value, 'steamapps'), 'apps': None})
+    return libraries
+
+# Location of 'libraryfolders.vdf' for a Steam install, or None when there is none.
+def find_library_folders_file(steam_executable):
+    if not steam_executable:
+        return None
+    steam_root = os.path.dirname(steam_executable)
+    for folder in ('steamapps', 'config'):
+        vdf_path = os.path.join(steam_root, folder, 'libraryfolders.vdf')
+        if os.path.isfile(vdf_path):
+            return vdf_path
+    return None
+#
+# ------------------------------------------------------------------------------
+# The 'steamapps' folders to scan: the configured paths, then every discovered library that has apps installed.
+# Duplicates (the same folder written differently) are scanned once.
+
+def steam_library_paths(configured_paths, steam_executable, discover=True):
+    paths = []
+    seen = set()
+
+    def add(path):
+        normalized = os.path.normcase(os.path.normpath(path))
+        if normalized not in seen:
+            seen.add(normalized)
+            paths.append(path)
+
+    for path in configured_paths:
+        add(path)
+    if not discover:
+        return paths
+
+    vdf_path = find_library_folders_file(steam_executable)
+    if vdf_path is None:
+        return paths
+    try:
+        libraries = read_library_folders(vdf_path)
+    except OSError as os_error:
+        log.warning("Could not read '%s': %s", vdf_path, os_error)
+        return paths
+    for library in libraries:
+        if library['apps'] is not None and not library['apps']:
+            continue # Steam knows this library is empty, don't list it
+        if os.path.isdir(library['path']):
+            add(library['path'])
+    return paths
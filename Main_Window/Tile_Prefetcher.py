@@ -0,0 +1,205 @@
+# ----------------------------------
+#      File Name: Tile_Prefetcher.py
+#           Date: 10/19/26
+#    Description: Prepares the art of the game tiles on background workers, in the order the user will see them.
+#                 1. Each row reports its visible range whenever it scrolls. The direction of travel is kept
+#                    per row, and the visible tiles plus the next 'lookahead' tiles in that direction are queued.
+#                 2. Jobs wait in a priority queue (visible first, then by distance ahead, then a few behind).
+#                 3. A jump (scrolling further than a couple of screens at once) or a new filter bumps the
+#                    row's generation, which cancels every job still queued for the old position.
+#                 4. A tile whose art is missing is not asked for again until 'reset'. One whose art couldn't be
+#                    had right now ('Art_Unavailable': rate limited, server error, timeout) is queued again after
+#                    the server's 'Retry-After' or a growing delay, up to 'MAX_RETRIES' times (waiting on sources
+#                    that rest after a 'Retry-After', without asking them, doesn't count).
+#                 Preparing a tile (loading, resizing, blurring and encoding it) happens on the workers, the
+#                 caller hands the result to the Tk thread which decodes it into a 'PhotoImage' when idle.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import heapq                                                        # For the priority queue of jobs
+import itertools                                                    # For the tie breaking job counter
+import logging                                                      # For the module logger
+import threading                                                    # For the worker threads
+import time                                                         # For the retry delays
+from .Class_Dependencies import Art_Unavailable                     # Art that may be there later
+
+log = logging.getLogger(__name__)
+
+MAX_RETRIES = 4 # Times a tile whose art was unavailable is tried again before it counts as failed
+RETRY_DELAY = 5 # Seconds before the first retry when the server didn't say, doubled for each one after
+MAX_RETRY_DELAY = 120
+#
+# ------------------------------------------------------------------------------
+# Tile Prefetcher Class
+
+class Tile_Prefetcher:
+    def __init__(self, prepare_tile, on_prepared, is_prepared, lookahead=6, behind=2, workers=2):
+        self.prepare_tile = prepare_tile # Worker thread: key -> (png bytes, size) or None, may raise 'Art_Unavailable'
+        self.on_prepared = on_prepared # Worker thread: called with (key, png bytes, size)
+        self.is_prepared = is_prepared # key -> True when the tile is already in the image cache
+        self.lookahead = lookahead # Tiles prepared ahead in the scroll direction
+        self.behind = behind # Tiles prepared behind, in case the user turns around
+
+        self.condition = threading.Condition()
+        self.heap = [] # (priority, counter, row, generation, key)
+        self.counter = itertools.count()
+        self.generations = {} # row -> generation, jobs of older generations are stale
+        self.queued = {} # key -> (row, generation, priority) of its best queued job
+        self.in_flight = set()
+        self.failed = set() # Keys with no art, not retried until 'reset'
+        self.delayed = [] # (due time, counter, row, generation, priority, key) of the jobs to retry
+        self.retrying = set() # Keys in 'delayed'
+        self.retries = {} # key -> times its art was unavailable
+        self.positions = {} # row -> first visible index
+        self.directions = {} # row -> 1 (right) or -1 (left)
+
+        # Counters reported by stats()
+        self.prepared_count = 0
+        self.cancelled_count = 0
+        self.retried_count = 0
+
+        self.stopped = False
+        self.threads = []
+        for number in range(workers):
+            thread = threading.Thread(target=self.run, name=f"Tile_Prefetcher-{number}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    # Called from the Tk thread whenever a row scrolls. 'keys' are the row's tiles in display order.
+    def update_row(self, row, keys, first, last):
+        previous = self.positions.get(row)
+        if previous is not None and first != previous:
+            if abs(first - previous) > max(last - first, 1) * 2:
+                self.cancel_row(row) # Jumped, whatever was queued for the old position is no longer useful
+            self.directions[row] = 1 if first > previous else -1
+        self.positions[row] = first
+        direction = self.directions.get(row, 1)
+
+        jobs = [(0, key) for key in keys[first:last]] # Visible tiles first
+        if direction > 0:
+            ahead = keys[last:last + self.lookahead]
+            behind = reversed(keys[max(first - self.behind, 0):first])
+        else:
+            ahead = reversed(keys[max(first - self.lookahead, 0):first])
+            behind = keys[last:last + self.behind]
+        jobs += [(1 + distance, key) for distance, key in enumerate(ahead)]
+        jobs += [(1 + self.lookahead + distance, key) for distance, key in enumerate(behind)]
+        self.schedule(row, jobs)
+
+    def schedule(self, row, jobs):
+        with self.condition:
+            generation = self.generations.get(row, 0)
+            for priority, key in jobs:
+                if key in self.in_flight or key in self.failed or key in self.retrying or self.is_prepared(key):
+                    continue
+                queued = self.queued.get(key)
+                if queued is not None and queued[:2] == (row, generation) and queued[2] <= priority:
+                    continue # Already queued at least as urgently
+                self.queued[key] = (row, generation, priority)
+                heapq.heappush(self.heap, (priority, next(self.counter), row, generation, key))
+            self.condition.notify_all()
+
+    # Drop every queued job of a row (filtered, rebuilt or jumped).
+    def cancel_row(self, row):
+        with self.condition:
+            self.generations[row] = self.generations.get(row, 0) + 1
+            self.positions.pop(row, None)
+
+    # Drop every queued job and forget failed tiles (the dashboard was rebuilt).
+    def reset(self):
+        with self.condition:
+            self.cancelled_count += len(self.heap)
+            self.heap.clear()
+            self.queued.clear()
+            self.failed.clear()
+            self.delayed.clear()
+            self.retrying.clear()
+            self.retries.clear()
+            self.positions.clear()
+            for row in self.generations:
+                self.generations[row] += 1
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+
+    # Worker thread loop.
+    def run(self):
+        while True:
+            with self.condition:
+                while True:
+                    self.release_delayed()
+                    if self.heap or self.stopped:
+                        break
+                    self.condition.wait(self.delayed[0][0] - time.monotonic() if self.delayed else None)
+                if self.stopped:
+                    return
+                priority, _, row, generation, key = heapq.heappop(self.heap)
+                if generation != self.generations.get(row, 0):
+                    self.cancelled_count += 1
+                    if self.queued.get(key, (None, None))[:2] == (row, generation):
+                        del self.queued[key]
+                    continue
+                if self.queued.get(key) == (row, generation, priority):
+                    del self.queued[key]
+                if key in self.in_flight or key in self.failed or self.is_prepared(key):
+                    continue
+                self.in_flight.add(key)
+
+            result = None
+            unavailable = None
+            try:
+                result = self.prepare_tile(key)
+            except Art_Unavailable as error:
+                unavailable = error
+            except Exception as error: # A broken image must not kill the worker
+                log.warning("Failed to prepare tile '%s': %s", key, error)
+
+            with self.condition:
+                self.in_flight.discard(key)
+                if unavailable is not None and (unavailable.resting or self.retries.get(key, 0) < MAX_RETRIES):
+                    self.retry_later(key, row, generation, priority, unavailable.retry_after, unavailable.resting)
+                elif result is None:
+                    self.failed.add(key)
+                    self.retries.pop(key, None)
+                else:
+                    self.prepared_count += 1
+                    self.retries.pop(key, None)
+            if result is not None:
+                self.on_prepared(key, *result)
+
+    # Queue a job again after 'retry_after' seconds, or a delay doubling with each retry. Holding the condition.
+    # Waiting on sources that rest after a 'Retry-After' asked nothing, it doesn't count as a retry.
+    def retry_later(self, key, row, generation, priority, retry_after, resting=False):
+        retries = self.retries.get(key, 0)
+        delay = retry_after if retry_after is not None else RETRY_DELAY * 2 ** retries
+        if not resting:
+            self.retries[key] = retries + 1
+        self.retrying.add(key)
+        heapq.heappush(self.delayed, (time.monotonic() + min(delay, MAX_RETRY_DELAY), next(self.counter), row, generation, priority, key))
+        self.condition.notify_all() # Idle workers wait until the earliest retry is due
+        log.debug("Art of '%s' unavailable, retrying in %.0fs", key, min(delay, MAX_RETRY_DELAY))
+
+    # Move the retries that are due into the job queue. Holding the condition. A job of a row that was cancelled in
+    # the meantime is dropped like any stale job, the row's next 'update_row' queues the tile again.
+    def release_delayed(self):
+        now = time.monotonic()
+        while self.delayed and self.delayed[0][0] <= now:
+            _, counter, row, generation, priority, key = heapq.heappop(self.delayed)
+            self.retrying.discard(key)
+            self.retried_count += 1
+            self.queued[key] = (row, generation, priority)
+            heapq.heappush(self.heap, (priority, counter, row, generation, key))
+
+    def stats(self):
+        with self.condition:
+            return {
+                "pending": len(self.heap),
+                "in_flight": len(self.in_flight),
+                "prepared": self.prepared_count,
+                "cancelled": self.cancelled_count,
+                "retrying": len(self.delayed),
+                "retried": self.retried_count,
+                "failed": len(self.failed)
+            }
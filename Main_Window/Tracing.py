@@ -0,0 +1,167 @@
+# ----------------------------------
+#      File Name: Tracing.py
+#           Date: 10/19/26
+#    Description: Timeline of where a start up or refresh spends its time, written as a Chrome trace
+#                 ('trace.json', open it in https://ui.perfetto.dev or chrome://tracing).
+#                 1. 'span(name)' is a context manager (and 'traced(name)' a decorator) that records one complete
+#                    event with the thread it ran on. Spans opened inside each other nest on the timeline.
+#                 2. Turned on with the 'ROCKET_TRACE' environment variable ('1' for 'Logs/trace.json', or a file
+#                    path) or the command line's '--trace'. Events are kept in memory and written on exit.
+#                 3. When tracing is off 'span' returns a shared object that does nothing, the cost is one global
+#                    check per call.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import atexit                                                       # For writing the trace on exit
+import functools                                                    # For keeping the traced function's name
+import json                                                         # For the trace file
+import logging                                                      # For the module logger
+import os                                                           # For interacting with the current operating sys
+import threading                                                    # For the thread ids and names
+import time                                                         # For the timestamps
+
+log = logging.getLogger(__name__)
+
+MAX_EVENTS = 1_000_000 # Events kept, later ones are dropped so a long session can't grow without bound
+
+enabled = False
+trace_path = None
+events = [] # Chrome trace events, 'list.append' is atomic so every thread appends without a lock
+thread_names = {} # thread id -> name, written as metadata events
+dropped = 0
+#
+# ------------------------------------------------------------------------------
+# Start recording. 'path' is where the trace is written on exit.
+
+def start_tracing(path):
+    global enabled, trace_path
+    if enabled:
+        return
+    trace_path = path
+    enabled = True
+    atexit.register(write_trace)
+
+# Write the trace now and stop recording (on close, while logging still runs).
+def stop_tracing():
+    global enabled
+    path = write_trace()
+    enabled = False
+    return path
+
+# Turn tracing on when 'ROCKET_TRACE' is set: '1' writes '<log_dir>/trace.json', anything else is the file path.
+def start_tracing_from_environment(log_dir):
+    value = os.getenv('ROCKET_TRACE', '')
+    if value and value != '0':
+        start_tracing(os.path.join(log_dir, 'trace.json') if value == '1' else value)
+    return enabled
+
+def now_us():
+    return time.perf_counter_ns() // 1000
+
+def record(event):
+    global dropped
+    if len(events) >= MAX_EVENTS:
+        dropped += 1
+        return
+    thread = threading.current_thread()
+    if thread.ident not in thread_names:
+        thread_names[thread.ident] = thread.name
+    event['pid'] = os.getpid()
+    event['tid'] = thread.ident
+    events.append(event)
+#
+# ------------------------------------------------------------------------------
+# Span Class. One complete ('X') event from '__enter__' to '__exit__'.
+
+class Span:
+    __slots__ = ('name', 'category', 'args', 'start')
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = now_us()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        event = {'name': self.name, 'cat': self.category, 'ph': 'X', 'ts': self.start, 'dur': now_us() - self.start}
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        if self.args:
+            event['args'] = self.args
+        record(event)
+        return False
+
+    # Add arguments found out while the span runs ex: the number of games a scan found
+    def set(self, **args):
+        self.args.update(args)
+
+# What 'span' returns when tracing is off
+class Null_Span:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set(self, **args):
+        pass
+
+NULL_SPAN = Null_Span()
+#
+# ------------------------------------------------------------------------------
+# The span API used across the launcher.
+
+def span(name, category="launcher", **args):
+    if not enabled:
+        return NULL_SPAN
+    return Span(name, category, args)
+
+# Decorator form of 'span', the function's name is used when 'name' is not given.
+def traced(name=None, category="launcher"):
+    def decorator(function):
+        span_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+            with Span(span_name, category, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# A point in time on the timeline ex: the dashboard becoming usable.
+def instant(name, category="launcher", **args):
+    if enabled:
+        event = {'name': name, 'cat': category, 'ph': 'i', 's': 't', 'ts': now_us()}
+        if args:
+            event['args'] = args
+        record(event)
+#
+# ------------------------------------------------------------------------------
+# Write the recorded events to 'trace_path' (on exit, or sooner to look at a running launcher).
+
+def write_trace():
+    if not enabled or trace_path is None:
+        return None
+    metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': ident, 'args': {'name': name}}
+                for ident, name in list(thread_names.items())]
+    trace = {'traceEvents': metadata + list(events), 'displayTimeUnit': 'ms'}
+    if dropped:
+        trace['otherData'] = {'dropped_events': dropped}
+    try:
+        directory = os.path.dirname(trace_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(trace_path, 'w', encoding='utf-8') as file:
+            json.dump(trace, file)
+    except OSError as os_error:
+        log.warning("Could not write trace '%s': %s", trace_path, os_error)
+        return None
+    log.info("Wrote %d trace events to '%s'", len(events), trace_path)
+    return trace_path
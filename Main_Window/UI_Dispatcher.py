@@ -0,0 +1,147 @@
+# ----------------------------------
+#      File Name: UI_Dispatcher.py
+#           Date: 10/19/26
+#    Description: Hands results of background threads (scans, tile art, checks, forwarded commands) to the Tk thread.
+#                 1. Any thread calls 'post(kind, result)'. One 'root.after' pump on the Tk thread drains the queue
+#                    and calls the handler registered for each kind.
+#                 2. Coalescing: a kind registered with a 'coalesce' function keeps one pending result per key,
+#                    a newer one replaces the one still waiting (ex: two library scans, only the last is applied).
+#                 3. Batching: a 'batch' handler gets every pending result of its kind of the frame in one call, so
+#                    a hundred tile art arrivals cost one layout pass instead of a hundred.
+#                 4. Per frame budget: the pump stops after 'budget_ms' of handler time and continues on the next
+#                    frame, so a burst of results never freezes the window. Batches count toward it with the
+#                    measured cost per result of their kind.
+#                 5. Back-pressure: while 'max_pending' results are waiting, 'post' from a worker thread blocks
+#                    until the pump catches up (the Tk thread itself never blocks).
+#                 How late each pump runs is published as the 'frame_latency_ms' metric: the time the main loop
+#                 was busy with something else (drawing, a handler, a stall) when the pump was due.
+# -----------------------------------------------------------------------
+# Import Statement(s)
+# -------------------
+import itertools                                                    # For the keys of results that aren't coalesced
+import logging                                                      # For the module logger
+import threading                                                    # For the queue lock and blocking producers
+import time                                                         # For the frame budget
+from .Metrics import observe                                        # For the main loop's frame latency
+
+log = logging.getLogger(__name__)
+
+FRAME_MS = 16 # Pump interval while results are waiting (about 60 frames per second)
+IDLE_MS = 100 # Pump interval while the queue is empty
+#
+# ------------------------------------------------------------------------------
+# UI Dispatcher Class
+
+class UI_Dispatcher:
+    def __init__(self, root, budget_ms=8, max_pending=500, max_batch=64):
+        self.root = root
+        self.budget = budget_ms / 1000
+        self.max_pending = max_pending
+        self.max_batch = max_batch # Results of one kind handed to a batch handler per frame
+        self.handlers = {} # kind -> (handler, coalesce function or None, batch)
+        self.item_cost = {} # batch kind -> moving average of its handler's seconds per result
+        self.condition = threading.Condition()
+        self.pending = {} # (kind, key) -> result, in arrival order (a coalesced result keeps its place)
+        self.counter = itertools.count()
+        self.tk_thread = threading.current_thread()
+        self.job = None
+        self.due = None # When the scheduled pump should run
+        self.stopped = False
+        self.counts = {'posted': 0, 'coalesced': 0, 'handled': 0, 'frames': 0, 'over_budget': 0, 'blocked': 0,
+                       'errors': 0}
+        self.max_depth = 0
+
+    # 'handler(result)' runs on the Tk thread, or 'handler(results)' with a list for 'batch=True'.
+    # 'coalesce(result)' returns the key under which only the newest pending result is kept.
+    def register(self, kind, handler, coalesce=None, batch=False):
+        self.handlers[kind] = (handler, coalesce, batch)
+
+    # Any thread. Blocks a worker while the queue is full, results posted after 'stop' are dropped.
+    def post(self, kind, result):
+        coalesce = self.handlers[kind][1]
+        key = (kind, coalesce(result) if coalesce else next(self.counter))
+        with self.condition:
+            if threading.current_thread() is not self.tk_thread and len(self.pending) >= self.max_pending:
+                self.counts['blocked'] += 1
+                while len(self.pending) >= self.max_pending and not self.stopped:
+                    self.condition.wait(0.1)
+            if self.stopped:
+                return
+            self.counts['posted'] += 1
+            if key in self.pending:
+                self.counts['coalesced'] += 1
+            self.pending[key] = result
+            self.max_depth = max(self.max_depth, len(self.pending))
+
+    def start(self):
+        self.schedule(IDLE_MS)
+
+    def schedule(self, delay_ms):
+        self.due = time.perf_counter() + delay_ms / 1000
+        self.job = self.root.after(delay_ms, self.pump)
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.pending.clear()
+            self.condition.notify_all() # Release blocked workers
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+
+    # Tk thread: handle what fits in the frame budget, then schedule the next frame.
+    def pump(self):
+        start = time.perf_counter()
+        if self.due is not None:
+            observe('frame_latency_ms', max(start - self.due, 0) * 1000)
+        batches = {} # kind -> results for its batch handler
+        batch_cost = 0 # Expected time of the batch handlers, run after the loop
+        with self.condition:
+            keys = list(self.pending)
+        handled = 0
+
+        for key in keys:
+            kind = key[0]
+            handler, _, batch = self.handlers[kind]
+            cost = self.item_cost.get(kind, self.budget / 8) if batch else 0 # Unmeasured batches start small
+            if time.perf_counter() - start + batch_cost + cost >= self.budget and handled:
+                self.counts['over_budget'] += 1
+                break
+            if batch and len(batches.get(kind, ())) >= self.max_batch:
+                continue # Left for the next frame
+            with self.condition:
+                if key not in self.pending:
+                    break # Cleared by 'stop' from a handler
+                result = self.pending.pop(key)
+                self.condition.notify_all()
+            if batch:
+                batches.setdefault(kind, []).append(result)
+                batch_cost += cost
+            else:
+                self.run_handler(kind, handler, result)
+            handled += 1
+
+        for kind, results in batches.items(): # One call, and one layout pass, per kind
+            batch_start = time.perf_counter()
+            self.run_handler(kind, self.handlers[kind][0], results)
+            cost = (time.perf_counter() - batch_start) / len(results)
+            self.item_cost[kind] = self.item_cost.get(kind, cost) * 0.8 + cost * 0.2
+
+        with self.condition:
+            self.counts['frames'] += 1
+            self.counts['handled'] += handled
+            waiting = bool(self.pending)
+            if self.stopped:
+                return
+        self.schedule(FRAME_MS if waiting else IDLE_MS)
+
+    def run_handler(self, kind, handler, result):
+        try:
+            handler(result)
+        except Exception: # One bad result must not stop the pump
+            self.counts['errors'] += 1
+            log.exception("UI handler for '%s' failed", kind)
+
+    def stats(self):
+        with self.condition:
+            return dict(self.counts, pending=len(self.pending), max_depth=self.max_depth)
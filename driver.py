@@ -17,16 +17,30 @@
 #                 │   ├── __init__.py                   # Needed for module practices.
 #                 │   ├── Main_Window_Class.py          # Class definition for the Main Window.
 #                 │   └── Class_Dependencies.py         # New module for Main Window's dependent functions.
+#                 │   └── Command_Line.py               # Headless 'list'/'launch'/'disk-usage' commands (no GUI).
+#                 │   └── Instance_Server.py            # Forwards repeat invocations to the running launcher.
 #                 ├── Installer_Wizard.py               # Install Script for first setup of this program.
 #                 └── Steam_Launcher.exe                # Executable program converted from 'pyinstaller' module.
 # ---------------------------------------------------------------------------------------------------------------
 # Import Statement(s)
 # -------------------
-import customtkinter as ctk                             # For more customization than Tkinter
-from Main_Window.Main_Window_Class import Main_Window   # Import the class to create the window
+import os                                               # For interacting with the current operating sys
+import sys                                              # For reading the command line arguments
+# The GUI modules are imported in main() so the command line ('driver.py list/launch') never loads Tkinter or PIL
 # ---------------------------------------------------------------------------------------------
 # Main Function
 def main():
+    if len(sys.argv) > 1: # Headless command line, ex: 'driver.py launch "Garrys Mod"'
+        from Main_Window.Command_Line import run_cli
+        sys.exit(run_cli(sys.argv[1:], os.path.dirname(os.path.abspath(sys.argv[0]))))
+
+    # Bring the already running launcher to the front instead of starting a second one
+    from Main_Window.Instance_Server import send_to_running_instance
+    if send_to_running_instance(os.path.dirname(os.path.abspath(sys.argv[0])), {'command': 'show'}) is not None:
+        sys.exit(0)
+
+    import customtkinter as ctk                             # For more customization than Tkinter
+    from Main_Window.Main_Window_Class import Main_Window   # Import the class to create the window
     root = ctk.CTk()    # Create root window
     Main_Window(root)   # Call the class to populate the root window
     root.mainloop()     # run the application in a loop
@@ -0,0 +1,10 @@
+# ----------------------------------
+#      File Name: conftest.py
+#           Date: 10/19/26
+#    Description: Lets the tests import the 'Main_Window' package from the project folder.
+#                 Run from the project folder with 'python -m pytest -q'.
+# -----------------------------------------------------------------------
+import os                                                           # For interacting with the current operating sys
+import sys                                                          # For the import path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,198 @@
+# ----------------------------------
+#      File Name: test_art_resolver.py
+#           Date: 10/19/26
+#    Description: Tests of the art resolver's scheduling: local covers are found even while slow remote sources
+#                 hold every worker, remote requests are given only the budget that is left, and a source that
+#                 can't answer right now makes the game 'unavailable' (try again) rather than 'no cover'.
+# -----------------------------------------------------------------------
+import threading                                                    # For holding the remote sources
+import time                                                         # For the budget checks
+from types import SimpleNamespace                                   # For game records and images
+import pytest                                                       # For the expected exceptions
+from Main_Window.Art_Resolver import (Art_Resolver, Art_Source, Giant_Bomb_Source, Http_Source, default_art_sources,
+                                      request_timeout)
+from Main_Window import Art_Resolver as art_resolver, Class_Dependencies as class_dependencies
+from Main_Window.Class_Dependencies import REQUEST_TIMEOUT, Art_Unavailable, retry_after
+
+COVER = SimpleNamespace(width=300, height=450)
+#
+# ------------------------------------------------------------------------------
+# Stand-in sources
+
+class Slow_Remote_Source(Art_Source):
+    expected_ms = 1 # Ranked before the local source
+
+    def __init__(self, name, release):
+        self.name = name
+        self.release = release
+        self.time_left = []
+
+    def fetch(self, record, deadline=None):
+        self.time_left.append(deadline - time.monotonic())
+        self.release.wait(deadline - time.monotonic() + 0.5) # Still busy when the resolver gives up
+        return None
+
+class Local_Source(Art_Source):
+    name = "local"
+    expected_ms = 50
+    local = True
+
+    def __init__(self, covers):
+        self.covers = covers
+
+    def fetch(self, record, deadline=None):
+        return COVER if record.name in self.covers else None
+
+def record(name):
+    return SimpleNamespace(name=name, launcher='Epic', app_id=None, app_name=None, art_path=None)
+#
+# ------------------------------------------------------------------------------
+
+def test_local_covers_are_found_while_remote_sources_hold_every_worker():
+    release = threading.Event()
+    remote = [Slow_Remote_Source(f"remote{number}", release) for number in range(2)]
+    resolver = Art_Resolver(remote + [Local_Source({"Hades", "Celeste"})], budget_ms=300, workers=2)
+    try:
+        with pytest.raises(Art_Unavailable): # Out of time, both workers still busy with remote fetches
+            resolver.resolve(record("Unknown"))
+        start = time.monotonic()
+        assert resolver.resolve(record("Hades")) is COVER
+        assert resolver.resolve(record("Celeste")) is COVER
+        assert time.monotonic() - start < 0.1
+        assert resolver.stats()['sources']['local']['wins'] == 2
+    finally:
+        release.set()
+        resolver.stop()
+
+def test_remote_sources_get_the_budget_left():
+    release = threading.Event()
+    source = Slow_Remote_Source("remote", release)
+    resolver = Art_Resolver([source], budget_ms=200)
+    try:
+        with pytest.raises(Art_Unavailable):
+            resolver.resolve(record("Unknown"))
+        assert 0 < source.time_left[0] <= 0.2
+    finally:
+        release.set()
+        resolver.stop()
+
+def test_request_timeout_is_cut_to_the_budget():
+    assert request_timeout(None) == REQUEST_TIMEOUT
+    assert all(0.4 < limit <= 0.5 for limit in request_timeout(time.monotonic() + 0.5))
+    connect, read = request_timeout(time.monotonic() + 10)
+    assert connect == REQUEST_TIMEOUT[0] and 9 < read <= 10
+
+# Giant Bomb's search and image requests run one after the other, the second only gets what the first left.
+def test_giant_bomb_requests_share_one_deadline(monkeypatch):
+    from io import BytesIO
+    from PIL import Image
+    image = BytesIO()
+    Image.new('RGB', (300, 450)).save(image, 'PNG')
+    timeouts = []
+
+    class Session:
+        def get(self, url, timeout, **_):
+            timeouts.append(timeout)
+            time.sleep(0.1)
+            if url.endswith('/search'):
+                return SimpleNamespace(status_code=200, json=lambda: {'results': [{'image': {'medium_url': 'http://x/c.png'}}]})
+            return SimpleNamespace(status_code=200, content=image.getvalue())
+
+    monkeypatch.setattr(class_dependencies, 'get_http_session', Session)
+    assert Giant_Bomb_Source(None, 'http://x/api').fetch(record("Hades"), time.monotonic() + 0.3) is not None
+    assert timeouts[0][1] <= 0.3 and timeouts[1][1] <= timeouts[0][1] - 0.1 # Not a fresh budget per request
+
+def test_base_source_finds_nothing():
+    assert Art_Source().fetch(record("Hades")) is None
+
+def test_bad_url_templates_are_dropped(caplog):
+    sources = default_art_sources(None, '/missing', None, 'http://127.0.0.1:1/api',
+                                  "http://a/{title}.jpg, http://b/{name}.jpg, http://c/{0}.jpg, http://d/{title.jpg")
+    names = [source.name for source in sources]
+    assert names == ["steam_cache", "art_folder", "http:a", "giant_bomb"]
+    assert caplog.text.count("Ignoring the art URL template") == 3
+    resolver = Art_Resolver(sources, budget_ms=50)
+    try:
+        assert [source.name for source in resolver.ranked(record("Hades"))] # Never raises
+    finally:
+        resolver.stop()
+
+#
+# ------------------------------------------------------------------------------
+# Misses and answers that only mean "not now"
+
+class Answer_Source(Art_Source):
+    def __init__(self, name, answer):
+        self.name = name
+        self.answer = answer
+        self.asked = 0
+
+    def fetch(self, record, deadline=None):
+        self.asked += 1
+        if isinstance(self.answer, Exception):
+            raise self.answer
+        return self.answer
+
+def test_every_source_missing_gives_none():
+    resolver = Art_Resolver([Answer_Source("a", None), Answer_Source("b", None)], budget_ms=500)
+    try:
+        assert resolver.resolve(record("Hades")) is None
+        assert resolver.stats()['unresolved'] == 1
+    finally:
+        resolver.stop()
+
+def test_rate_limited_source_is_left_alone_until_retry_after():
+    limited = Answer_Source("limited", Art_Unavailable("HTTP 429", retry_after=30))
+    resolver = Art_Resolver([limited, Answer_Source("empty", None)], budget_ms=500)
+    try:
+        with pytest.raises(Art_Unavailable) as first:
+            resolver.resolve(record("Hades"))
+        assert first.value.retry_after == 30
+        with pytest.raises(Art_Unavailable) as second:
+            resolver.resolve(record("Celeste"))
+        assert limited.asked == 1 # Resting
+        assert 29 < second.value.retry_after <= 30
+        assert not first.value.resting and not second.value.resting # 'empty' was asked both times
+        assert resolver.stats()['sources']['limited']['unavailable'] == 1
+    finally:
+        resolver.stop()
+
+def test_only_resting_sources_ask_nothing():
+    resolver = Art_Resolver([Answer_Source("limited", Art_Unavailable("HTTP 429", retry_after=30))], budget_ms=500)
+    try:
+        with pytest.raises(Art_Unavailable):
+            resolver.resolve(record("Hades"))
+        with pytest.raises(Art_Unavailable) as resting:
+            resolver.resolve(record("Celeste"))
+        assert resting.value.resting
+    finally:
+        resolver.stop()
+
+def test_a_cover_wins_over_an_unavailable_source():
+    resolver = Art_Resolver([Answer_Source("down", Art_Unavailable("HTTP 503")), Answer_Source("up", COVER)], budget_ms=500)
+    try:
+        assert resolver.resolve(record("Hades")) is COVER
+    finally:
+        resolver.stop()
+
+@pytest.mark.parametrize('status, headers, expected', [
+    (429, {'Retry-After': '7'}, 7.0),
+    (503, {}, None),
+    (500, {'Retry-After': 'soon'}, None),
+])
+def test_http_source_rate_limits_and_server_errors_are_transient(monkeypatch, status, headers, expected):
+    response = SimpleNamespace(status_code=status, headers=headers)
+    monkeypatch.setattr(art_resolver, 'get_http_session', lambda: SimpleNamespace(get=lambda url, timeout: response))
+    with pytest.raises(Art_Unavailable) as error:
+        Http_Source('http://x/{title}.jpg').fetch(record("Hades"), time.monotonic() + 1)
+    assert error.value.retry_after == expected
+
+def test_http_source_not_found_is_a_miss(monkeypatch):
+    response = SimpleNamespace(status_code=404, headers={})
+    monkeypatch.setattr(art_resolver, 'get_http_session', lambda: SimpleNamespace(get=lambda url, timeout: response))
+    assert Http_Source('http://x/{title}.jpg').fetch(record("Hades"), time.monotonic() + 1) is None
+
+def test_retry_after_as_a_date():
+    from email.utils import formatdate
+    seconds = retry_after(SimpleNamespace(headers={'Retry-After': formatdate(time.time() + 60, usegmt=True)}))
+    assert 55 < seconds <= 60
@@ -0,0 +1,35 @@
+# ----------------------------------
+#      File Name: test_command_line.py
+#           Date: 10/19/26
+#    Description: Tests of the headless command line served from the library index.
+# -----------------------------------------------------------------------
+import json                                                         # For the play history and '--json' output
+import os                                                           # For interacting with the current operating sys
+from types import SimpleNamespace                                   # For the config model
+from Main_Window.Command_Line import run_cli
+from Main_Window.Game_Library import Game_Library, Game_Record
+from Main_Window.Library_Index import save_library_index
+
+def write_launcher_folder(tmp_path):
+    (tmp_path / 'Config').mkdir()
+    config_path = tmp_path / 'Config' / 'config.ini'
+    config_path.write_text("", encoding='utf-8')
+    library = Game_Library()
+    library.add(Game_Record('steam:4000', 'Steam', {'name': "Garry's Mod", 'app_id': '4000', 'last_played': 2000}))
+    library.add(Game_Record('epic:Sugar', 'Epic Games', {'name': "Hades", 'app_name': 'Sugar', 'last_played': 1000}))
+    config = SimpleNamespace(launchers={}, mtime=os.stat(config_path).st_mtime_ns)
+    save_library_index(str(tmp_path / 'Cache' / 'library_index.bin'), library, config)
+
+def listed_names(tmp_path, capsys, sort):
+    assert run_cli(['list', '--json', '--sort', sort], str(tmp_path)) == 0
+    return [record['name'] for record in json.loads(capsys.readouterr().out)]
+
+def test_list_uses_the_stored_order(tmp_path, capsys):
+    write_launcher_folder(tmp_path)
+    assert listed_names(tmp_path, capsys, 'last_played') == ["Garry's Mod", "Hades"]
+
+def test_list_includes_games_played_since_the_index_was_written(tmp_path, capsys):
+    write_launcher_folder(tmp_path)
+    (tmp_path / 'Config' / 'play_history.json').write_text(json.dumps({'epic:Sugar': 3000}), encoding='utf-8')
+    assert listed_names(tmp_path, capsys, 'last_played') == ["Hades", "Garry's Mod"]
+    assert listed_names(tmp_path, capsys, 'name') == ["Garry's Mod", "Hades"]
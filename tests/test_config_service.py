@@ -0,0 +1,20 @@
+# ----------------------------------
+#      File Name: test_config_service.py
+#           Date: 10/19/26
+#    Description: Tests of writing 'config.ini': staged paths are written atomically and the file keeps its permissions.
+# -----------------------------------------------------------------------
+import os                                                           # For the file permissions
+import stat                                                         # For reading the permission bits
+import pytest                                                       # For skipping where permissions don't apply
+from Main_Window.Config_Service import Config_Service
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIX permission bits")
+def test_flush_keeps_the_permissions_of_the_config(tmp_path):
+    config_path = tmp_path / 'config.ini'
+    config_path.write_text("[Steam]\npath1 = \n", encoding='utf-8')
+    os.chmod(config_path, 0o644)
+    service = Config_Service(str(config_path))
+    service.set_paths('Steam', [str(tmp_path / 'steamapps')])
+    assert service.flush()
+    assert stat.S_IMODE(os.stat(config_path).st_mode) == 0o644
+    assert service.get().launchers['Steam'].paths == [str(tmp_path / 'steamapps')]
@@ -0,0 +1,19 @@
+# ----------------------------------
+#      File Name: test_disk_usage.py
+#           Date: 10/19/26
+#    Description: Tests of the disk usage report, including a cache file that can't be written.
+# -----------------------------------------------------------------------
+from types import SimpleNamespace                                   # For the game records
+from Main_Window.Disk_Usage import Disk_Usage_Analyzer
+
+def test_report_survives_a_cache_that_cannot_be_saved(tmp_path, caplog):
+    install_dir = tmp_path / 'Hades'
+    (install_dir / 'Content').mkdir(parents=True)
+    (install_dir / 'Hades.exe').write_bytes(b'x' * 100)
+    (install_dir / 'Content' / 'data.pak').write_bytes(b'x' * 1000)
+    (tmp_path / 'Cache').write_text("a file where the cache folder belongs")
+    record = SimpleNamespace(key='epic:Hades', name="Hades", launcher='Epic Games', install_dir=str(install_dir),
+                             size_on_disk=0)
+    report = Disk_Usage_Analyzer(str(tmp_path / 'Cache' / 'disk_usage.json')).report([record])
+    assert report['total'] == 1100
+    assert "Could not save the disk usage cache" in caplog.text
@@ -0,0 +1,75 @@
+# ----------------------------------
+#      File Name: test_epic_installs.py
+#           Date: 10/19/26
+#    Description: Tests of finding Epic installs from 'LauncherInstalled.dat' and the '.item' manifests,
+#                 including files that are valid JSON but not what Epic writes.
+# -----------------------------------------------------------------------
+import json                                                         # For writing the Epic files
+import os                                                           # For interacting with the current operating sys
+import pytest                                                       # For the parametrized tests
+from Main_Window.Epic_Installs import epic_install_records, read_launcher_installed
+
+def write_item(folder, filename, data):
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / filename).write_text(data if isinstance(data, str) else json.dumps(data), encoding='utf-8')
+
+def item(app_name, name, install_location):
+    return {'AppName': app_name, 'DisplayName': name, 'InstallLocation': install_location,
+            'LaunchExecutable': f"{app_name}.exe", 'InstallSize': 1024}
+
+def test_dat_decides_what_is_installed_and_where(tmp_path):
+    manifests = tmp_path / 'Manifests'
+    write_item(manifests, 'a.item', item('Sugar', "Hades", r'C:\Old\Hades'))
+    write_item(manifests, 'b.item', item('Fortnite', "Fortnite", r'C:\Fortnite')) # Uninstalled, left behind
+    dat = tmp_path / 'LauncherInstalled.dat'
+    dat.write_text(json.dumps({'InstallationList': [{'AppName': 'Sugar', 'InstallLocation': r'D:\Hades'},
+                                                    {'AppName': 'UE_5.3', 'InstallLocation': r'D:\UE_5.3'}]}))
+    records = epic_install_records(str(manifests), 'Epic.exe', str(dat))
+    assert [(record['name'], record['install_dir']) for record in records] == [("Hades", r'D:\Hades')]
+
+@pytest.mark.parametrize('content', ['[]', '"text"', '{"InstallationList": 3}', '{"InstallationList": [1, null]}'])
+def test_dat_that_is_not_an_installation_list(tmp_path, content):
+    dat = tmp_path / 'LauncherInstalled.dat'
+    dat.write_text(content)
+    mtime, installed = read_launcher_installed(str(dat))
+    assert installed in (None, {})
+
+def test_unreadable_dat_keeps_every_manifest(tmp_path):
+    manifests = tmp_path / 'Manifests'
+    write_item(manifests, 'a.item', item('Sugar', "Hades", r'C:\Hades'))
+    dat = tmp_path / 'LauncherInstalled.dat'
+    dat.write_text('[]')
+    records = epic_install_records(str(manifests), 'Epic.exe', str(dat))
+    assert [record['install_dir'] for record in records] == [r'C:\Hades']
+
+def test_manifest_that_is_not_an_object_is_skipped(tmp_path):
+    manifests = tmp_path / 'Manifests'
+    write_item(manifests, 'a.item', '["not", "a", "manifest"]')
+    write_item(manifests, 'b.item', item('Sugar', "Hades", r'C:\Hades'))
+    records = epic_install_records(str(manifests), 'Epic.exe', str(tmp_path / 'missing.dat'))
+    assert [record['name'] for record in records] == ["Hades"]
+    assert records[0]['executable'] == os.path.normpath(os.path.join(r'C:\Hades', 'Sugar.exe'))
+
+# A new run (the module cache emptied) reads the parsed manifests back instead of parsing the '.item' files again.
+def test_parsed_manifests_are_kept_on_disk(tmp_path, monkeypatch):
+    from Main_Window import Epic_Installs
+    manifests = tmp_path / 'Manifests'
+    write_item(manifests, 'a.item', item('Sugar', "Hades", r'C:\Hades'))
+    cache_path = str(tmp_path / 'Cache' / 'epic_manifests.json')
+    monkeypatch.setattr(Epic_Installs, 'manifest_cache', {})
+    monkeypatch.setattr(Epic_Installs, 'manifest_cache_path', None)
+    Epic_Installs.use_manifest_cache(cache_path)
+    first = epic_install_records(str(manifests), 'Epic.exe', str(tmp_path / 'missing.dat'))
+
+    monkeypatch.setattr(Epic_Installs, 'manifest_cache', {})
+    assert Epic_Installs.use_manifest_cache(cache_path) == 1
+    monkeypatch.setattr(json, 'load', None) # Parsing any '.item' would raise
+    assert epic_install_records(str(manifests), 'Epic.exe', str(tmp_path / 'missing.dat')) == first
+
+def test_unreadable_manifest_cache_is_ignored(tmp_path, monkeypatch):
+    from Main_Window import Epic_Installs
+    cache_path = tmp_path / 'epic_manifests.json'
+    cache_path.write_text('[1, 2]')
+    monkeypatch.setattr(Epic_Installs, 'manifest_cache', {})
+    monkeypatch.setattr(Epic_Installs, 'manifest_cache_path', None)
+    assert Epic_Installs.use_manifest_cache(str(cache_path)) == 0
@@ -0,0 +1,25 @@
+# ----------------------------------
+#      File Name: test_game_library.py
+#           Date: 10/19/26
+#    Description: Tests of the play history kept by the game library.
+# -----------------------------------------------------------------------
+import json                                                         # For reading the saved history
+from Main_Window.Game_Library import Game_Library, Game_Record
+
+def library_with_game(play_history_path):
+    library = Game_Library(str(play_history_path))
+    library.add(Game_Record('steam:4000', 'Steam', {'name': "Garry's Mod"}))
+    return library
+
+def test_mark_played_saves_the_history(tmp_path):
+    path = tmp_path / 'play_history.json'
+    library = library_with_game(path)
+    library.mark_played('steam:4000', when=1000)
+    assert json.loads(path.read_text(encoding='utf-8')) == {'steam:4000': 1000}
+    assert library.records['steam:4000'].last_played == 1000
+
+def test_unwritable_history_does_not_stop_the_launch(tmp_path, caplog):
+    library = library_with_game(tmp_path / 'missing folder' / 'play_history.json')
+    library.mark_played('steam:4000', when=1000) # Must not raise, 'play_game' launches right after
+    assert library.records['steam:4000'].last_played == 1000
+    assert "Could not save play history" in caplog.text
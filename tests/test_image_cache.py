@@ -0,0 +1,31 @@
+# ----------------------------------
+#      File Name: test_image_cache.py
+#           Date: 10/19/26
+#    Description: Tests of the image cache's eviction counter. Tk can't draw here (no display), so the decoded tier
+#                 is filled the way 'get_photo' fills it, with a stand-in for the 'PhotoImage'.
+# -----------------------------------------------------------------------
+from PIL import Image                                               # For the tiles
+from Main_Window.Image_Cache import Image_Cache
+
+TILE = Image.new('RGB', (10, 10))
+TILE_BYTES = 10 * 10 * 4
+
+def decode(cache, key):
+    cache.decoded[key] = object()
+    cache.decoded_bytes += cache.decoded_size(cache.compressed.size(key))
+    cache.evict_to_budget(keep=key)
+
+def test_only_budget_evictions_are_counted():
+    evicted = []
+    cache = Image_Cache(budget_bytes=2 * TILE_BYTES, on_evict=evicted.append)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, TILE)
+        decode(cache, key)
+    assert cache.stats()['evictions'] == 1 # 'a', the least recently used
+    assert list(cache.decoded) == ['b', 'c']
+
+    cache.put('b', TILE) # Replaced
+    cache.discard('c')
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['decoded_bytes'] == 0
+    assert evicted == ['a', 'b', 'c'] # The dashboard still hears about every dropped 'PhotoImage'
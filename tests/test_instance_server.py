@@ -0,0 +1,50 @@
+# ----------------------------------
+#      File Name: test_instance_server.py
+#           Date: 10/19/26
+#    Description: Tests of the single instance server: commands reach 'on_message', unknown ones are rejected and a
+#                 client that sends nothing doesn't keep the others waiting.
+# -----------------------------------------------------------------------
+import sys                                                          # For skipping the Unix socket tests
+import time                                                         # For timing the idle client
+from multiprocessing.connection import Client                       # For the idle client
+import pytest                                                       # For the server fixture
+from Main_Window import Instance_Server as instance_server
+from Main_Window.Instance_Server import Instance_Server, send_to_running_instance, instance_address, instance_key_path
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="The named pipe is per user, not per folder")
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(instance_server, 'IDLE_TIMEOUT', 0.2)
+    messages = []
+    server = Instance_Server(str(tmp_path), messages.append)
+    assert server.start()
+    server.messages = messages
+    yield server
+    server.stop()
+
+def test_commands_reach_the_running_instance(server):
+    assert send_to_running_instance(server.current_dir, {'command': 'launch', 'game': "Hades"}) == {'ok': True}
+    assert server.messages == [{'command': 'launch', 'game': "Hades"}]
+
+def test_ping_is_answered_but_not_passed_on(server):
+    assert send_to_running_instance(server.current_dir, {'command': 'ping'}) == {'ok': True}
+    assert server.messages == []
+
+@pytest.mark.parametrize('message', [{'command': 'format_drive'}, {'game': "Hades"}, "show"])
+def test_unknown_commands_are_rejected(server, message):
+    reply = send_to_running_instance(server.current_dir, message)
+    assert reply['ok'] is False and "Unknown command" in reply['error']
+    assert server.messages == []
+
+def test_idle_client_is_dropped(server):
+    address, family = instance_address(server.current_dir)
+    with open(instance_key_path(server.current_dir), 'rb') as key_file:
+        authkey = key_file.read()
+    with Client(address, family=family, authkey=authkey) as idle:
+        start = time.monotonic()
+        assert send_to_running_instance(server.current_dir, {'command': 'show'}) == {'ok': True}
+        assert time.monotonic() - start < 1.5
+        with pytest.raises(EOFError):
+            idle.recv() # Closed by the server
+    assert server.messages == [{'command': 'show'}]
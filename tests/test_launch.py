@@ -0,0 +1,27 @@
+# ----------------------------------
+#      File Name: test_launch.py
+#           Date: 10/19/26
+#    Description: Tests of launching Epic games when the game or the Epic Games Launcher can't be started.
+# -----------------------------------------------------------------------
+from Main_Window import Class_Dependencies as class_dependencies
+from Main_Window.Class_Dependencies import launch_epic_game
+
+def test_missing_game_opens_the_epic_games_launcher(monkeypatch):
+    started = []
+
+    def popen(command):
+        if command == 'Game.exe':
+            raise FileNotFoundError(command)
+        started.append(command)
+
+    monkeypatch.setattr(class_dependencies.subprocess, 'Popen', popen)
+    assert launch_epic_game('Game.exe', "Hades", 'EpicGamesLauncher.exe') is False
+    assert started == ['EpicGamesLauncher.exe']
+
+def test_missing_epic_games_launcher_is_logged_not_raised(monkeypatch, caplog):
+    def popen(command):
+        raise FileNotFoundError(command)
+
+    monkeypatch.setattr(class_dependencies.subprocess, 'Popen', popen)
+    assert launch_epic_game('Game.exe', "Hades", 'EpicGamesLauncher.exe') is False
+    assert "Failed to open the Epic Games Launcher" in caplog.text
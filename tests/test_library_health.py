@@ -0,0 +1,33 @@
+# ----------------------------------
+#      File Name: test_library_health.py
+#           Date: 10/19/26
+#    Description: Tests of the library health check and of 'known', which answers from the cache without touching
+#                 the disk so the dashboard can be built before the check has run.
+# -----------------------------------------------------------------------
+import os                                                           # For interacting with the current operating sys
+from Main_Window.Game_Library import Game_Record
+from Main_Window.Library_Health import Library_Health
+
+def epic_record(tmp_path, name, installed=True):
+    install_dir = tmp_path / name
+    if installed:
+        install_dir.mkdir()
+        (install_dir / 'Game.exe').write_bytes(b'')
+    return Game_Record(f"epic:{name}", 'Epic Games', {'name': name, 'app_name': name, 'install_dir': str(install_dir),
+                                                       'executable': str(install_dir / 'Game.exe')})
+
+def test_known_answers_from_the_last_check(tmp_path):
+    records = [epic_record(tmp_path, 'Hades'), epic_record(tmp_path, 'Celeste', installed=False)]
+    cache_path = os.path.join(tmp_path, 'Cache', 'library_health.json')
+    health = Library_Health(cache_path)
+    assert health.known(records) == {} # Never checked
+    assert health.check(records) == {'epic:Celeste': "Install folder missing"}
+    assert Library_Health(cache_path).known(records) == {'epic:Celeste': "Install folder missing"} # From the cache file
+
+def test_known_does_not_touch_the_disk(tmp_path, monkeypatch):
+    records = [epic_record(tmp_path, 'Hades')]
+    health = Library_Health()
+    health.check(records)
+    os.remove(records[0].executable)
+    monkeypatch.setattr(os, 'stat', None) # Any file system call would raise
+    assert health.known(records) == {}
@@ -0,0 +1,68 @@
+# ----------------------------------
+#      File Name: test_library_index.py
+#           Date: 10/19/26
+#    Description: Tests of the memory mapped library index: a written index reads back, a damaged one is rejected
+#                 by 'load_library_index' instead of raising when its records are read.
+# -----------------------------------------------------------------------
+import struct                                                       # For damaging the index
+from types import SimpleNamespace                                   # For the config model
+import pytest                                                       # For the parametrized tests
+from Main_Window.Game_Library import Game_Library, Game_Record
+from Main_Window.Library_Index import (save_library_index, load_library_index, index_records, HEADER,
+                                       LAUNCHER_ENTRY, RECORD, STRING_FIELDS)
+
+def write_index(tmp_path):
+    library = Game_Library()
+    library.add(Game_Record('steam:4000', 'Steam', {'name': "Garry's Mod", 'app_id': '4000', 'size_on_disk': 10}))
+    library.add(Game_Record('epic:Sugar', 'Epic Games', {'name': "Hadès", 'app_name': 'Sugar'}))
+    config = SimpleNamespace(launchers={'Steam': SimpleNamespace(executable=r'C:\Steam\steam.exe')}, mtime=123)
+    index_path = tmp_path / 'Cache' / 'library_index.bin'
+    save_library_index(str(index_path), library, config)
+    return index_path
+
+def test_index_reads_back(tmp_path):
+    with load_library_index(str(write_index(tmp_path))) as view:
+        assert view.config_mtime == 123
+        assert view.launchers() == {'Steam': r'C:\Steam\steam.exe'}
+        assert sorted(record.name for record in index_records(view)) == ["Garry's Mod", "Hadès"]
+        assert [view.name(number) for number in view.ordered('size')] == ["Garry's Mod", "Hadès"]
+#
+# ------------------------------------------------------------------------------
+# Damage done to a written index: (offset in the file, new bytes), given the file and its string table offset.
+
+def record_offset(number):
+    return HEADER.size + LAUNCHER_ENTRY.size + number * RECORD.size
+
+def name_ref_offset(number):
+    return record_offset(number) + 4 + STRING_FIELDS.index('name') * 8
+
+def accented_name_offset(data, strings_offset):
+    return data.index("è".encode('utf-8'), strings_offset) - strings_offset
+
+DAMAGE = {
+    'string past the table': lambda data, strings: (name_ref_offset(0) + 4, struct.pack('<I', 10_000)),
+    'offset past the table': lambda data, strings: (name_ref_offset(0), struct.pack('<I', 10_000)),
+    'launcher name past the table': lambda data, strings: (HEADER.size, struct.pack('<I', 10_000)),
+    'string starts mid character': lambda data, strings: (
+        name_ref_offset(1), struct.pack('<II', accented_name_offset(data, strings) + 1, 1)),
+    'string ends mid character': lambda data, strings: (
+        name_ref_offset(1), struct.pack('<II', accented_name_offset(data, strings), 1)),
+    'invalid utf-8': lambda data, strings: (strings, b'\xff'),
+    'unknown launcher': lambda data, strings: (record_offset(0), b'\x09'),
+    'record number out of range': lambda data, strings: (strings - 4, struct.pack('<I', 7)),
+}
+
+@pytest.mark.parametrize('damage', DAMAGE)
+def test_damaged_index_is_rejected(tmp_path, damage):
+    index_path = write_index(tmp_path)
+    data = bytearray(index_path.read_bytes())
+    strings_offset = HEADER.unpack_from(data)[4]
+    offset, new_bytes = DAMAGE[damage](data, strings_offset)
+    data[offset:offset + len(new_bytes)] = new_bytes
+    index_path.write_bytes(data)
+    assert load_library_index(str(index_path)) is None
+
+def test_truncated_index_is_rejected(tmp_path):
+    index_path = write_index(tmp_path)
+    index_path.write_bytes(index_path.read_bytes()[:-3])
+    assert load_library_index(str(index_path)) is None
@@ -0,0 +1,46 @@
+# ----------------------------------
+#      File Name: test_search_index.py
+#           Date: 10/19/26
+#    Description: Tests of the library search: every query length matches anywhere in a title, and typing on
+#                 narrows the last result to what a fresh search would find.
+# -----------------------------------------------------------------------
+import pytest                                                       # For the parametrized tests
+from Main_Window.Search_Index import Search_Index
+
+TITLES = {'hades': "Hades", 'gmod': "Garry's Mod", 'celeste': "Celeste", 'dead': "Dead Cells", 'ac': "Ace Combat 7"}
+
+@pytest.fixture
+def index():
+    index = Search_Index()
+    for key, title in TITLES.items():
+        index.add(key, title)
+    return index
+
+@pytest.mark.parametrize('query, expected', [
+    ("", None),
+    ("h", {'hades'}),
+    ("ad", {'hades', 'dead'}), # Inside a word, not only at its start
+    ("s", {'hades', 'gmod', 'celeste', 'dead'}),
+    ("ce", {'celeste', 'dead', 'ac'}),
+    ("7", {'ac'}),
+    ("s m", {'gmod'}),
+    ("ades", {'hades'}),
+    ("garrys", {'gmod'}),
+    ("zz", set()),
+])
+def test_search_matches_anywhere_in_the_title(index, query, expected):
+    assert index.search(query) == expected
+
+def test_typing_on_narrows_like_a_fresh_search(index):
+    fresh = Search_Index()
+    for key, title in TITLES.items():
+        fresh.add(key, title)
+    for query in ("d", "de", "dea", "dead", "dead ", "dead c"):
+        fresh.last_query = None
+        assert index.search(query) == fresh.search(query), query
+
+def test_removed_games_are_not_found(index):
+    index.search("h")
+    index.remove('hades')
+    assert index.search("h") == set()
+    assert index.search("hades") == set()
@@ -0,0 +1,26 @@
+# ----------------------------------
+#      File Name: test_stall_watchdog.py
+#           Date: 10/19/26
+#    Description: Tests of 'Stall_Watchdog' that don't need a Tk main loop.
+# -----------------------------------------------------------------------
+import logging                                                      # For checking the logged warning
+import os                                                           # For interacting with the current operating sys
+from Main_Window.Stall_Watchdog import Stall_Watchdog
+
+# A stall log that can't be written is logged as a warning, it must not raise on the watchdog thread.
+def test_write_log_to_unwritable_path_logs_warning(tmp_path, caplog):
+    log_path = os.path.join(tmp_path, 'missing_folder', 'stalls.log')
+    watchdog = Stall_Watchdog(None, log_path)
+    with caplog.at_level(logging.WARNING, logger='Main_Window.Stall_Watchdog'):
+        watchdog.write_log("Main loop stalled for 600 ms\n")
+    assert not os.path.exists(log_path)
+    assert "could not write" in caplog.text
+
+def test_write_log_appends(tmp_path):
+    log_path = os.path.join(tmp_path, 'stalls.log')
+    watchdog = Stall_Watchdog(None, log_path)
+    watchdog.write_log("first\n")
+    watchdog.write_log("second\n")
+    with open(log_path, 'r', encoding='utf-8') as log_file:
+        lines = log_file.read().splitlines()
+    assert [line.split('] ', 1)[1] for line in lines] == ["first", "second"]
@@ -0,0 +1,192 @@
+# ----------------------------------
+#      File Name: test_steam_app_info.py
+#           Date: 10/19/26
+#    Description: Tests of the 'appinfo.vdf' reader against synthetic files of every supported version
+#                 (27, 28 and 29 with its string table), plus truncated and corrupt files and the fallback to
+#                 the appmanifests when the appinfo can't be used.
+# -----------------------------------------------------------------------
+import struct                                                       # For building the binary files
+import pytest                                                       # For the parametrized tests
+from Main_Window import Steam_App_Info
+from Main_Window.Steam_App_Info import (read_app_info, read_binary_kv, load_steam_app_info, KV_SECTION, KV_STRING,
+                                        KV_INT32, KV_WIDE_STRING, KV_UINT64, KV_END, ENTRY_HEADER_SIZE)
+from Main_Window.Class_Dependencies import get_steam_game_records
+
+MAGIC = {27: 0x07564427, 28: 0x07564428, 29: 0x07564429}
+
+GARRYS_MOD = {'appinfo': {'appid': (KV_INT32, 4000),
+                          'common': {'name': (KV_STRING, "Garry's Mod"), 'type': (KV_STRING, "Game"),
+                                     'library_assets': {'library_capsule': (KV_STRING, "en")},
+                                     'gameid': (KV_UINT64, 4000)},
+                          'config': {'installdir': (KV_STRING, "GarrysMod")}}}
+SDK = {'appinfo': {'common': {'name': (KV_STRING, "Source SDK"), 'type': (KV_STRING, "Tool")}}}
+#
+# ------------------------------------------------------------------------------
+# Builders of binary KeyValues and whole 'appinfo.vdf' files. 'strings' collects the keys for version 29.
+
+def encode_kv(node, strings=None):
+    data = b''
+    for key, value in node.items():
+        if isinstance(value, dict):
+            kind, payload = KV_SECTION, encode_kv(value, strings)
+        else:
+            kind, raw = value
+            if kind == KV_STRING:
+                payload = raw.encode('utf-8') + b'\0'
+            elif kind == KV_WIDE_STRING:
+                payload = raw.encode('utf-16-le') + b'\0\0'
+            elif kind == KV_INT32:
+                payload = struct.pack('<i', raw)
+            else:
+                payload = struct.pack('<Q', raw)
+        if strings is None:
+            encoded_key = key.encode('utf-8') + b'\0'
+        else:
+            if key not in strings:
+                strings.append(key)
+            encoded_key = struct.pack('<I', strings.index(key))
+        data += bytes([kind]) + encoded_key + payload
+    return data + bytes([KV_END])
+
+def build_appinfo(version, apps):
+    strings = [] if version >= 29 else None
+    entries = b''
+    for app_id, node in apps.items():
+        body = bytes(ENTRY_HEADER_SIZE[version]) + (node if isinstance(node, bytes) else encode_kv(node, strings))
+        entries += struct.pack('<II', app_id, len(body)) + body
+    entries += struct.pack('<I', 0) # End marker
+    if version < 29:
+        return struct.pack('<II', MAGIC[version], 1) + entries
+    header_size = 8 + 8
+    table = struct.pack('<I', len(strings)) + b''.join(string.encode('utf-8') + b'\0' for string in strings)
+    return struct.pack('<IIq', MAGIC[version], 1, header_size + len(entries)) + entries + table
+
+def write_steam(tmp_path, appinfo):
+    steam_folder = tmp_path / 'Steam'
+    (steam_folder / 'appcache').mkdir(parents=True)
+    (steam_folder / 'appcache' / 'appinfo.vdf').write_bytes(appinfo)
+    return str(steam_folder / 'steam.exe')
+
+@pytest.fixture(autouse=True)
+def clear_app_info_cache():
+    Steam_App_Info.app_info_cache.clear()
+#
+# ------------------------------------------------------------------------------
+# Every version
+
+@pytest.mark.parametrize('version', [27, 28, 29])
+def test_reads_every_version(tmp_path, version):
+    path = tmp_path / 'appinfo.vdf'
+    path.write_bytes(build_appinfo(version, {4000: GARRYS_MOD, 211: SDK}))
+    apps = read_app_info(str(path), {'4000', '211'})
+    assert apps['4000'] == {'name': "Garry's Mod", 'type': "Game", 'installdir': "GarrysMod",
+                            'assets': {'library_capsule': "en"}, 'assets_full': {}}
+    assert apps['211']['type'] == "Tool"
+
+@pytest.mark.parametrize('version', [27, 29])
+def test_skips_apps_not_asked_for(tmp_path, version):
+    path = tmp_path / 'appinfo.vdf'
+    path.write_bytes(build_appinfo(version, {211: SDK, 4000: GARRYS_MOD}))
+    assert list(read_app_info(str(path), {'4000'})) == ['4000']
+
+def test_version_29_keys_come_from_the_string_table(tmp_path):
+    data = build_appinfo(29, {4000: GARRYS_MOD})
+    (table_offset,) = struct.unpack_from('<q', data, 8)
+    (count,) = struct.unpack_from('<I', data, table_offset)
+    assert count == 10 # Every distinct key once
+    assert b'installdir\0' not in data[:table_offset] # Not inline
+    path = tmp_path / 'appinfo.vdf'
+    path.write_bytes(data)
+    assert read_app_info(str(path), {'4000'})['4000']['installdir'] == "GarrysMod"
+
+def test_wide_string_value():
+    data = encode_kv({'name': (KV_WIDE_STRING, "Ünïcode")})
+    assert read_binary_kv(data, 0) == ({'name': "Ünïcode"}, len(data))
+
+def test_unknown_version_is_rejected(tmp_path):
+    path = tmp_path / 'appinfo.vdf'
+    path.write_bytes(struct.pack('<II', 0x07564426, 1))
+    with pytest.raises(ValueError):
+        read_app_info(str(path), {'4000'})
+#
+# ------------------------------------------------------------------------------
+# Truncated and corrupt files
+
+def test_unterminated_wide_string_raises_instead_of_hanging():
+    data = bytes([KV_WIDE_STRING]) + b'name\0' + "abc".encode('utf-16-le') # No terminator, no end marker
+    with pytest.raises(ValueError):
+        read_binary_kv(data, 0)
+
+def test_reads_stop_at_the_entry_limit():
+    data = encode_kv({'name': (KV_STRING, "Garry's Mod")})
+    with pytest.raises(ValueError):
+        read_binary_kv(data, 0, limit=len(data) - 3) # The string and end marker lie past the limit
+
+def test_key_index_outside_the_string_table():
+    data = bytes([KV_STRING]) + struct.pack('<I', 5) + b'value\0' + bytes([KV_END])
+    with pytest.raises(ValueError):
+        read_binary_kv(data, 0, strings=['name'])
+
+@pytest.mark.parametrize('version', [27, 28, 29])
+def test_truncated_file_is_rejected(tmp_path, version):
+    data = build_appinfo(version, {4000: GARRYS_MOD})
+    path = tmp_path / 'appinfo.vdf'
+    path.write_bytes(data[:60] if version < 29 else data[:16] + data[16:60])
+    with pytest.raises((ValueError, struct.error)):
+        read_app_info(str(path), {'4000'})
+
+@pytest.mark.parametrize('version', [27, 29])
+def test_corrupt_entry_is_skipped(tmp_path, version):
+    corrupt = bytes([0x7F]) + b'garbage' # Unknown value type
+    wide = bytes([KV_WIDE_STRING]) + (b'name\0' if version < 29 else struct.pack('<I', 0)) + b'a\0b\0' # Unterminated
+    path = tmp_path / 'appinfo.vdf'
+    path.write_bytes(build_appinfo(version, {211: corrupt, 212: wide, 4000: GARRYS_MOD}))
+    apps = read_app_info(str(path), {'211', '212', '4000'})
+    assert list(apps) == ['4000'] # The entries after a corrupt one are still read
+
+@pytest.mark.parametrize('data', [
+    b'\x29\x44\x56\x07\x01\x00\x00\x00' + struct.pack('<q', 10_000), # String table offset past the end
+    b'\x29\x44\x56\x07\x01\x00\x00\x00' + struct.pack('<q', 16) + struct.pack('<I', 3) + b'a\0', # Short table
+    b'\x27\x44\x56\x07', # Header cut short
+])
+def test_corrupt_file_gives_no_app_info(tmp_path, data):
+    steam_executable = write_steam(tmp_path, data)
+    assert load_steam_app_info(steam_executable, ['4000']) == {}
+#
+# ------------------------------------------------------------------------------
+# Fallback to the appmanifests
+
+def write_manifest(folder, app_id, name, installdir):
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / f"appmanifest_{app_id}.acf").write_text(
+        f'"AppState"\n{{\n\t"appid"\t\t"{app_id}"\n\t"name"\t\t"{name}"\n\t"installdir"\t\t"{installdir}"\n}}\n',
+        encoding='utf-8')
+
+def test_truncated_appinfo_falls_back_to_the_manifests(tmp_path):
+    steam_executable = write_steam(tmp_path, build_appinfo(29, {4000: GARRYS_MOD})[:40])
+    steamapps = tmp_path / 'steamapps'
+    write_manifest(steamapps, 4000, "Garrys Mod (manifest)", "GarrysMod")
+    app_info = load_steam_app_info(steam_executable, ['4000'])
+    assert app_info == {}
+    records = get_steam_game_records(str(steamapps), app_info, steam_executable)
+    assert [record['name'] for record in records] == ["Garrys Mod manifest"]
+
+def test_corrupt_entry_falls_back_to_its_manifest(tmp_path):
+    steam_executable = write_steam(tmp_path, build_appinfo(28, {211: bytes([0x7F]), 4000: GARRYS_MOD}))
+    steamapps = tmp_path / 'steamapps'
+    write_manifest(steamapps, 4000, "Garrys Mod (manifest)", "GarrysMod")
+    write_manifest(steamapps, 211, "Source SDK (manifest)", "sourcesdk")
+    app_info = load_steam_app_info(steam_executable, ['4000', '211'])
+    records = get_steam_game_records(str(steamapps), app_info, steam_executable)
+    assert sorted(record['name'] for record in records) == ["Garrys Mod", "Source SDK manifest"]
+
+# Nodes of the wrong type (an int where a string or section belongs) are ignored, not raised on.
+def test_fields_of_the_wrong_type_fall_back_to_the_manifest(tmp_path):
+    odd = {'appinfo': {'common': {'name': (KV_INT32, 7), 'type': (KV_INT32, 1),
+                                  'library_assets_full': {'library_capsule': (KV_STRING, "en")}}}}
+    steam_executable = write_steam(tmp_path, build_appinfo(29, {4000: odd}))
+    steamapps = tmp_path / 'steamapps'
+    write_manifest(steamapps, 4000, "Garrys Mod (manifest)", "GarrysMod")
+    app_info = load_steam_app_info(steam_executable, ['4000'])
+    records = get_steam_game_records(str(steamapps), app_info, steam_executable)
+    assert [(record['name'], record['art_path']) for record in records] == [("Garrys Mod manifest", None)]
@@ -0,0 +1,94 @@
+# ----------------------------------
+#      File Name: test_tile_prefetcher.py
+#           Date: 10/19/26
+#    Description: Tests of the tile prefetcher: a tile whose art is missing isn't asked for again, one whose art
+#                 was only unavailable (rate limited, server error) is retried later.
+# -----------------------------------------------------------------------
+import threading                                                    # For waiting on the workers
+import time                                                         # For the retry delays
+import pytest                                                       # For the prefetcher fixture
+from Main_Window import Tile_Prefetcher as tile_prefetcher
+from Main_Window.Tile_Prefetcher import Tile_Prefetcher
+from Main_Window.Class_Dependencies import Art_Unavailable
+
+class Art:
+    def __init__(self, answers):
+        self.answers = answers # key -> list of answers, the last one repeats
+        self.calls = {}
+        self.prepared = {}
+        self.done = threading.Event()
+
+    def prepare(self, key):
+        count = self.calls[key] = self.calls.get(key, 0) + 1
+        answers = self.answers[key]
+        answer = answers[min(count, len(answers)) - 1]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    def on_prepared(self, key, data, size):
+        self.prepared[key] = data
+        self.done.set()
+
+@pytest.fixture
+def make_prefetcher():
+    prefetchers = []
+
+    def make(art):
+        prefetcher = Tile_Prefetcher(art.prepare, art.on_prepared, lambda key: key in art.prepared, workers=1)
+        prefetchers.append(prefetcher)
+        return prefetcher
+    yield make
+    for prefetcher in prefetchers:
+        prefetcher.stop()
+
+def wait_until(condition, seconds=2):
+    end = time.monotonic() + seconds
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+def test_unavailable_art_is_retried_after_retry_after(make_prefetcher):
+    art = Art({'a': [Art_Unavailable("HTTP 429", retry_after=0.05), Art_Unavailable("HTTP 503", retry_after=0.05),
+                     (b'tile', (300, 450))]})
+    prefetcher = make_prefetcher(art)
+    prefetcher.update_row('row', ['a'], 0, 1) # Nothing scrolls after this, the retries come by themselves
+    assert art.done.wait(2)
+    assert art.calls['a'] == 3
+    assert prefetcher.stats()['failed'] == 0 and prefetcher.stats()['retried'] == 2
+
+def test_missing_art_is_not_asked_for_again(make_prefetcher):
+    art = Art({'a': [None]})
+    prefetcher = make_prefetcher(art)
+    prefetcher.update_row('row', ['a'], 0, 1)
+    assert wait_until(lambda: prefetcher.stats()['failed'] == 1)
+    prefetcher.update_row('row', ['a'], 0, 1)
+    time.sleep(0.1)
+    assert art.calls['a'] == 1
+
+def test_unavailable_art_fails_after_the_last_retry(make_prefetcher, monkeypatch):
+    monkeypatch.setattr(tile_prefetcher, 'MAX_RETRIES', 2)
+    art = Art({'a': [Art_Unavailable("HTTP 503", retry_after=0.01)]})
+    prefetcher = make_prefetcher(art)
+    prefetcher.update_row('row', ['a'], 0, 1)
+    assert wait_until(lambda: prefetcher.stats()['failed'] == 1)
+    assert art.calls['a'] == 3
+
+def test_waiting_retry_is_not_queued_twice(make_prefetcher):
+    art = Art({'a': [Art_Unavailable("HTTP 429", retry_after=0.3), (b'tile', (300, 450))]})
+    prefetcher = make_prefetcher(art)
+    prefetcher.update_row('row', ['a'], 0, 1)
+    assert wait_until(lambda: prefetcher.stats()['retrying'] == 1)
+    prefetcher.update_row('row', ['a'], 0, 1) # Scrolling doesn't bring it forward
+    time.sleep(0.1)
+    assert art.calls['a'] == 1
+    assert art.done.wait(2)
+
+def test_waiting_on_resting_sources_is_not_a_retry(make_prefetcher, monkeypatch):
+    monkeypatch.setattr(tile_prefetcher, 'MAX_RETRIES', 1)
+    resting = Art_Unavailable("Resting", retry_after=0.01, resting=True)
+    art = Art({'a': [resting, resting, resting, (b'tile', (300, 450))]})
+    prefetcher = make_prefetcher(art)
+    prefetcher.update_row('row', ['a'], 0, 1)
+    assert art.done.wait(2)
+    assert art.calls['a'] == 4 and prefetcher.stats()['failed'] == 0